@@ -5,12 +5,14 @@ Requirements: pip install fastapi uvicorn sqlalchemy psycopg2-binary python-mult
 Run with: python digiassets.py
 """
 
-from fastapi import FastAPI, HTTPException, Depends, Form, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import FastAPI, HTTPException, Depends, Form, Request, Query
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from pydantic import BaseModel
 
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, ForeignKey, Text, func, inspect, Numeric, DECIMAL, MetaData, Table
+from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, ForeignKey, Text, func, inspect, Numeric, DECIMAL, MetaData, Table, event, tuple_
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session, relationship
 from datetime import datetime, timedelta
@@ -22,6 +24,9 @@ from pathlib import Path
 import json
 from decimal import Decimal
 import logging
+import time
+import itertools
+from contextvars import ContextVar
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -594,6 +599,42 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request accumulator for time spent inside database cursor calls
+_request_timing: ContextVar[Optional[dict]] = ContextVar("request_timing", default=None)
+
+@event.listens_for(engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+def _stop_query_timer(conn):
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+    timing = _request_timing.get()
+    if timing is not None:
+        timing["db"] += elapsed
+
+@event.listens_for(engine, "after_cursor_execute")
+def _record_query_time(conn, cursor, statement, parameters, context, executemany):
+    _stop_query_timer(conn)
+
+@event.listens_for(engine, "handle_error")
+def _record_failed_query_time(exception_context):
+    # after_cursor_execute does not fire for a statement that raised
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        _stop_query_timer(conn)
+
+@app.middleware("http")
+async def add_server_timing(request: Request, call_next):
+    """Report database vs application time for each request via Server-Timing"""
+    timing = {"db": 0.0}
+    _request_timing.set(timing)
+    started = time.perf_counter()
+    response = await call_next(request)
+    total_ms = (time.perf_counter() - started) * 1000
+    db_ms = timing["db"] * 1000
+    response.headers["Server-Timing"] = f"db;dur={db_ms:.1f}, app;dur={max(total_ms - db_ms, 0):.1f}"
+    return response
+
 # ============================
 # UTILITY FUNCTIONS
 # ============================
@@ -662,10 +703,13 @@ def get_current_user(request: Request, db: Session = Depends(get_db)) -> User:
     
     return user
 
+_transaction_seq = itertools.count()
+
 def generate_transaction_number() -> str:
     """Generate unique transaction number"""
     timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-    return f"TXN{timestamp}"
+    # Sequence suffix keeps numbers unique when several are issued in the same second
+    return f"TXN{timestamp}{next(_transaction_seq) % 1000:03d}"
 
 def generate_order_number() -> str:
     """Generate unique order number"""
@@ -682,6 +726,15 @@ def get_returnable_stock(item_id: int, db: Session) -> float:
     inventory_item = db.query(InventoryItem).filter(InventoryItem.item_master_id == item_id).first()
     return float(inventory_item.returnable_quantity) if inventory_item else 0.0
 
+def etag_json_response(request: Request, content) -> Response:
+    """Return content as JSON tagged with an ETag; 304 if the client copy is current"""
+    response = JSONResponse(jsonable_encoder(content))
+    etag = f'"{hashlib.sha256(response.body).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return response
+
 # ============================
 # Continue with the rest of the API routes and application code...
 # (The rest of the code remains the same as in the original file)
@@ -818,14 +871,8 @@ async def get_divisions(db: Session = Depends(get_db)):
         for div in divisions
     ]
 
-@app.get("/admin/divisions-with-departments")
-async def get_divisions_with_departments(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    if not current_user.is_admin:
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
+def list_divisions_with_departments(db: Session):
+    """Divisions with their department counts"""
     divisions = db.query(Division).all()
     result = []
     
@@ -842,31 +889,81 @@ async def get_divisions_with_departments(
     
     return result
 
-@app.post("/admin/divisions")
-async def create_division(
-    name: str = Form(...),
-    description: str = Form(""),
+@app.get("/admin/divisions-with-departments")
+async def get_divisions_with_departments(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
     
-    existing = db.query(Division).filter(Division.name == name).first()
+    return list_divisions_with_departments(db)
+
+class DivisionCreate(BaseModel):
+    name: str
+    description: str = ""
+
+class DivisionBatchCreate(BaseModel):
+    items: List[DivisionCreate]
+
+def add_division(payload: DivisionCreate, db: Session) -> Division:
+    """Validate and stage a new division; the caller commits"""
+    existing = db.query(Division).filter(Division.name == payload.name).first()
     if existing:
         raise HTTPException(status_code=400, detail="Division with this name already exists")
     
-    division = Division(name=name, description=description)
+    division = Division(name=payload.name, description=payload.description)
     db.add(division)
+    db.flush()
+    return division
+
+def run_batch(items, add):
+    """Apply add to each batch item, prefixing validation errors with the item's position"""
+    created = []
+    for index, item in enumerate(items):
+        try:
+            created.append(add(item))
+        except HTTPException as exc:
+            raise HTTPException(status_code=exc.status_code, detail=f"Item {index + 1}: {exc.detail}")
+    return created
+
+@app.post("/admin/divisions")
+async def create_division(
+    payload: DivisionCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    division = add_division(payload, db)
     db.commit()
     
     return {"message": "Division created successfully", "division_id": division.id}
 
+@app.post("/admin/divisions/batch")
+async def create_divisions_batch(
+    payload: DivisionBatchCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    # One transaction: any invalid item leaves the whole batch uncommitted
+    divisions = run_batch(payload.items, lambda item: add_division(item, db))
+    db.commit()
+    
+    return {
+        "message": f"{len(divisions)} division(s) created successfully",
+        "division_ids": [division.id for division in divisions]
+    }
+
 # Department Management API Routes
 @app.get("/departments")
-async def get_departments(db: Session = Depends(get_db)):
+async def get_departments(request: Request, db: Session = Depends(get_db)):
     departments = db.query(Department).all()
-    return [
+    return etag_json_response(request, [
         {
             "id": dept.id,
             "name": dept.name,
@@ -874,16 +971,10 @@ async def get_departments(db: Session = Depends(get_db)):
             "division": {"id": dept.division.id, "name": dept.division.name} if dept.division else None
         }
         for dept in departments
-    ]
+    ])
 
-@app.get("/admin/departments-with-users")
-async def get_departments_with_users(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    if not current_user.is_admin:
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
+def list_departments_with_users(db: Session):
+    """Departments with their user counts"""
     departments = db.query(Department).all()
     result = []
     
@@ -900,37 +991,73 @@ async def get_departments_with_users(
     
     return result
 
-@app.post("/admin/departments")
-async def create_department(
-    name: str = Form(...),
-    description: str = Form(""),
-    division_id: int = Form(...),
+@app.get("/admin/departments-with-users")
+async def get_departments_with_users(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
     
-    existing = db.query(Department).filter(Department.name == name).first()
+    return list_departments_with_users(db)
+
+class DepartmentCreate(BaseModel):
+    name: str
+    description: str = ""
+    division_id: int
+
+class DepartmentBatchCreate(BaseModel):
+    items: List[DepartmentCreate]
+
+def add_department(payload: DepartmentCreate, db: Session) -> Department:
+    """Validate and stage a new department; the caller commits"""
+    existing = db.query(Department).filter(Department.name == payload.name).first()
     if existing:
         raise HTTPException(status_code=400, detail="Department with this name already exists")
     
-    division = db.query(Division).filter(Division.id == division_id).first()
+    division = db.query(Division).filter(Division.id == payload.division_id).first()
     if not division:
         raise HTTPException(status_code=404, detail="Division not found")
     
-    department = Department(name=name, description=description, division_id=division_id)
+    department = Department(name=payload.name, description=payload.description, division_id=payload.division_id)
     db.add(department)
+    db.flush()
+    return department
+
+@app.post("/admin/departments")
+async def create_department(
+    payload: DepartmentCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    department = add_department(payload, db)
     db.commit()
     
     return {"message": "Department created successfully", "department_id": department.id}
 
-# User Management API Routes
-@app.get("/admin/users")
-async def get_all_users(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+@app.post("/admin/departments/batch")
+async def create_departments_batch(
+    payload: DepartmentBatchCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
     
+    departments = run_batch(payload.items, lambda item: add_department(item, db))
+    db.commit()
+    
+    return {
+        "message": f"{len(departments)} department(s) created successfully",
+        "department_ids": [department.id for department in departments]
+    }
+
+# User Management API Routes
+def list_all_users(db: Session):
+    """All users as shown in the admin users table"""
     users = db.query(User).all()
     return [
         {
@@ -946,6 +1073,25 @@ async def get_all_users(current_user: User = Depends(get_current_user), db: Sess
         for user in users
     ]
 
+@app.get("/admin/users")
+async def get_all_users(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    return list_all_users(db)
+
+@app.get("/admin/bootstrap")
+async def get_admin_bootstrap(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+    """Everything the admin tab renders, in one round trip"""
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    return {
+        "users": list_all_users(db),
+        "departments": list_departments_with_users(db),
+        "divisions": list_divisions_with_departments(db)
+    }
+
 @app.get("/users")
 async def get_users_for_selection(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     users = db.query(User).filter(User.is_active == True).all()
@@ -958,53 +1104,82 @@ async def get_users_for_selection(current_user: User = Depends(get_current_user)
         for user in users
     ]
 
-@app.post("/admin/users")
-async def create_user(
-    employee_id: str = Form(...),
-    name: str = Form(...),
-    email: str = Form(...),
-    password: str = Form(...),
-    department_id: int = Form(...),
-    is_admin: bool = Form(False),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    if not current_user.is_admin:
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
+class UserCreate(BaseModel):
+    employee_id: str
+    name: str
+    email: str
+    password: str
+    department_id: int
+    is_admin: bool = False
+
+class UserBatchCreate(BaseModel):
+    items: List[UserCreate]
+
+def add_user(payload: UserCreate, db: Session) -> User:
+    """Validate and stage a new user; the caller commits"""
     # Check if employee_id or email already exists
-    existing_emp = db.query(User).filter(User.employee_id == employee_id).first()
+    existing_emp = db.query(User).filter(User.employee_id == payload.employee_id).first()
     if existing_emp:
         raise HTTPException(status_code=400, detail="Employee ID already exists")
     
-    existing_email = db.query(User).filter(User.email == email).first()
+    existing_email = db.query(User).filter(User.email == payload.email).first()
     if existing_email:
         raise HTTPException(status_code=400, detail="Email already exists")
     
     # Check if department exists
-    department = db.query(Department).filter(Department.id == department_id).first()
+    department = db.query(Department).filter(Department.id == payload.department_id).first()
     if not department:
         raise HTTPException(status_code=404, detail="Department not found")
     
-    hashed_password = hash_password(password)
+    hashed_password = hash_password(payload.password)
     
     user = User(
-        employee_id=employee_id,
-        name=name,
-        email=email,
+        employee_id=payload.employee_id,
+        name=payload.name,
+        email=payload.email,
         password_hash=hashed_password,
-        department_id=department_id,
-        is_admin=is_admin
+        department_id=payload.department_id,
+        is_admin=payload.is_admin
     )
     
     db.add(user)
+    db.flush()
+    return user
+
+@app.post("/admin/users")
+async def create_user(
+    payload: UserCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    user = add_user(payload, db)
     db.commit()
     
     return {"message": "User created successfully", "user_id": user.id}
 
+@app.post("/admin/users/batch")
+async def create_users_batch(
+    payload: UserBatchCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    users = run_batch(payload.items, lambda item: add_user(item, db))
+    db.commit()
+    
+    return {
+        "message": f"{len(users)} user(s) created successfully",
+        "user_ids": [user.id for user in users]
+    }
+
 # Category Management API Routes
 @app.get("/categories")
-async def get_categories(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def get_categories(request: Request, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     categories = db.query(Category).filter(Category.is_active == True).all()
     
     def build_category_tree(parent_id=None):
@@ -1022,7 +1197,7 @@ async def get_categories(current_user: User = Depends(get_current_user), db: Ses
             result.append(cat_data)
         return result
     
-    return build_category_tree()
+    return etag_json_response(request, build_category_tree())
 
 @app.post("/categories")
 async def create_category(
@@ -1054,8 +1229,50 @@ async def create_category(
     return {"message": "Category created successfully", "category_id": category.id}
 
 
+def serialize_fulfillment_order(order: Order, db: Session) -> dict:
+    """Order with per-item stock, as shown in the fulfillment modal"""
+    return {
+        "id": order.id,
+        "order_number": order.order_number,
+        "customer_name": order.customer_name,
+        "customer_contact": order.customer_contact,
+        "order_date": order.order_date,
+        "expected_delivery_date": order.expected_delivery_date,
+        "order_status": order.order_status,
+        "total_amount": float(order.total_amount),
+        "notes": order.notes,
+        "order_items": [
+            {
+                "id": item.id,
+                "item_master_id": item.item_master_id,
+                "item_code": item.item_master.item_code,
+                "item_name": item.item_master.item_name,
+                "is_returnable": item.item_master.is_returnable,
+                "unit_of_measure": item.item_master.unit_of_measure,
+                "requested_quantity": float(item.requested_quantity),
+                "fulfilled_quantity": float(item.fulfilled_quantity),
+                "unit_price": float(item.unit_price),
+                "total_price": float(item.total_price),
+                "status": item.status,
+                "current_stock": get_current_stock(item.item_master_id, db),
+                "available_stock": get_available_stock(item.item_master_id, db)
+            }
+            for item in order.order_items
+        ],
+        "created_at": order.created_at
+    }
+
+def stock_update(inventory_item: InventoryItem) -> dict:
+    """Resulting stock levels, so the client can patch its item lists in place"""
+    return {
+        "item_id": inventory_item.item_master_id,
+        "new_stock": float(inventory_item.current_quantity),
+        "new_returnable_stock": float(inventory_item.returnable_quantity)
+    }
+
 @app.get("/orders/pending-fulfillment")
 async def get_pending_fulfillment_orders(
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -1064,59 +1281,32 @@ async def get_pending_fulfillment_orders(
         Order.order_status == 'PENDING'
     ).order_by(Order.created_at.desc()).all()
     
-    return [
-        {
-            "id": order.id,
-            "order_number": order.order_number,
-            "customer_name": order.customer_name,
-            "customer_contact": order.customer_contact,
-            "order_date": order.order_date,
-            "expected_delivery_date": order.expected_delivery_date,
-            "total_amount": float(order.total_amount),
-            "notes": order.notes,
-            "order_items": [
-                {
-                    "id": item.id,
-                    "item_master_id": item.item_master_id,
-                    "item_code": item.item_master.item_code,
-                    "item_name": item.item_master.item_name,
-                    "is_returnable": item.item_master.is_returnable,
-                    "unit_of_measure": item.item_master.unit_of_measure,
-                    "requested_quantity": float(item.requested_quantity),
-                    "fulfilled_quantity": float(item.fulfilled_quantity),
-                    "unit_price": float(item.unit_price),
-                    "total_price": float(item.total_price),
-                    "status": item.status,
-                    "current_stock": get_current_stock(item.item_master_id, db),
-                    "available_stock": get_available_stock(item.item_master_id, db)
-                }
-                for item in order.order_items
-            ],
-            "created_at": order.created_at
-        }
-        for order in orders
-    ]
+    return etag_json_response(request, [serialize_fulfillment_order(order, db) for order in orders])
+
+class OrderItemFulfill(BaseModel):
+    order_item_id: int
+    fulfill_quantity: float
+    extra_quantity: float = 0
+    expected_return_date: str = ""
+    remarks: str = ""
 
 @app.post("/orders/{order_id}/fulfill-item")
 async def fulfill_order_item(
     order_id: int,
-    order_item_id: int = Form(...),
-    fulfill_quantity: float = Form(...),
-    extra_quantity: float = Form(0),
-    expected_return_date: str = Form(""),
-    remarks: str = Form(""),
+    payload: OrderItemFulfill,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Fulfill a specific item in an order"""
     try:
-        # Validate order and order item
-        order = db.query(Order).filter(Order.id == order_id).first()
+        # Validate order and order item; the row lock serializes concurrent
+        # fulfillments of the same order so stock and status stay consistent
+        order = db.query(Order).filter(Order.id == order_id).with_for_update().first()
         if not order:
             raise HTTPException(status_code=404, detail="Order not found")
         
         order_item = db.query(OrderItem).filter(
-            OrderItem.id == order_item_id,
+            OrderItem.id == payload.order_item_id,
             OrderItem.order_id == order_id
         ).first()
         if not order_item:
@@ -1127,14 +1317,14 @@ async def fulfill_order_item(
         
         # Check if fulfill quantity is valid
         remaining_qty = order_item.requested_quantity - order_item.fulfilled_quantity
-        if fulfill_quantity > remaining_qty:
+        if payload.fulfill_quantity > remaining_qty:
             raise HTTPException(
                 status_code=400, 
-                detail=f"Fulfill quantity ({fulfill_quantity}) exceeds remaining quantity ({remaining_qty})"
+                detail=f"Fulfill quantity ({payload.fulfill_quantity}) exceeds remaining quantity ({remaining_qty})"
             )
         
         # Check stock availability
-        total_needed = fulfill_quantity + extra_quantity
+        total_needed = payload.fulfill_quantity + payload.extra_quantity
         available_stock = get_available_stock(order_item.item_master_id, db)
         
         if total_needed > available_stock:
@@ -1145,9 +1335,9 @@ async def fulfill_order_item(
         
         # Parse expected return date
         expected_return = None
-        if expected_return_date:
+        if payload.expected_return_date:
             try:
-                expected_return = datetime.strptime(expected_return_date, "%Y-%m-%d")
+                expected_return = datetime.strptime(payload.expected_return_date, "%Y-%m-%d")
             except ValueError:
                 pass
         
@@ -1159,12 +1349,12 @@ async def fulfill_order_item(
             transaction_type='OUT',
             transaction_sub_type='ORDER_FULFILLMENT',
             quantity=total_needed,
-            returnable_quantity=extra_quantity,
+            returnable_quantity=payload.extra_quantity,
             unit_cost=order_item.unit_price,
             total_cost=total_needed * order_item.unit_price,
             reference_number=order.order_number,
             vendor_customer=order.customer_name,
-            remarks=remarks or f"Order fulfillment for {order.order_number}",
+            remarks=payload.remarks or f"Order fulfillment for {order.order_number}",
             expected_return_date=expected_return,
             user_id=current_user.id,
             status='CONFIRMED'  # Auto-confirm fulfillment transactions
@@ -1180,15 +1370,15 @@ async def fulfill_order_item(
         
         if inventory_item:
             inventory_item.current_quantity -= total_needed
-            if extra_quantity > 0:
-                inventory_item.returnable_quantity += extra_quantity
+            if payload.extra_quantity > 0:
+                inventory_item.returnable_quantity += payload.extra_quantity
             inventory_item.available_quantity = inventory_item.current_quantity - inventory_item.reserved_quantity
             inventory_item.last_updated = datetime.utcnow()
         
         # Update order item
-        order_item.fulfilled_quantity += fulfill_quantity
-        if extra_quantity > 0:
-            order_item.returnable_quantity += extra_quantity
+        order_item.fulfilled_quantity += payload.fulfill_quantity
+        if payload.extra_quantity > 0:
+            order_item.returnable_quantity += payload.extra_quantity
         
         # Update order item status
         if order_item.fulfilled_quantity >= order_item.requested_quantity:
@@ -1211,11 +1401,17 @@ async def fulfill_order_item(
         
         db.commit()
         
+        # Return the updated order, stock and dashboard figures so the client
+        # does not have to fetch them again
         return {
             "message": "Order item fulfilled successfully",
             "transaction_id": transaction.id,
             "transaction_number": transaction.transaction_number,
-            "order_status": order.order_status
+            "order_status": order.order_status,
+            "updated_order": serialize_fulfillment_order(order, db),
+            "stock_updates": [stock_update(inventory_item)] if inventory_item else [],
+            "dashboard": compute_dashboard_stats(db),
+            "low_stock": list_low_stock_items(db)
         }
         
     except HTTPException:
@@ -1261,6 +1457,7 @@ async def bulk_fulfill_order(
         
         # Process fulfillment for each item
         fulfilled_items = []
+        stock_updates = []
         for order_item in order.order_items:
             remaining_qty = order_item.requested_quantity - order_item.fulfilled_quantity
             if remaining_qty > 0:
@@ -1294,6 +1491,7 @@ async def bulk_fulfill_order(
                     inventory_item.current_quantity -= remaining_qty
                     inventory_item.available_quantity = inventory_item.current_quantity - inventory_item.reserved_quantity
                     inventory_item.last_updated = datetime.utcnow()
+                    stock_updates.append(stock_update(inventory_item))
                 
                 # Update order item
                 order_item.fulfilled_quantity = order_item.requested_quantity
@@ -1314,7 +1512,10 @@ async def bulk_fulfill_order(
         return {
             "message": "Order fulfilled successfully",
             "fulfilled_items": fulfilled_items,
-            "order_status": order.order_status
+            "order_status": order.order_status,
+            "stock_updates": stock_updates,
+            "dashboard": compute_dashboard_stats(db),
+            "low_stock": list_low_stock_items(db)
         }
         
     except HTTPException:
@@ -1356,6 +1557,7 @@ async def delete_category(
 # Item Master Management API Routes
 @app.get("/items")
 async def get_items(
+    request: Request,
     category_id: Optional[int] = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -1367,7 +1569,7 @@ async def get_items(
     
     items = query.all()
     
-    return [
+    return etag_json_response(request, [
         {
             "id": item.id,
             "item_code": item.item_code,
@@ -1387,52 +1589,56 @@ async def get_items(
             "created_at": item.created_at
         }
         for item in items
-    ]
+    ])
+
+# Item and stock transaction forms are posted as JSON bodies
+class ItemCreate(BaseModel):
+    item_code: str
+    item_name: str
+    description: str = ""
+    category_id: int
+    unit_of_measure: str
+    min_stock_level: float = 0
+    max_stock_level: float = 0
+    standard_cost: float = 0
+    location: str = ""
+    manufacturer: str = ""
+    model_number: str = ""
+    specifications: str = ""
+    warranty_months: int = 0
+    is_returnable: bool = False
 
 @app.post("/items")
 async def create_item(
-    item_code: str = Form(...),
-    item_name: str = Form(...),
-    description: str = Form(""),
-    category_id: int = Form(...),
-    unit_of_measure: str = Form(...),
-    min_stock_level: float = Form(0),
-    max_stock_level: float = Form(0),
-    standard_cost: float = Form(0),
-    location: str = Form(""),
-    manufacturer: str = Form(""),
-    model_number: str = Form(""),
-    specifications: str = Form(""),
-    warranty_months: int = Form(0),
-    is_returnable: bool = Form(False),
+    payload: ItemCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     # Check if item code exists
-    existing = db.query(ItemMaster).filter(ItemMaster.item_code == item_code).first()
+    existing = db.query(ItemMaster).filter(ItemMaster.item_code == payload.item_code).first()
     if existing:
         raise HTTPException(status_code=400, detail="Item code already exists")
     
     # Check if category exists
-    category = db.query(Category).filter(Category.id == category_id).first()
+    category = db.query(Category).filter(Category.id == payload.category_id).first()
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
     
     item = ItemMaster(
-        item_code=item_code,
-        item_name=item_name,
-        description=description,
-        category_id=category_id,
-        unit_of_measure=unit_of_measure,
-        min_stock_level=min_stock_level,
-        max_stock_level=max_stock_level,
-        standard_cost=standard_cost,
-        location=location,
-        manufacturer=manufacturer,
-        model_number=model_number,
-        specifications=specifications,
-        warranty_months=warranty_months,
-        is_returnable=is_returnable,
+        item_code=payload.item_code,
+        item_name=payload.item_name,
+        description=payload.description,
+        category_id=payload.category_id,
+        unit_of_measure=payload.unit_of_measure,
+        min_stock_level=payload.min_stock_level,
+        max_stock_level=payload.max_stock_level,
+        standard_cost=payload.standard_cost,
+        location=payload.location,
+        manufacturer=payload.manufacturer,
+        model_number=payload.model_number,
+        specifications=payload.specifications,
+        warranty_months=payload.warranty_months,
+        is_returnable=payload.is_returnable,
         created_by=current_user.id,
         updated_by=current_user.id
     )
@@ -1650,9 +1856,12 @@ async def delete_order(
 # Inventory Transaction Routes
 @app.get("/inventory/transactions")
 async def get_inventory_transactions(
+    request: Request,
     item_id: Optional[int] = None,
     transaction_type: Optional[str] = None,
     status: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    after: Optional[int] = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -1665,9 +1874,22 @@ async def get_inventory_transactions(
     if status:
         query = query.filter(InventoryTransaction.status == status)
     
-    transactions = query.order_by(InventoryTransaction.created_at.desc()).all()
+    # Keyset pagination: "after" is the id of the last transaction the
+    # client already has, so the next page starts just past it
+    if after:
+        anchor = db.query(InventoryTransaction.created_at).filter(InventoryTransaction.id == after).scalar()
+        if anchor is not None:
+            query = query.filter(
+                tuple_(InventoryTransaction.created_at, InventoryTransaction.id) < tuple_(anchor, after)
+            )
+    
+    query = query.order_by(InventoryTransaction.created_at.desc(), InventoryTransaction.id.desc())
+    if limit:
+        query = query.limit(limit)
     
-    return [
+    transactions = query.all()
+    
+    return etag_json_response(request, [
         {
             "id": txn.id,
             "transaction_number": txn.transaction_number,
@@ -1697,51 +1919,54 @@ async def get_inventory_transactions(
             "created_at": txn.created_at
         }
         for txn in transactions
-    ]
+    ])
+
+class InventoryTransactionCreate(BaseModel):
+    item_master_id: int
+    transaction_type: str
+    transaction_sub_type: str
+    quantity: float
+    returnable_quantity: float = 0
+    unit_cost: float = 0
+    reference_number: str = ""
+    vendor_customer: str = ""
+    remarks: str = ""
+    expected_return_date: str = ""
 
 @app.post("/inventory/transactions")
 async def create_inventory_transaction(
-    item_master_id: int = Form(...),
-    transaction_type: str = Form(...),
-    transaction_sub_type: str = Form(...),
-    quantity: float = Form(...),
-    returnable_quantity: float = Form(0),
-    unit_cost: float = Form(0),
-    reference_number: str = Form(""),
-    vendor_customer: str = Form(""),
-    remarks: str = Form(""),
-    expected_return_date: str = Form(""),
+    payload: InventoryTransactionCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     # Validate item exists
-    item = db.query(ItemMaster).filter(ItemMaster.id == item_master_id).first()
+    item = db.query(ItemMaster).filter(ItemMaster.id == payload.item_master_id).first()
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
     
     # Parse expected return date
     expected_return = None
-    if expected_return_date:
+    if payload.expected_return_date:
         try:
-            expected_return = datetime.strptime(expected_return_date, "%Y-%m-%d")
+            expected_return = datetime.strptime(payload.expected_return_date, "%Y-%m-%d")
         except ValueError:
             pass
     
     # Calculate total cost
-    total_cost = quantity * unit_cost
+    total_cost = payload.quantity * payload.unit_cost
     
     transaction = InventoryTransaction(
         transaction_number=generate_transaction_number(),
-        item_master_id=item_master_id,
-        transaction_type=transaction_type,
-        transaction_sub_type=transaction_sub_type,
-        quantity=quantity,
-        returnable_quantity=returnable_quantity,
-        unit_cost=unit_cost,
+        item_master_id=payload.item_master_id,
+        transaction_type=payload.transaction_type,
+        transaction_sub_type=payload.transaction_sub_type,
+        quantity=payload.quantity,
+        returnable_quantity=payload.returnable_quantity,
+        unit_cost=payload.unit_cost,
         total_cost=total_cost,
-        reference_number=reference_number,
-        vendor_customer=vendor_customer,
-        remarks=remarks,
+        reference_number=payload.reference_number,
+        vendor_customer=payload.vendor_customer,
+        remarks=payload.remarks,
         expected_return_date=expected_return,
         user_id=current_user.id
     )
@@ -1749,7 +1974,11 @@ async def create_inventory_transaction(
     db.add(transaction)
     db.commit()
     
-    return {"message": "Transaction created successfully", "transaction_id": transaction.id}
+    return {
+        "message": "Transaction created successfully",
+        "transaction_id": transaction.id,
+        "dashboard": compute_dashboard_stats(db)
+    }
 
 @app.post("/inventory/transactions/{transaction_id}/confirm")
 async def confirm_inventory_transaction(
@@ -1802,14 +2031,26 @@ async def confirm_inventory_transaction(
     transaction.confirmed_at = datetime.utcnow()
     transaction.confirmed_by = current_user.id
     
+    # Resulting levels, so the client can patch its lists without reloading them
+    result = {
+        "message": "Transaction confirmed successfully",
+        "transaction_id": transaction.id,
+        "item_id": transaction.item_master_id,
+        "new_stock": float(inventory_item.current_quantity),
+        "new_returnable_stock": float(inventory_item.returnable_quantity),
+        "txn_status": transaction.status
+    }
+    
     db.commit()
     
-    return {"message": "Transaction confirmed successfully"}
+    result["dashboard"] = compute_dashboard_stats(db)
+    result["low_stock"] = list_low_stock_items(db)
+    return result
 
 # Dashboard API Routes
-@app.get("/dashboard/stats")
-async def get_dashboard_stats(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    stats = {
+def compute_dashboard_stats(db: Session) -> dict:
+    """Counts shown on the dashboard stat cards"""
+    return {
         "total_categories": db.query(Category).filter(Category.is_active == True).count(),
         "total_items": db.query(ItemMaster).filter(ItemMaster.is_active == True).count(),
         "total_transactions": db.query(InventoryTransaction).count(),
@@ -1818,7 +2059,8 @@ async def get_dashboard_stats(current_user: User = Depends(get_current_user), db
         "pending_orders": db.query(Order).filter(Order.order_status == 'PENDING').count(),
         "low_stock_items": db.query(ItemMaster).join(InventoryItem).filter(
             InventoryItem.current_quantity <= ItemMaster.min_stock_level,
-            ItemMaster.min_stock_level > 0
+            ItemMaster.min_stock_level > 0,
+            ItemMaster.is_active == True
         ).count(),
         "returnable_items": db.query(InventoryTransaction).filter(
             InventoryTransaction.returnable_quantity > 0,
@@ -1826,11 +2068,13 @@ async def get_dashboard_stats(current_user: User = Depends(get_current_user), db
             InventoryTransaction.transaction_type == 'OUT'
         ).count()
     }
-    
-    return stats
 
-@app.get("/dashboard/low-stock")
-async def get_low_stock_items(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+@app.get("/dashboard/stats")
+async def get_dashboard_stats(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+    return compute_dashboard_stats(db)
+
+def list_low_stock_items(db: Session):
+    """Active items at or below their minimum stock level"""
     items = db.query(ItemMaster).join(InventoryItem).filter(
         InventoryItem.current_quantity <= ItemMaster.min_stock_level,
         ItemMaster.min_stock_level > 0,
@@ -1849,9 +2093,14 @@ async def get_low_stock_items(current_user: User = Depends(get_current_user), db
         for item in items
     ]
 
+@app.get("/dashboard/low-stock")
+async def get_low_stock_items(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+    return list_low_stock_items(db)
+
 # Returnable Items Management
 @app.get("/inventory/returnable-items")
 async def get_returnable_items(
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -1890,19 +2139,22 @@ async def get_returnable_items(
                 "is_overdue": txn.expected_return_date and txn.expected_return_date < datetime.utcnow().date() if txn.expected_return_date else False
             })
     
-    return returnable_items
+    return etag_json_response(request, returnable_items)
+
+class ReturnCreate(BaseModel):
+    transaction_id: int
+    returned_quantity: float
+    condition: str
+    remarks: str = ""
 
 @app.post("/inventory/process-return")
 async def process_return(
-    transaction_id: int = Form(...),
-    returned_quantity: float = Form(...),
-    condition: str = Form(...),
-    remarks: str = Form(""),
+    payload: ReturnCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     # Get original transaction
-    original_txn = db.query(InventoryTransaction).filter(InventoryTransaction.id == transaction_id).first()
+    original_txn = db.query(InventoryTransaction).filter(InventoryTransaction.id == payload.transaction_id).first()
     if not original_txn:
         raise HTTPException(status_code=404, detail="Original transaction not found")
     
@@ -1913,7 +2165,7 @@ async def process_return(
         InventoryTransaction.status == 'CONFIRMED'
     ).scalar() or 0
     
-    if returned_quantity > (original_txn.returnable_quantity - returned_so_far):
+    if payload.returned_quantity > (original_txn.returnable_quantity - returned_so_far):
         raise HTTPException(status_code=400, detail="Return quantity exceeds outstanding returnable quantity")
     
     # Create return transaction
@@ -1923,12 +2175,12 @@ async def process_return(
         order_id=original_txn.order_id,
         transaction_type='IN',
         transaction_sub_type='CUSTOMER_RETURN',
-        quantity=returned_quantity,
+        quantity=payload.returned_quantity,
         unit_cost=original_txn.unit_cost,
-        total_cost=returned_quantity * original_txn.unit_cost,
+        total_cost=payload.returned_quantity * original_txn.unit_cost,
         reference_number=original_txn.transaction_number,
         vendor_customer=original_txn.vendor_customer,
-        remarks=f"Return - Condition: {condition}. {remarks}",
+        remarks=f"Return - Condition: {payload.condition}. {payload.remarks}",
         user_id=current_user.id,
         status='PENDING'
     )
@@ -1936,7 +2188,12 @@ async def process_return(
     db.add(return_transaction)
     db.commit()
     
-    return {"message": "Return processed successfully", "transaction_id": return_transaction.id}
+    # The return stays PENDING until confirmed, so only the dashboard counts move
+    return {
+        "message": "Return processed successfully",
+        "transaction_id": return_transaction.id,
+        "dashboard": compute_dashboard_stats(db)
+    }
 
 # Order Fulfillment Routes
 @app.post("/inventory/transactions/order-fulfillment")
@@ -2294,7 +2551,51 @@ async def get_frontend():
             .returnable-card { border-color: #f39c12; background: #fff8e1; }
             .overdue-card { border-color: #e74c3c; background: #ffebee; }
 
+            .category-row {
+                border: 1px solid #ddd;
+                border-radius: 8px;
+                padding: 15px;
+                margin-bottom: 10px;
+                background: white;
+            }
+            .card-actions { margin-top: 10px; }
+
+            .modal-wide { max-width: 800px; }
+            .modal-section { margin: 20px 0; }
+            .modal-actions { text-align: center; margin-top: 20px; }
+            .info-box { background: #f8f9fa; padding: 15px; border-radius: 8px; margin: 15px 0; }
+            .modal-body-grid { display: grid; grid-template-columns: 1fr 1fr; gap: 15px; }
+            .stock-issue-box {
+                background: #ffebee;
+                border: 1px solid #f44336;
+                padding: 15px;
+                border-radius: 8px;
+                margin: 15px 0;
+            }
+            .stock-issue-box h4 { color: #f44336; margin-top: 0; }
+            .note-box {
+                margin-top: 15px;
+                padding: 10px;
+                background: #fff3cd;
+                border: 1px solid #ffeaa7;
+                border-radius: 4px;
+            }
+            .remaining-cell { font-weight: bold; color: #e74c3c; }
+            .remaining-cell.ok { color: #27ae60; }
+            .returnable-tag { color: #f39c12; }
+            .no-stock-tag { color: #f44336; }
+            .complete-tag { color: #27ae60; }
+
             .hidden { display: none !important; }
+
+            .virtual-scroll { overflow: auto; position: relative; }
+            .virtual-table td { white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+            .virtual-table thead th { position: sticky; top: 0; z-index: 1; }
+            .virtual-spacer td { padding: 0; border: 0; }
+            .virtual-spacer:hover { background: none; }
+            .virtual-sentinel { height: 1px; }
+            .user-active { color: #27ae60; }
+            .user-inactive { color: #e74c3c; }
             .user-info { float: right; color: white; }
             .modal { 
                 position: fixed; 
@@ -2351,6 +2652,20 @@ async def get_frontend():
             .alert-success { background: #d4edda; color: #155724; border: 1px solid #c3e6cb; }
             .alert-error { background: #f8d7da; color: #721c24; border: 1px solid #f5c6cb; }
 
+            /* Toast notifications */
+            .toast-container {
+                position: fixed;
+                top: 70px;
+                right: 20px;
+                z-index: 9999;
+                max-width: 300px;
+            }
+            .toast-fade { animation: fadeOut 3s forwards; }
+            @keyframes fadeOut {
+                0%, 80% { opacity: 1; }
+                100% { opacity: 0; transform: translateY(-8px); }
+            }
+
             /* Loading spinner */
             .loading {
                 display: inline-block;
@@ -2380,6 +2695,9 @@ async def get_frontend():
             <span id="status-text">Checking...</span>
         </div>
 
+        <!-- Toast Notifications -->
+        <div id="toasts" class="toast-container"></div>
+
         <!-- Login Screen -->
         <div id="login-screen">
             <div class="login-background"></div>
@@ -2479,6 +2797,28 @@ async def get_frontend():
                         </select>
                     </div>
                     <div id="items-list" class="item-grid"></div>
+                    
+                    <!-- Item card skeleton; text slots are filled via textContent -->
+                    <template id="item-card-tpl">
+                        <div class="item-card">
+                            <h4>📦 <span class="code"></span> - <span class="name"></span></h4>
+                            <p><strong>Category:</strong> <span class="category"></span></p>
+                            <p><strong>Description:</strong> <span class="desc"></span></p>
+                            <p><strong>UOM:</strong> <span class="uom"></span></p>
+                            <p><strong>Current Stock:</strong> <span class="stock"></span></p>
+                            <p class="returnable-row"><strong>Returnable Stock:</strong> <span class="returnable-stock"></span></p>
+                            <p><strong>Min/Max Level:</strong> <span class="levels"></span></p>
+                            <p><strong>Standard Cost:</strong> <span class="cost"></span></p>
+                            <p><strong>Location:</strong> <span class="location"></span></p>
+                            <p><strong>Manufacturer:</strong> <span class="manufacturer"></span></p>
+                            <p><strong>Returnable:</strong> <span class="returnable"></span></p>
+                            <div style="margin-top: 10px;">
+                                <button class="btn btn-success" data-action="stockIn">📈 Stock In</button>
+                                <button class="btn btn-warning" data-action="stockOut">📉 Stock Out</button>
+                                <button class="btn btn-info" data-action="history">📜 History</button>
+                            </div>
+                        </div>
+                    </template>
                 </div>
 
                 <!-- Inventory Tab -->
@@ -2487,24 +2827,42 @@ async def get_frontend():
                     <div style="margin-bottom: 20px;">
                         <button class="btn btn-success" onclick="showStockInModal()">📈 Stock In</button>
                         <button class="btn btn-warning" onclick="showStockOutModal()">📉 Stock Out</button>
-                        <button class="btn btn-purple" onclick="showOrderFulfillmentModal()">📋 Order Fulfillment</button>
+                        <button class="btn btn-purple" onclick="openOrderFulfillment()">📋 Order Fulfillment</button>
                         <button class="btn btn-info" onclick="showStockAdjustModal()">⚖️ Stock Adjust</button>
                         <button class="btn" onclick="loadInventory()">🔄 Refresh</button>
                     </div>
                     <div id="inventory-list" class="item-grid"></div>
+                    
+                    <template id="inventory-card-tpl">
+                        <div class="item-card">
+                            <h4>📦 <span class="code"></span> - <span class="name"></span></h4>
+                            <p><strong>Category:</strong> <span class="category"></span></p>
+                            <p><strong>Current Stock:</strong> <span class="stock"></span></p>
+                            <p class="returnable-row"><strong>Returnable Stock:</strong> <span class="returnable-stock"></span></p>
+                            <p><strong>Min/Max Level:</strong> <span class="levels"></span></p>
+                            <p><strong>Location:</strong> <span class="location"></span></p>
+                            <p><strong>Returnable:</strong> <span class="returnable"></span></p>
+                            <div style="margin-top: 10px;">
+                                <button class="btn btn-success" data-action="stockIn">📈 Stock In</button>
+                                <button class="btn btn-warning" data-action="stockOut">📉 Stock Out</button>
+                                <button class="btn btn-info" data-action="adjust">⚖️ Adjust</button>
+                                <button class="btn" data-action="history">📜 History</button>
+                            </div>
+                        </div>
+                    </template>
                 </div>
 
                 <!-- Transactions Tab -->
                 <div id="transactions-tab" class="content-area hidden">
                     <h3>📜 Transaction History</h3>
                     <div style="margin-bottom: 20px;">
-                        <select id="transaction-type-filter" onchange="filterTransactions()">
+                        <select id="transaction-type-filter" onchange="filterTransactionsDebounced()">
                             <option value="">All Types</option>
                             <option value="IN">Stock In</option>
                             <option value="OUT">Stock Out</option>
                             <option value="ADJUST">Adjustments</option>
                         </select>
-                        <select id="transaction-status-filter" onchange="filterTransactions()">
+                        <select id="transaction-status-filter" onchange="filterTransactionsDebounced()">
                             <option value="">All Status</option>
                             <option value="PENDING">Pending</option>
                             <option value="CONFIRMED">Confirmed</option>
@@ -2522,6 +2880,23 @@ async def get_frontend():
                         <button class="btn" onclick="loadReturnableItems()">🔄 Refresh</button>
                     </div>
                     <div id="returnable-items-list"></div>
+                    
+                    <template id="returnable-card-tpl">
+                        <div class="returnable-card">
+                            <h4>🔄 <span class="code"></span> - <span class="name"></span></h4>
+                            <p><strong>Transaction:</strong> <span class="transaction"></span></p>
+                            <p><strong>Customer:</strong> <span class="customer"></span></p>
+                            <p><strong>Total Returnable:</strong> <span class="total"></span></p>
+                            <p><strong>Returned:</strong> <span class="returned"></span></p>
+                            <p><strong>Outstanding:</strong> <span class="outstanding"></span></p>
+                            <p><strong>Transaction Date:</strong> <span class="date"></span></p>
+                            <p><strong>Expected Return:</strong> <span class="expected"></span></p>
+                            <p class="overdue-row" style="color: #e74c3c; font-weight: bold;">⚠️ OVERDUE</p>
+                            <div style="margin-top: 10px;">
+                                <button class="btn btn-success" data-action="processReturn">✅ Process Return</button>
+                            </div>
+                        </div>
+                    </template>
                 </div>
 
                 <!-- Admin Panel -->
@@ -2740,21 +3115,48 @@ async def get_frontend():
             </div>
         </div>
 
-        <div id="add-user-modal" class="modal hidden">
+        <div id="process-return-modal" class="modal hidden">
             <div class="modal-content">
-                <span class="close" onclick="closeAddUserModal()">&times;</span>
-                <h3>Add New User</h3>
-                <form id="add-user-form">
+                <span class="close" onclick="closeProcessReturnModal()">&times;</span>
+                <h3>🔄 Process Return</h3>
+                <form id="process-return-form">
                     <div class="form-group">
-                        <label for="user-employee-id">Employee ID:</label>
-                        <input type="text" id="user-employee-id" required>
+                        <label for="return-quantity">Returned Quantity:</label>
+                        <input type="number" id="return-quantity" step="0.001" required>
                     </div>
                     <div class="form-group">
-                        <label for="user-name">Name:</label>
-                        <input type="text" id="user-name" required>
+                        <label for="return-condition">Condition:</label>
+                        <select id="return-condition" required>
+                            <option value="">Select Condition</option>
+                            <option value="GOOD">Good - Can be restocked</option>
+                            <option value="DAMAGED">Damaged - Needs repair</option>
+                            <option value="UNUSABLE">Unusable - Write off</option>
+                        </select>
                     </div>
                     <div class="form-group">
-                        <label for="user-email">Email:</label>
+                        <label for="return-remarks">Remarks:</label>
+                        <textarea id="return-remarks"></textarea>
+                    </div>
+                    <button type="submit" class="btn">Process Return</button>
+                </form>
+            </div>
+        </div>
+
+        <div id="add-user-modal" class="modal hidden">
+            <div class="modal-content">
+                <span class="close" onclick="closeAddUserModal()">&times;</span>
+                <h3>Add New User</h3>
+                <form id="add-user-form">
+                    <div class="form-group">
+                        <label for="user-employee-id">Employee ID:</label>
+                        <input type="text" id="user-employee-id" required>
+                    </div>
+                    <div class="form-group">
+                        <label for="user-name">Name:</label>
+                        <input type="text" id="user-name" required>
+                    </div>
+                    <div class="form-group">
+                        <label for="user-email">Email:</label>
                         <input type="email" id="user-email" required>
                     </div>
                     <div class="form-group">
@@ -2774,6 +3176,16 @@ async def get_frontend():
                     </div>
                     <button type="submit" class="btn">Add User</button>
                 </form>
+                <details style="margin-top: 15px;">
+                    <summary>Add several at once</summary>
+                    <form data-bulk="users">
+                        <div class="form-group">
+                            <label for="bulk-users">One user per line: employee ID, name, email, password, department name, and optionally "admin"</label>
+                            <textarea id="bulk-users" rows="5" required></textarea>
+                        </div>
+                        <button type="submit" class="btn">Add All</button>
+                    </form>
+                </details>
             </div>
         </div>
 
@@ -2798,6 +3210,16 @@ async def get_frontend():
                     </div>
                     <button type="submit" class="btn">Add Department</button>
                 </form>
+                <details style="margin-top: 15px;">
+                    <summary>Add several at once</summary>
+                    <form data-bulk="departments">
+                        <div class="form-group">
+                            <label for="bulk-departments">One department per line: name, division name, description</label>
+                            <textarea id="bulk-departments" rows="5" required></textarea>
+                        </div>
+                        <button type="submit" class="btn">Add All</button>
+                    </form>
+                </details>
             </div>
         </div>
 
@@ -2816,10 +3238,120 @@ async def get_frontend():
                     </div>
                     <button type="submit" class="btn">Add Division</button>
                 </form>
+                <details style="margin-top: 15px;">
+                    <summary>Add several at once</summary>
+                    <form data-bulk="divisions">
+                        <div class="form-group">
+                            <label for="bulk-divisions">One division per line: name, description</label>
+                            <textarea id="bulk-divisions" rows="5" required></textarea>
+                        </div>
+                        <button type="submit" class="btn">Add All</button>
+                    </form>
+                </details>
             </div>
         </div>
 
-        <script>
+        <!-- Confirmation dialog for showConfirmModal; list entries are added via textContent -->
+        <template id="confirm-modal-tpl">
+            <div class="modal">
+                <div class="modal-content">
+                    <span class="close" data-answer="no">&times;</span>
+                    <h3 class="title"></h3>
+                    <p class="intro"></p>
+                    <ul class="lines"></ul>
+                    <div style="text-align: center;">
+                        <button class="btn btn-success" data-answer="yes">✅ Confirm</button>
+                        <button class="btn" data-answer="no">Cancel</button>
+                    </div>
+                </div>
+            </div>
+        </template>
+
+        <!-- Fulfillment modal skeletons, cloned on open; text slots are filled via textContent -->
+        <template id="order-fulfill-modal-tpl">
+            <div class="modal">
+                <div class="modal-content" style="max-width: 1000px;">
+                    <span class="close" onclick="this.closest('.modal').remove()">&times;</span>
+                    <h3>📋 Order Fulfillment</h3>
+                    <div style="margin: 20px 0;">
+                        <label for="fulfillment-order-select">Select Order:</label>
+                        <select id="fulfillment-order-select" style="width: 100%; padding: 10px; margin-top: 5px;" onchange="loadOrderForFulfillment(this.value)">
+                            <option value="">Select an order...</option>
+                        </select>
+                    </div>
+                    <div id="order-fulfillment-details" style="display: none;">
+                        <div id="order-info"></div>
+                        <h4>Order Items</h4>
+                        <div id="fulfillment-items" style="margin-top: 10px;"></div>
+                        <div style="margin-top: 20px; text-align: center;">
+                            <button class="btn btn-success" onclick="bulkFulfillOrder()">✅ Fulfill Entire Order</button>
+                            <button class="btn" onclick="this.closest('.modal').remove()">Cancel</button>
+                        </div>
+                    </div>
+                </div>
+            </div>
+        </template>
+
+        <template id="item-fulfill-modal-tpl">
+            <div class="modal">
+                <div class="modal-content">
+                    <span class="close" onclick="this.closest('.modal').remove()">&times;</span>
+                    <h3>📦 Fulfill Item: <span class="code"></span></h3>
+                    <div style="background: #f8f9fa; padding: 15px; border-radius: 8px; margin: 15px 0;">
+                        <p><strong>Item:</strong> <span class="name"></span></p>
+                        <p><strong>Remaining to Fulfill:</strong> <span class="remaining"></span></p>
+                        <p><strong>Available Stock:</strong> <span class="available"></span></p>
+                        <p class="returnable-only"><strong>Type:</strong> <span style="color: #f39c12;">📦 Returnable Item</span></p>
+                    </div>
+                    
+                    <form id="item-fulfillment-form" data-role="item-fulfill">
+                        <div class="form-group">
+                            <label for="fulfill-quantity">Fulfill Quantity (<span class="uom"></span>):</label>
+                            <input type="number" id="fulfill-quantity" step="0.001" min="0.001" required>
+                            <small>Maximum: <span class="remaining"></span></small>
+                        </div>
+                        
+                        <div class="form-group returnable-only">
+                            <label for="extra-quantity">Extra Quantity - Returnable (<span class="uom"></span>):</label>
+                            <input type="number" id="extra-quantity" step="0.001" min="0" value="0">
+                            <small>Additional quantity that customer can return later (Max: <span class="extra-max"></span>)</small>
+                        </div>
+                        
+                        <div class="form-group returnable-only">
+                            <label for="expected-return-date">Expected Return Date:</label>
+                            <input type="date" id="expected-return-date">
+                        </div>
+                        
+                        <div class="form-group">
+                            <label for="fulfillment-remarks">Remarks:</label>
+                            <textarea id="fulfillment-remarks" placeholder="Optional remarks for this fulfillment"></textarea>
+                        </div>
+                        
+                        <div style="text-align: center;">
+                            <button type="submit" class="btn btn-success">✅ Fulfill Item</button>
+                            <button type="button" class="btn" onclick="this.closest('.modal').remove()">Cancel</button>
+                        </div>
+                    </form>
+                </div>
+            </div>
+        </template>
+
+        <link rel="modulepreload" href="{fulfillment_js_url}">
+        <script src="{app_js_url}" defer></script>
+    </body>
+    </html>
+    """
+    html_content = html_content.replace("{app_js_url}", script_url("app")).replace(
+        "{fulfillment_js_url}", script_url("fulfillment"))
+    return HTMLResponse(content=html_content)
+
+# ============================
+# FRONTEND SCRIPT
+# ============================
+
+# Served as a separate, content-addressed file so browsers keep it (and V8 its
+# code cache) across page loads; a new build changes the URL
+APP_JS = """
             // Global variables
             let currentUser = null;
             let allCategories = [];
@@ -2829,6 +3361,30 @@ async def get_frontend():
             let allReturnableItems = [];
             let databaseStatus = null;
             
+            // Snapshot of /items shared by the item pickers; refreshed whenever
+            // the item list is reloaded and invalidated after stock changes
+            const ITEMS_CACHE_TTL = 30000;
+            let _itemsCache = { t: 0, data: null, optionsHtml: '' };
+            // Lookup indexes over the same snapshot: id -> item, category id -> items
+            let itemsById = new Map();
+            let itemsByCategory = new Map();
+            
+            // Static page nodes touched on every navigation, looked up once.
+            // The script runs at the end of <body>, so they all exist here.
+            const TAB_NAMES = ['dashboard', 'orders', 'categories', 'items', 'inventory', 'transactions', 'returnable', 'admin'];
+            const EL = {};
+            for (const id of [
+                'dashboard-stats', 'low-stock-items', 'orders-list', 'database-status', 'status-text',
+                'admin-nav-tab', 'main-app', 'login-screen', 'user-name', 'order-status-filter',
+                'items-list', 'inventory-list', 'categories-list', 'transactions-list', 'returnable-items-list',
+                'transaction-type-filter', 'transaction-status-filter',
+                'users-list', 'departments-list', 'divisions-list',
+                ...TAB_NAMES.map(tab => tab + '-tab')
+            ]) {
+                EL[id.replace(/-([a-z])/g, (_, c) => c.toUpperCase())] = document.getElementById(id);
+            }
+            EL.mainNavTabs = document.querySelectorAll('.container > .nav-tabs .nav-tab');
+            
             // ============================
             // DATABASE STATUS MONITORING
             // ============================
@@ -2839,8 +3395,8 @@ async def get_frontend():
                     const status = await response.json();
                     databaseStatus = status;
                     
-                    const statusElement = document.getElementById('database-status');
-                    const statusText = document.getElementById('status-text');
+                    const statusElement = EL.databaseStatus;
+                    const statusText = EL.statusText;
                     
                     if (status.status === 'healthy') {
                         statusElement.className = 'status-indicator status-healthy';
@@ -2854,8 +3410,8 @@ async def get_frontend():
                     }
                     
                 } catch (error) {
-                    const statusElement = document.getElementById('database-status');
-                    const statusText = document.getElementById('status-text');
+                    const statusElement = EL.databaseStatus;
+                    const statusText = EL.statusText;
                     statusElement.className = 'status-indicator status-error';
                     statusText.textContent = '❌ Connection Error';
                 }
@@ -2889,14 +3445,66 @@ async def get_frontend():
                 document.body.appendChild(modal);
             }
             
-            // Check database status every 30 seconds
-            setInterval(checkDatabaseStatus, 30000);
-            checkDatabaseStatus();
+            // Check database status every 30 seconds, backing off while the
+            // endpoint is slow so polling doesn't pile onto a struggling server
+            const DB_STATUS_POLL_MS = 30000;
+            const DB_STATUS_POLL_MAX_MS = 300000;
+            const DB_STATUS_SLOW_MS = 500;
+            let dbStatusPollMs = DB_STATUS_POLL_MS;
+            
+            async function pollDatabaseStatus() {
+                const started = performance.now();
+                await checkDatabaseStatus();
+                const elapsed = performance.now() - started;
+                dbStatusPollMs = elapsed > DB_STATUS_SLOW_MS
+                    ? Math.min(dbStatusPollMs * 2, DB_STATUS_POLL_MAX_MS)
+                    : DB_STATUS_POLL_MS;
+                setTimeout(pollDatabaseStatus, dbStatusPollMs);
+            }
+            pollDatabaseStatus();
+            
+            // Split slow responses into server time (from the Server-Timing
+            // header) and everything else, so network/queueing delays show up
+            const TIMED_ENDPOINTS = ['/orders', '/dashboard/', '/api/database-status'];
+            const SLOW_NETWORK_MS = 300;
+            
+            if (window.PerformanceObserver && (PerformanceObserver.supportedEntryTypes || []).includes('resource')) {
+                new PerformanceObserver(list => list.getEntries().forEach(entry => {
+                    const path = new URL(entry.name).pathname;
+                    if (!TIMED_ENDPOINTS.some(prefix => path.startsWith(prefix))) return;
+                    
+                    const serverMs = (entry.serverTiming || []).reduce((sum, t) => sum + t.duration, 0);
+                    if (entry.duration - serverMs > SLOW_NETWORK_MS) {
+                        console.warn('slow network', path, Math.round(entry.duration - serverMs), 'ms',
+                            (entry.serverTiming || []).map(t => `${t.name}=${Math.round(t.duration)}ms`).join(' '));
+                    }
+                })).observe({ type: 'resource', buffered: true });
+            }
             
             // ============================
             // API UTILITY FUNCTIONS
             // ============================
             
+            // Bodies above this size are decoded as they stream in rather than
+            // being buffered whole before JSON parsing
+            const LARGE_RESPONSE_BYTES = 1000000;
+
+            async function readJson(response) {
+                const length = Number(response.headers.get('Content-Length')) || 0;
+                if (length <= LARGE_RESPONSE_BYTES || !response.body || !window.TextDecoderStream) {
+                    return response.json();
+                }
+                
+                const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+                let text = '';
+                for (;;) {
+                    const { done, value } = await reader.read();
+                    if (done) break;
+                    text += value;
+                }
+                return JSON.parse(text);
+            }
+
             async function apiCall(endpoint, options = {}) {
                 try {
                     const response = await fetch(endpoint, {
@@ -2907,7 +3515,75 @@ async def get_frontend():
                         const error = await response.text();
                         throw new Error(error);
                     }
-                    return response.json();
+                    return await readJson(response);
+                } catch (error) {
+                    console.error('API call error:', error);
+                    throw error;
+                }
+            }
+
+            function postJson(endpoint, payload) {
+                return apiCall(endpoint, {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify(payload)
+                });
+            }
+
+            // Reference data is persisted in IndexedDB as {etag, ts, body} so
+            // lists paint from the last copy while the server revalidates it
+            const refDataDB = new Promise(resolve => {
+                try {
+                    const request = indexedDB.open('digiassets', 1);
+                    request.onupgradeneeded = () => request.result.createObjectStore('refdata');
+                    request.onsuccess = () => resolve(request.result);
+                    request.onerror = () => resolve(null);
+                } catch (error) {
+                    resolve(null);
+                }
+            });
+
+            async function idbRequest(mode, operation) {
+                const db = await refDataDB;
+                if (!db) return undefined;
+                return new Promise(resolve => {
+                    const request = operation(db.transaction('refdata', mode).objectStore('refdata'));
+                    request.onsuccess = () => resolve(request.result);
+                    request.onerror = () => resolve(undefined);
+                });
+            }
+
+            const idb = {
+                get: key => idbRequest('readonly', store => store.get(key)),
+                set: (key, value) => idbRequest('readwrite', store => store.put(value, key)),
+                clear: () => idbRequest('readwrite', store => store.clear())
+            };
+
+            async function cachedApiCall(endpoint, render) {
+                const cached = await idb.get(endpoint);
+                if (cached && render) render(cached.body);
+                
+                try {
+                    const response = await fetch(endpoint, {
+                        credentials: 'include',
+                        headers: cached?.etag ? { 'If-None-Match': cached.etag } : {}
+                    });
+                    if (response.status === 304) {
+                        return cached.body;
+                    }
+                    if (!response.ok) {
+                        const error = await response.text();
+                        throw new Error(error);
+                    }
+                    
+                    const body = await readJson(response);
+                    if (render) render(body);
+                    // A 200 with the tag we already hold means nothing changed
+                    const etag = response.headers.get('ETag');
+                    if (!cached || etag !== cached.etag) {
+                        idb.set(endpoint, { etag, ts: Date.now(), body });
+                    }
+                    return body;
                 } catch (error) {
                     console.error('API call error:', error);
                     throw error;
@@ -2916,21 +3592,229 @@ async def get_frontend():
 
             function showAlert(message, type = 'success') {
                 const alertDiv = document.createElement('div');
-                alertDiv.className = `alert alert-${type}`;
+                alertDiv.className = `alert alert-${type} toast-fade`;
                 alertDiv.textContent = message;
-                alertDiv.style.position = 'fixed';
-                alertDiv.style.top = '70px';
-                alertDiv.style.right = '20px';
-                alertDiv.style.zIndex = '9999';
-                alertDiv.style.maxWidth = '300px';
                 
-                document.body.appendChild(alertDiv);
+                // The fade animation drives removal, so bursts need no timers
+                alertDiv.addEventListener('animationend', () => alertDiv.remove());
+                document.getElementById('toasts').appendChild(alertDiv);
+            }
+
+            // Non-blocking replacement for confirm(): resolves true or false
+            // once the user answers, leaving the event loop free meanwhile
+            const CONFIRM_MODAL_TPL = document.getElementById('confirm-modal-tpl').content.firstElementChild;
+
+            function showConfirmModal(title, intro, lines = []) {
+                const modal = CONFIRM_MODAL_TPL.cloneNode(true);
+                fillSlots(modal, { title, intro });
+                modal.querySelector('.lines').append(...lines.map(line => {
+                    const li = document.createElement('li');
+                    li.textContent = line;
+                    return li;
+                }));
+                document.body.appendChild(modal);
+                
+                return new Promise(resolve => {
+                    modal.addEventListener('click', e => {
+                        const answer = e.target.closest('[data-answer]')?.dataset.answer;
+                        if (!answer) return;
+                        modal.remove();
+                        resolve(answer === 'yes');
+                    });
+                });
+            }
+
+            // Date columns repeat the same few values across many rows, so
+            // format each raw timestamp once with a shared formatter
+            const DATE_FORMAT = new Intl.DateTimeFormat();
+            const _dateFmt = new Map();
+
+            function fmtDate(value) {
+                let formatted = _dateFmt.get(value);
+                if (formatted === undefined) {
+                    formatted = DATE_FORMAT.format(new Date(value));
+                    _dateFmt.set(value, formatted);
+                }
+                return formatted;
+            }
+
+            const HTML_ESCAPES = Object.freeze({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' });
+
+            function escapeHtml(value) {
+                return value == null ? '' : String(value).replace(/[&<>"']/g, c => HTML_ESCAPES[c]);
+            }
+
+            // Escape the free-text fields of freshly loaded records once and keep
+            // the copies on record._safe for the innerHTML templates to read
+            function attachSafe(records, fields) {
+                for (const record of records) {
+                    const safe = {};
+                    for (const field of fields) safe[field] = escapeHtml(record[field]);
+                    record._safe = safe;
+                }
+                return records;
+            }
+
+            function yieldToBrowser() {
+                return new Promise(resolve => window.scheduler?.postTask ?
+                    scheduler.postTask(resolve, { priority: 'user-visible' }) : setTimeout(resolve, 0));
+            }
+
+            // Append rows a chunk at a time, yielding between chunks so long
+            // lists never block input; stops early once the signal aborts or
+            // the container is taken out of the page
+            async function renderInChunks(container, rows, renderRow, signal, chunkSize = 200) {
+                for (let i = 0; i < rows.length; i += chunkSize) {
+                    if (signal.aborted || (i > 0 && !container.isConnected)) return;
+                    container.insertAdjacentHTML('beforeend', rows.slice(i, i + chunkSize).map(renderRow).join(''));
+                    await yieldToBrowser();
+                }
+            }
+
+            function debounce(fn, wait) {
+                let timer = 0;
+                return (...args) => {
+                    clearTimeout(timer);
+                    timer = setTimeout(() => fn(...args), wait);
+                };
+            }
+
+            // One click listener per container instead of an inline handler per
+            // button: buttons carry data-action/data-id and the map dispatches
+            function delegateActions(container, actions) {
+                container.addEventListener('click', e => {
+                    const button = e.target.closest('button[data-action]');
+                    if (!button || !container.contains(button)) return;
+                    const handler = actions[button.dataset.action];
+                    if (handler) handler(Number(button.dataset.id), button.dataset);
+                });
+            }
+
+            // Windowed table: only the rows inside the scroll viewport (plus
+            // overscan) exist in the DOM, taken from a pool of reused <tr>s.
+            // Spacer rows above and below keep the scrollbar geometry of the
+            // full list. createRow builds an empty row; fillRow writes a
+            // record into it. Rows must render at a fixed rowHeight.
+            function createVirtualTable(container, { headers, rowHeight, createRow, fillRow, onEnd, viewportHeight = 600, overscan = 5 }) {
+                container.innerHTML = `
+                    <div class="virtual-scroll" style="max-height: ${viewportHeight}px;">
+                        <table class="virtual-table">
+                            <thead><tr>${headers.map(h => `<th>${h}</th>`).join('')}</tr></thead>
+                            <tbody>
+                                <tr class="virtual-spacer"><td colspan="${headers.length}"></td></tr>
+                                <tr class="virtual-spacer"><td colspan="${headers.length}"></td></tr>
+                            </tbody>
+                        </table>
+                        <p class="hidden" style="text-align: center; color: #666; padding: 40px;"></p>
+                        <div class="virtual-sentinel"></div>
+                    </div>
+                `;
+                const scroller = container.firstElementChild;
+                const table = scroller.querySelector('table');
+                const tbody = table.tBodies[0];
+                const [topSpacer, bottomSpacer] = tbody.rows;
+                const emptyMessage = scroller.querySelector('p');
+                const pool = [];
+                let rows = [];
+                let windowStart = -1;
+                let windowEnd = -1;
+                
+                function render(force) {
+                    // Fall back to the nominal height while the tab is hidden
+                    const height = scroller.clientHeight || viewportHeight;
+                    const start = Math.max(0, Math.floor(scroller.scrollTop / rowHeight) - overscan);
+                    const end = Math.min(rows.length, start + Math.ceil(height / rowHeight) + overscan * 2);
+                    if (!force && start === windowStart && end === windowEnd) return;
+                    windowStart = start;
+                    windowEnd = end;
+                    
+                    while (pool.length < end - start) {
+                        const tr = createRow();
+                        tr.style.height = rowHeight + 'px';
+                        tbody.insertBefore(tr, bottomSpacer);
+                        pool.push(tr);
+                    }
+                    for (let i = 0; i < pool.length; i++) {
+                        const inWindow = start + i < end;
+                        pool[i].hidden = !inWindow;
+                        if (inWindow) fillRow(pool[i], rows[start + i]);
+                    }
+                    topSpacer.firstElementChild.style.height = start * rowHeight + 'px';
+                    bottomSpacer.firstElementChild.style.height = (rows.length - end) * rowHeight + 'px';
+                }
                 
-                setTimeout(() => {
-                    alertDiv.remove();
-                }, 3000);
+                let frame = 0;
+                scroller.addEventListener('scroll', () => {
+                    if (frame) return;
+                    frame = requestAnimationFrame(() => {
+                        frame = 0;
+                        render(false);
+                    });
+                }, { passive: true });
+                
+                // Ask for more rows when the end of the list scrolls into view;
+                // re-observing afterwards fires again if it is still visible.
+                // onEnd returning false stops paging until resume() is called.
+                const sentinel = scroller.querySelector('.virtual-sentinel');
+                const observer = onEnd && new IntersectionObserver(async ([entry]) => {
+                    if (!entry.isIntersecting) return;
+                    observer.unobserve(sentinel);
+                    if (await onEnd()) observer.observe(sentinel);
+                }, { root: scroller });
+                observer?.observe(sentinel);
+                
+                return {
+                    resume() {
+                        if (!observer) return;
+                        observer.unobserve(sentinel);
+                        observer.observe(sentinel);
+                    },
+                    setRows(nextRows, emptyText = '', keepScroll = false) {
+                        rows = nextRows;
+                        table.classList.toggle('hidden', rows.length === 0);
+                        emptyMessage.classList.toggle('hidden', rows.length > 0);
+                        emptyMessage.textContent = emptyText;
+                        if (!keepScroll) scroller.scrollTop = 0;
+                        render(true);
+                    }
+                };
             }
 
+            const ITEM_ACTIONS = {
+                stockIn: id => stockInItem(id),
+                stockOut: id => stockOutItem(id),
+                adjust: id => stockAdjustItem(id),
+                history: id => viewItemHistory(id)
+            };
+            delegateActions(EL.itemsList, ITEM_ACTIONS);
+            delegateActions(EL.inventoryList, ITEM_ACTIONS);
+            delegateActions(EL.lowStockItems, ITEM_ACTIONS);
+            delegateActions(EL.categoriesList, {
+                delete: id => deleteCategory(id)
+            });
+            delegateActions(EL.ordersList, {
+                view: id => viewOrderDetails(id),
+                addItem: id => addOrderItem(id),
+                fulfill: id => fulfillOrder(id),
+                delete: (id, data) => deleteOrder(id, data.orderNumber)
+            });
+            delegateActions(EL.transactionsList, {
+                confirm: id => confirmTransaction(id),
+                view: id => viewTransactionDetails(id)
+            });
+            delegateActions(EL.returnableItemsList, {
+                processReturn: (id, data) => showProcessReturnModal(id, Number(data.outstanding))
+            });
+            delegateActions(EL.usersList, {
+                delete: id => deleteUser(id)
+            });
+            delegateActions(EL.departmentsList, {
+                delete: id => deleteDepartment(id)
+            });
+            delegateActions(EL.divisionsList, {
+                delete: id => deleteDivision(id)
+            });
+
             // ============================
             // AUTHENTICATION
             // ============================
@@ -2964,14 +3848,14 @@ async def get_frontend():
             });
 
             function showMainApp() {
-                document.getElementById('login-screen').classList.add('hidden');
-                document.getElementById('main-app').classList.remove('hidden');
-                document.getElementById('user-name').textContent = currentUser.name;
+                EL.loginScreen.classList.add('hidden');
+                EL.mainApp.classList.remove('hidden');
+                EL.userName.textContent = currentUser.name;
                 
                 if (currentUser.is_admin) {
-                    document.getElementById('admin-nav-tab').style.display = 'block';
+                    EL.adminNavTab.style.display = 'block';
                 } else {
-                    document.getElementById('admin-nav-tab').style.display = 'none';
+                    EL.adminNavTab.style.display = 'none';
                 }
                 
                 loadDashboard();
@@ -2981,7 +3865,7 @@ async def get_frontend():
                 fetch('/logout', {
                     method: 'POST',
                     credentials: 'include'
-                }).then(() => {
+                }).then(() => idb.clear()).then(() => {
                     location.reload();
                 });
             }
@@ -2990,25 +3874,44 @@ async def get_frontend():
             // NAVIGATION
             // ============================
 
+            // Admin and order fulfillment code lives in modules fetched the
+            // first time their screens open; import() reuses them afterwards
+            const MODULE_URLS = Object.freeze({
+                admin: '{admin_js_url}',
+                fulfillment: '{fulfillment_js_url}'
+            });
+
+            async function loadModule(name) {
+                try {
+                    return await import(MODULE_URLS[name]);
+                } catch (error) {
+                    showAlert(`Error loading the ${name} screen`, 'error');
+                    throw error;
+                }
+            }
+
+            async function openOrderFulfillment() {
+                const fulfillment = await loadModule('fulfillment');
+                fulfillment.showOrderFulfillmentModal();
+            }
+
             function switchTab(tabName) {
                 // Hide all tabs
-                const tabs = ['dashboard', 'orders', 'categories', 'items', 'inventory', 'transactions', 'returnable', 'admin'];
-                tabs.forEach(tab => {
-                    const element = document.getElementById(tab + '-tab');
+                TAB_NAMES.forEach(tab => {
+                    const element = EL[tab + 'Tab'];
                     if (element) {
                         element.classList.add('hidden');
                     }
                 });
                 
                 // Show target tab
-                const targetTab = document.getElementById(tabName + '-tab');
+                const targetTab = EL[tabName + 'Tab'];
                 if (targetTab) {
                     targetTab.classList.remove('hidden');
                 }
                 
                 // Update navigation
-                const navTabs = document.querySelectorAll('.container > .nav-tabs .nav-tab');
-                navTabs.forEach(tab => tab.classList.remove('active'));
+                EL.mainNavTabs.forEach(tab => tab.classList.remove('active'));
                 if (event?.target) {
                     event.target.classList.add('active');
                 }
@@ -3038,7 +3941,7 @@ async def get_frontend():
                         loadReturnableItems();
                         break;
                     case 'admin':
-                        loadUsers();
+                        loadModule('admin').then(admin => admin.loadUsers());
                         break;
                 }
             }
@@ -3061,17 +3964,19 @@ async def get_frontend():
                 adminNavTabs.forEach(tab => tab.classList.remove('active'));
                 if (event?.target) event.target.classList.add('active');
                 
-                switch(tabName) {
-                    case 'users':
-                        loadUsers();
-                        break;
-                    case 'departments':
-                        loadDepartments();
-                        break;
-                    case 'divisions':
-                        loadDivisions();
-                        break;
-                }
+                loadModule('admin').then(admin => {
+                    switch(tabName) {
+                        case 'users':
+                            admin.loadUsers();
+                            break;
+                        case 'departments':
+                            admin.loadDepartments();
+                            break;
+                        case 'divisions':
+                            admin.loadDivisions();
+                            break;
+                    }
+                });
             }
 
             // ============================
@@ -3092,7 +3997,7 @@ async def get_frontend():
             }
 
             function displayDashboardStats(stats) {
-                const container = document.getElementById('dashboard-stats');
+                const container = EL.dashboardStats;
                 container.innerHTML = `
                     <div class="stat-card" style="background: linear-gradient(135deg, #3498db, #2980b9);">
                         <h3>${stats.total_categories}</h3>
@@ -3130,21 +4035,22 @@ async def get_frontend():
             }
 
             function displayLowStockItems(items) {
-                const container = document.getElementById('low-stock-items');
+                const container = EL.lowStockItems;
                 
                 if (items.length === 0) {
                     container.innerHTML = '<p style="text-align: center; color: #27ae60; padding: 20px;">✅ All items are adequately stocked!</p>';
                     return;
                 }
                 
+                attachSafe(items, ['item_code', 'item_name']);
                 container.innerHTML = items.map(item => `
                     <div class="item-card low-stock">
-                        <h4>⚠️ ${item.item_code} - ${item.item_name}</h4>
-                        <p><strong>Category:</strong> ${item.category?.name || 'N/A'}</p>
+                        <h4>⚠️ ${item._safe.item_code} - ${item._safe.item_name}</h4>
+                        <p><strong>Category:</strong> ${escapeHtml(item.category?.name) || 'N/A'}</p>
                         <p><strong>Current Stock:</strong> ${item.current_stock}</p>
                         <p><strong>Min Level:</strong> ${item.min_stock_level}</p>
                         <div style="margin-top: 10px;">
-                            <button class="btn btn-success" onclick="stockInItem(${item.id})">📈 Stock In</button>
+                            <button class="btn btn-success" data-action="stockIn" data-id="${item.id}">📈 Stock In</button>
                         </div>
                     </div>
                 `).join('');
@@ -3156,7 +4062,7 @@ async def get_frontend():
 
             async function loadOrders() {
                 try {
-                    allOrders = await apiCall('/orders');
+                    allOrders = attachSafe(await apiCall('/orders'), ORDER_TEXT_FIELDS);
                     displayOrders();
                 } catch (error) {
                     console.error('Error loading orders:', error);
@@ -3164,78 +4070,76 @@ async def get_frontend():
                 }
             }
 
+            const ORDER_TEXT_FIELDS = ['order_number', 'customer_name', 'customer_contact', 'notes'];
+
+            // Card nodes from the last full render, keyed by order id, so
+            // filtering only flips visibility instead of rebuilding the list
+            let _orderNodes = new Map();
+            
+            function renderOrderCard(order) {
+                return `
+                <div class="order-card" data-order-id="${order.id}">
+                    <h4>📋 ${order._safe.order_number}</h4>
+                    <p><strong>Customer:</strong> ${order._safe.customer_name}</p>
+                    <p><strong>Contact:</strong> ${order._safe.customer_contact}</p>
+                    <p><strong>Order Date:</strong> ${fmtDate(order.order_date)}</p>
+                    <p><strong>Expected Delivery:</strong> ${order.expected_delivery_date ? fmtDate(order.expected_delivery_date) : 'Not specified'}</p>
+                    <p><strong>Status:</strong> <span class="status-${order.order_status.toLowerCase()}">${order.order_status}</span></p>
+                    <p><strong>Total Amount:</strong> ${order.total_amount}</p>
+                    <p><strong>Items:</strong> ${order.item_count}</p>
+                    <p><strong>Notes:</strong> ${order._safe.notes || 'None'}</p>
+                    <div style="margin-top: 10px;">
+                        <button class="btn btn-info" data-action="view" data-id="${order.id}">👁️ View Details</button>
+                        ${order.order_status === 'PENDING' ? `
+                            <button class="btn btn-success" data-action="addItem" data-id="${order.id}">➕ Add Item</button>
+                            <button class="btn btn-warning" data-action="fulfill" data-id="${order.id}">✅ Fulfill Order</button>
+                        ` : ''}
+                        ${(order.order_status === 'PENDING' || order.order_status === 'CANCELLED') ? `
+                            <button class="btn btn-danger" data-action="delete" data-id="${order.id}" data-order-number="${order._safe.order_number}">🗑️ Delete</button>
+                        ` : ''}
+                    </div>
+                </div>
+                `;
+            }
+
             function displayOrders() {
-                const container = document.getElementById('orders-list');
+                const container = EL.ordersList;
                 
                 if (allOrders.length === 0) {
+                    _orderNodes = new Map();
                     container.innerHTML = '<p style="text-align: center; color: #666; padding: 40px;">No orders found.</p>';
                     return;
                 }
                 
-                container.innerHTML = allOrders.map(order => `
-                    <div class="order-card">
-                        <h4>📋 ${order.order_number}</h4>
-                        <p><strong>Customer:</strong> ${order.customer_name}</p>
-                        <p><strong>Contact:</strong> ${order.customer_contact}</p>
-                        <p><strong>Order Date:</strong> ${new Date(order.order_date).toLocaleDateString()}</p>
-                        <p><strong>Expected Delivery:</strong> ${order.expected_delivery_date ? new Date(order.expected_delivery_date).toLocaleDateString() : 'Not specified'}</p>
-                        <p><strong>Status:</strong> <span class="status-${order.order_status.toLowerCase()}">${order.order_status}</span></p>
-                        <p><strong>Total Amount:</strong> ${order.total_amount}</p>
-                        <p><strong>Items:</strong> ${order.item_count}</p>
-                        <p><strong>Notes:</strong> ${order.notes || 'None'}</p>
-                        <div style="margin-top: 10px;">
-                            <button class="btn btn-info" onclick="viewOrderDetails(${order.id})">👁️ View Details</button>
-                            ${order.order_status === 'PENDING' ? `
-                                <button class="btn btn-success" onclick="addOrderItem(${order.id})">➕ Add Item</button>
-                                <button class="btn btn-warning" onclick="fulfillOrder(${order.id})">✅ Fulfill Order</button>
-                            ` : ''}
-                            ${(order.order_status === 'PENDING' || order.order_status === 'CANCELLED') ? `
-                                <button class="btn btn-danger" onclick="deleteOrder(${order.id}, '${order.order_number}')">🗑️ Delete</button>
-                            ` : ''}
-                        </div>
-                    </div>
-                `).join('');
+                container.innerHTML = allOrders.map(renderOrderCard).join('') +
+                    '<p id="orders-empty" class="hidden" style="text-align: center; color: #666; padding: 40px;">No orders found matching the filters.</p>';
+                
+                _orderNodes = new Map();
+                for (const card of container.querySelectorAll('.order-card')) {
+                    _orderNodes.set(+card.dataset.orderId, card);
+                }
+                filterOrders();
             }
 
             function filterOrders() {
-                const statusFilter = document.getElementById('order-status-filter').value;
+                const statusFilter = EL.orderStatusFilter.value;
+                const show = statusFilter ? order => order.order_status === statusFilter : () => true;
                 
-                let filteredOrders = allOrders;
-                
-                if (statusFilter) {
-                    filteredOrders = filteredOrders.filter(order => order.order_status === statusFilter);
+                let visible = 0;
+                for (const order of allOrders) {
+                    const card = _orderNodes.get(order.id);
+                    if (!card) continue;
+                    const shown = show(order);
+                    if (shown) visible++;
+                    if (card.classList.contains('hidden') === shown) {
+                        card.classList.toggle('hidden', !shown);
+                    }
                 }
                 
-                const container = document.getElementById('orders-list');
-                
-                if (filteredOrders.length === 0) {
-                    container.innerHTML = '<p style="text-align: center; color: #666; padding: 40px;">No orders found matching the filters.</p>';
-                    return;
+                const empty = document.getElementById('orders-empty');
+                if (empty) {
+                    empty.classList.toggle('hidden', visible > 0);
                 }
-                
-                container.innerHTML = filteredOrders.map(order => `
-                    <div class="order-card">
-                        <h4>📋 ${order.order_number}</h4>
-                        <p><strong>Customer:</strong> ${order.customer_name}</p>
-                        <p><strong>Contact:</strong> ${order.customer_contact}</p>
-                        <p><strong>Order Date:</strong> ${new Date(order.order_date).toLocaleDateString()}</p>
-                        <p><strong>Expected Delivery:</strong> ${order.expected_delivery_date ? new Date(order.expected_delivery_date).toLocaleDateString() : 'Not specified'}</p>
-                        <p><strong>Status:</strong> <span class="status-${order.order_status.toLowerCase()}">${order.order_status}</span></p>
-                        <p><strong>Total Amount:</strong> ${order.total_amount}</p>
-                        <p><strong>Items:</strong> ${order.item_count}</p>
-                        <p><strong>Notes:</strong> ${order.notes || 'None'}</p>
-                        <div style="margin-top: 10px;">
-                            <button class="btn btn-info" onclick="viewOrderDetails(${order.id})">👁️ View Details</button>
-                            ${order.order_status === 'PENDING' ? `
-                                <button class="btn btn-success" onclick="addOrderItem(${order.id})">➕ Add Item</button>
-                                <button class="btn btn-warning" onclick="fulfillOrder(${order.id})">✅ Fulfill Order</button>
-                            ` : ''}
-                            ${(order.order_status === 'PENDING' || order.order_status === 'CANCELLED') ? `
-                                <button class="btn btn-danger" onclick="deleteOrder(${order.id}, '${order.order_number}')">🗑️ Delete</button>
-                            ` : ''}
-                        </div>
-                    </div>
-                `).join('');
             }
 
             function showAddOrderModal() {
@@ -3282,8 +4186,8 @@ async def get_frontend():
 
 async function addOrderItem(orderId) {
     try {
-        // Load available items
-        const items = await apiCall('/items');
+        // Load available items (option markup is prebuilt with the cache)
+        const { optionsHtml } = await getCachedItems();
         
         const modal = document.createElement('div');
         modal.className = 'modal';
@@ -3294,16 +4198,8 @@ async function addOrderItem(orderId) {
                 <form id="add-order-item-form">
                     <div class="form-group">
                         <label for="order-item-select">Select Item:</label>
-                        <select id="order-item-select" required onchange="updateItemInfo()">
+                        <select id="order-item-select" required>
                             <option value="">Choose an item...</option>
-                            ${items.map(item => `
-                                <option value="${item.id}" 
-                                        data-cost="${item.standard_cost}" 
-                                        data-uom="${item.unit_of_measure}"
-                                        data-stock="${item.current_stock}">
-                                    ${item.item_code} - ${item.item_name} (Stock: ${item.current_stock} ${item.unit_of_measure})
-                                </option>
-                            `).join('')}
                         </select>
                     </div>
                     
@@ -3314,13 +4210,13 @@ async function addOrderItem(orderId) {
                     
                     <div class="form-group">
                         <label for="order-item-quantity">Quantity:</label>
-                        <input type="number" id="order-item-quantity" step="0.001" min="0.001" required onchange="calculateTotal()">
-                        <small id="quantity-warning" style="color: #e74c3c; display: none;"></small>
+                        <input type="number" id="order-item-quantity" step="0.001" min="0.001" required>
+                        <small id="quantity-warning" class="hidden" style="color: #e74c3c; display: block;"></small>
                     </div>
                     
                     <div class="form-group">
                         <label for="order-item-price">Unit Price ($):</label>
-                        <input type="number" id="order-item-price" step="0.01" min="0" required onchange="calculateTotal()">
+                        <input type="number" id="order-item-price" step="0.01" min="0" required>
                     </div>
                     
                     <div class="form-group">
@@ -3340,13 +4236,32 @@ async function addOrderItem(orderId) {
         
         document.body.appendChild(modal);
         
+        // Look up the form controls once; the handlers below close over them
+        const refs = {
+            modal,
+            qty: modal.querySelector('#order-item-quantity'),
+            price: modal.querySelector('#order-item-price'),
+            total: modal.querySelector('#total-price'),
+            sel: modal.querySelector('#order-item-select'),
+            warn: modal.querySelector('#quantity-warning'),
+            stock: modal.querySelector('#current-stock'),
+            uom: modal.querySelector('#item-uom'),
+            cost: modal.querySelector('#standard-cost'),
+            info: modal.querySelector('#item-info')
+        };
+        refs.sel.insertAdjacentHTML('beforeend', optionsHtml);
+        
         // Store order ID for form submission
         window.currentOrderId = orderId;
         
+        refs.sel.addEventListener('change', () => updateItemInfo(refs));
+        refs.qty.addEventListener('input', () => scheduleCalc(refs));
+        refs.price.addEventListener('input', () => scheduleCalc(refs));
+        
         // Add event listener for the form
-        document.getElementById('add-order-item-form').addEventListener('submit', async (e) => {
+        modal.querySelector('#add-order-item-form').addEventListener('submit', async (e) => {
             e.preventDefault();
-            await handleAddOrderItem();
+            await handleAddOrderItem(refs);
         });
         
     } catch (error) {
@@ -3354,52 +4269,58 @@ async function addOrderItem(orderId) {
     }
 }
 
-function updateItemInfo() {
-    const select = document.getElementById('order-item-select');
-    const selectedOption = select.options[select.selectedIndex];
-    const infoDiv = document.getElementById('item-info');
+function updateItemInfo(refs) {
+    const selectedOption = refs.sel.selectedOptions[0];
     
-    if (selectedOption.value) {
+    if (selectedOption && selectedOption.value) {
         const stock = selectedOption.dataset.stock;
         const cost = selectedOption.dataset.cost;
         const uom = selectedOption.dataset.uom;
         
-        document.getElementById('current-stock').textContent = stock;
-        document.getElementById('item-uom').textContent = uom;
-        document.getElementById('standard-cost').textContent = parseFloat(cost).toFixed(2);
-        document.getElementById('order-item-price').value = cost;
+        // Parsed once per selection so calculateTotal only reads it
+        refs.sel.dataset.selectedStock = String(parseFloat(stock));
+        
+        refs.stock.textContent = stock;
+        refs.uom.textContent = uom;
+        refs.cost.textContent = parseFloat(cost).toFixed(2);
+        refs.price.value = cost;
         
-        infoDiv.style.display = 'block';
-        calculateTotal();
+        refs.info.style.display = 'block';
+        calculateTotal(refs);
     } else {
-        infoDiv.style.display = 'none';
+        delete refs.sel.dataset.selectedStock;
+        refs.info.style.display = 'none';
+        refs.warn.classList.add('hidden');
     }
 }
 
-function calculateTotal() {
-    const quantity = parseFloat(document.getElementById('order-item-quantity').value) || 0;
-    const price = parseFloat(document.getElementById('order-item-price').value) || 0;
+// Coalesce bursts of input events into at most one recalculation per frame
+function scheduleCalc(refs) {
+    if (refs.rafHandle) return;
+    refs.rafHandle = requestAnimationFrame(() => {
+        refs.rafHandle = 0;
+        calculateTotal(refs);
+    });
+}
+
+function calculateTotal(refs) {
+    const quantity = parseFloat(refs.qty.value) || 0;
+    const price = parseFloat(refs.price.value) || 0;
     const total = quantity * price;
     
-    document.getElementById('total-price').textContent = total.toFixed(2);
+    refs.total.textContent = total.toFixed(2);
     
     // Check stock availability
-    const select = document.getElementById('order-item-select');
-    const selectedOption = select.options[select.selectedIndex];
-    const warning = document.getElementById('quantity-warning');
-    
-    if (selectedOption.value) {
-        const stock = parseFloat(selectedOption.dataset.stock);
+    if (refs.sel.dataset.selectedStock !== undefined) {
+        const stock = +refs.sel.dataset.selectedStock;
         if (quantity > stock) {
-            warning.textContent = `⚠️ Requested quantity (${quantity}) exceeds available stock (${stock})`;
-            warning.style.display = 'block';
-        } else {
-            warning.style.display = 'none';
+            refs.warn.textContent = `⚠️ Requested quantity (${quantity}) exceeds available stock (${stock})`;
         }
+        refs.warn.classList.toggle('hidden', quantity <= stock);
     }
 }
 
-async function handleAddOrderItem() {
+async function handleAddOrderItem(refs) {
     const orderId = window.currentOrderId;
     
     if (!orderId) {
@@ -3408,9 +4329,9 @@ async function handleAddOrderItem() {
     }
     
     const formData = new FormData();
-    formData.append('item_master_id', document.getElementById('order-item-select').value);
-    formData.append('requested_quantity', document.getElementById('order-item-quantity').value);
-    formData.append('unit_price', document.getElementById('order-item-price').value);
+    formData.append('item_master_id', refs.sel.value);
+    formData.append('requested_quantity', refs.qty.value);
+    formData.append('unit_price', refs.price.value);
     
     try {
         const response = await fetch(`/orders/${orderId}/items`, {
@@ -3423,7 +4344,7 @@ async function handleAddOrderItem() {
             showAlert('Item added to order successfully!', 'success');
             
             // Close modal
-            document.querySelector('.modal').remove();
+            refs.modal.remove();
             
             // Refresh orders list
             await loadOrders();
@@ -3460,64 +4381,70 @@ async function fulfillOrder(orderId) {
         let stockIssues = [];
         let canFulfillAll = true;
         
-        // Get current items with stock info
-        const allItems = await apiCall('/items');
+        // Revalidate the item snapshot (cheap when unchanged) so the stock
+        // checks below run against current levels via itemsById
+        refreshItemsCache(await cachedApiCall('/items'));
         
         for (const orderItem of order.order_items) {
             const remainingQty = orderItem.requested_quantity - orderItem.fulfilled_quantity;
             if (remainingQty > 0) {
                 // Find current stock for this item
-                const itemStock = allItems.find(i => i.id === orderItem.item.id);
+                const currentStock = itemsById.get(orderItem.item.id)?.current_stock;
                 
-                if (!itemStock || itemStock.current_stock < remainingQty) {
+                if (currentStock === undefined || currentStock < remainingQty) {
                     stockIssues.push({
                         item_code: orderItem.item.item_code,
                         item_name: orderItem.item.item_name,
                         needed: remainingQty,
-                        available: itemStock ? itemStock.current_stock : 0
+                        available: currentStock ?? 0
                     });
                     canFulfillAll = false;
                 }
             }
         }
         
-        // Show fulfillment modal
-        const modal = document.createElement('div');
-        modal.className = 'modal';
-        modal.innerHTML = `
-            <div class="modal-content" style="max-width: 800px;">
-                <span class="close" onclick="this.closest('.modal').remove()">&times;</span>
-                <h3>✅ Fulfill Order: ${order.order_number}</h3>
+        const issueByCode = new Map(stockIssues.map(issue => [issue.item_code, issue]));
+        
+        // Assemble the markup in one array and join once, so per-row strings
+        // aren't re-copied into ever larger template results
+        const parts = [];
+        parts.push(`
+            <div class="modal-content modal-wide">
+                <span class="close" onclick="closeFulfillModal()">&times;</span>
+                <h3>✅ Fulfill Order: ${escapeHtml(order.order_number)}</h3>
                 
-                <div style="background: #f8f9fa; padding: 15px; border-radius: 8px; margin: 15px 0;">
+                <div class="info-box">
                     <h4>Order Details</h4>
-                    <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 15px;">
+                    <div class="modal-body-grid">
                         <div>
-                            <p><strong>Customer:</strong> ${order.customer_name}</p>
-                            <p><strong>Contact:</strong> ${order.customer_contact}</p>
+                            <p><strong>Customer:</strong> ${escapeHtml(order.customer_name)}</p>
+                            <p><strong>Contact:</strong> ${escapeHtml(order.customer_contact)}</p>
                         </div>
                         <div>
-                            <p><strong>Order Date:</strong> ${new Date(order.order_date).toLocaleDateString()}</p>
+                            <p><strong>Order Date:</strong> ${fmtDate(order.order_date)}</p>
                             <p><strong>Total Amount:</strong> $${order.total_amount}</p>
                         </div>
                     </div>
                 </div>
-                
-                ${stockIssues.length > 0 ? `
-                    <div style="background: #ffebee; border: 1px solid #f44336; padding: 15px; border-radius: 8px; margin: 15px 0;">
-                        <h4 style="color: #f44336; margin-top: 0;">⚠️ Stock Issues</h4>
-                        <p>The following items have insufficient stock:</p>
-                        <ul>
-                            ${stockIssues.map(issue => `
-                                <li><strong>${issue.item_code}</strong>: Need ${issue.needed}, Available ${issue.available}</li>
-                            `).join('')}
-                        </ul>
-                    </div>
-                ` : ''}
-                
-                <div style="margin: 20px 0;">
+        `);
+        
+        if (stockIssues.length > 0) {
+            parts.push(`
+                <div class="stock-issue-box">
+                    <h4>⚠️ Stock Issues</h4>
+                    <p>The following items have insufficient stock:</p>
+                    <ul>
+            `);
+            for (const issue of stockIssues) {
+                parts.push(`<li><strong>${escapeHtml(issue.item_code)}</strong>: Need ${issue.needed}, Available ${issue.available}</li>`);
+            }
+            parts.push('</ul></div>');
+        }
+        
+        parts.push(`
+                <div class="modal-section">
                     <h4>Order Items</h4>
-                    <table style="width: 100%; margin-top: 10px;">
+                    <table>
                         <thead>
                             <tr>
                                 <th style="text-align: left;">Item</th>
@@ -3529,67 +4456,97 @@ async function fulfillOrder(orderId) {
                             </tr>
                         </thead>
                         <tbody>
-                            ${order.order_items.map(item => {
-                                const remainingQty = item.requested_quantity - item.fulfilled_quantity;
-                                const stockItem = stockIssues.find(si => si.item_code === item.item.item_code);
-                                const hasStock = !stockItem;
-                                
-                                return `
-                                    <tr>
-                                        <td>
-                                            <strong>${item.item.item_code}</strong><br>
-                                            ${item.item.item_name}
-                                            ${item.item.is_returnable ? '<br><small style="color: #f39c12;">📦 Returnable</small>' : ''}
-                                        </td>
-                                        <td>${item.requested_quantity}</td>
-                                        <td>${item.fulfilled_quantity}</td>
-                                        <td style="font-weight: bold; color: ${remainingQty > 0 ? '#e74c3c' : '#27ae60'};">
-                                            ${remainingQty}
-                                        </td>
-                                        <td><span class="status-${item.status.toLowerCase()}">${item.status}</span></td>
-                                        <td style="text-align: center;">
-                                            ${remainingQty > 0 ? 
-                                                (hasStock ? 
-                                                    `<input type="checkbox" id="fulfill-item-${item.id}" ${canFulfillAll ? 'checked' : ''}>` :
-                                                    '<span style="color: #f44336;">❌ No Stock</span>'
-                                                ) : 
-                                                '<span style="color: #27ae60;">✅ Complete</span>'
-                                            }
-                                        </td>
-                                    </tr>
-                                `;
-                            }).join('')}
+        `);
+        
+        for (const item of order.order_items) {
+            const remainingQty = item.requested_quantity - item.fulfilled_quantity;
+            const hasStock = !issueByCode.has(item.item.item_code);
+            
+            parts.push(`
+                <tr>
+                    <td>
+                        <strong>${escapeHtml(item.item.item_code)}</strong><br>
+                        ${escapeHtml(item.item.item_name)}
+                        ${item.item.is_returnable ? '<br><small class="returnable-tag">📦 Returnable</small>' : ''}
+                    </td>
+                    <td>${item.requested_quantity}</td>
+                    <td>${item.fulfilled_quantity}</td>
+                    <td class="remaining-cell${remainingQty > 0 ? '' : ' ok'}">
+                        ${remainingQty}
+                    </td>
+                    <td><span class="status-${item.status.toLowerCase()}">${escapeHtml(item.status)}</span></td>
+                    <td style="text-align: center;">
+                        ${remainingQty > 0 ? 
+                            (hasStock ? 
+                                `<input type="checkbox" class="fulfill-checkbox" data-item-id="${item.id}" ${canFulfillAll ? 'checked' : ''}>` :
+                                '<span class="no-stock-tag">❌ No Stock</span>'
+                            ) : 
+                            '<span class="complete-tag">✅ Complete</span>'
+                        }
+                    </td>
+                </tr>
+            `);
+        }
+        
+        parts.push(`
                         </tbody>
                     </table>
                 </div>
                 
-                <div style="text-align: center; margin-top: 20px;">
+                <div class="modal-actions">
                     ${canFulfillAll ? `
-                        <button class="btn btn-success" onclick="processBulkFulfillment(${orderId})">
+                        <button class="btn btn-success" data-action="fulfillAll" data-id="${orderId}">
                             ✅ Fulfill Entire Order
                         </button>
                     ` : ''}
-                    <button class="btn btn-info" onclick="processPartialFulfillment(${orderId})">
+                    <button class="btn btn-info" data-action="fulfillSelected" data-id="${orderId}">
                         📦 Fulfill Selected Items
                     </button>
-                    <button class="btn" onclick="this.closest('.modal').remove()">Cancel</button>
+                    <button class="btn" onclick="closeFulfillModal()">Cancel</button>
                 </div>
-                
-                ${!canFulfillAll ? `
-                    <div style="margin-top: 15px; padding: 10px; background: #fff3cd; border: 1px solid #ffeaa7; border-radius: 4px;">
-                        <small><strong>Note:</strong> Only items with sufficient stock can be fulfilled. You can fulfill available items now and complete the rest later when stock is replenished.</small>
-                    </div>
-                ` : ''}
-            </div>
-        `;
+        `);
+        
+        if (!canFulfillAll) {
+            parts.push(`
+                <div class="note-box">
+                    <small><strong>Note:</strong> Only items with sufficient stock can be fulfilled. You can fulfill available items now and complete the rest later when stock is replenished.</small>
+                </div>
+            `);
+        }
+        parts.push('</div>');
+        
+        // Show fulfillment modal
+        const modal = document.createElement('div');
+        modal.className = 'modal';
+        modal.innerHTML = parts.join('');
         
+        delegateActions(modal, {
+            fulfillAll: processBulkFulfillment,
+            fulfillSelected: processPartialFulfillment
+        });
         document.body.appendChild(modal);
         
+        // Keep a handle so the fulfill actions close this modal, not whichever
+        // .modal happens to come first in the document, and keep the order
+        // so "Fulfill Selected" doesn't fetch it again
+        window._fulfillModal = modal;
+        window._pendingFulfill = {
+            orderId,
+            order,
+            itemMap: new Map(order.order_items.map(item => [String(item.id), item]))
+        };
+        
     } catch (error) {
         showAlert('Error loading order for fulfillment: ' + error.message, 'error');
     }
 }
 
+function closeFulfillModal() {
+    window._fulfillModal?.remove();
+    window._fulfillModal = null;
+    window._pendingFulfill = null;
+}
+
 async function processBulkFulfillment(orderId) {
     const confirmed = confirm('Are you sure you want to fulfill the entire order? This will update inventory levels and cannot be easily undone.');
     
@@ -3606,9 +4563,9 @@ async function processBulkFulfillment(orderId) {
             showAlert(result.message, 'success');
             
             // Close modal and refresh
-            document.querySelector('.modal').remove();
-            await loadOrders();
-            await loadDashboard();
+            invalidateItemsCache();
+            closeFulfillModal();
+            await Promise.all([loadOrders(), loadDashboard()]);
             
         } else {
             const errorText = await response.text();
@@ -3620,16 +4577,15 @@ async function processBulkFulfillment(orderId) {
 }
 
 async function processPartialFulfillment(orderId) {
-    // Get selected items
-    const checkboxes = document.querySelectorAll('input[type="checkbox"][id^="fulfill-item-"]');
+    // Get selected items from the fulfill modal only
+    const checkboxes = window._fulfillModal ? window._fulfillModal.getElementsByClassName('fulfill-checkbox') : [];
     const selectedItems = [];
     
-    checkboxes.forEach(checkbox => {
-        if (checkbox.checked) {
-            const itemId = checkbox.id.replace('fulfill-item-', '');
-            selectedItems.push(itemId);
+    for (let i = 0; i < checkboxes.length; i++) {
+        if (checkboxes[i].checked) {
+            selectedItems.push(checkboxes[i].dataset.itemId);
         }
-    });
+    }
     
     if (selectedItems.length === 0) {
         showAlert('Please select at least one item to fulfill', 'warning');
@@ -3641,44 +4597,31 @@ async function processPartialFulfillment(orderId) {
     if (!confirmed) return;
     
     try {
-        // Process each selected item
-        let successCount = 0;
-        let errorCount = 0;
+        // Reuse the order loaded when the modal opened (fetching it only if
+        // that's gone) and fulfill the selected items concurrently
+        let itemMap = window._pendingFulfill?.orderId === orderId ? window._pendingFulfill.itemMap : null;
+        if (!itemMap) {
+            const order = await apiCall(`/orders/${orderId}`);
+            itemMap = new Map(order.order_items.map(item => [String(item.id), item]));
+        }
         
-        for (const itemId of selectedItems) {
-            try {
-                // Get order details to find the item
-                const order = await apiCall(`/orders/${orderId}`);
-                const orderItem = order.order_items.find(item => item.id == itemId);
-                
-                if (orderItem) {
-                    const remainingQty = orderItem.requested_quantity - orderItem.fulfilled_quantity;
-                    
-                    if (remainingQty > 0) {
-                        const formData = new FormData();
-                        formData.append('order_item_id', itemId);
-                        formData.append('fulfill_quantity', remainingQty);
-                        formData.append('extra_quantity', '0');
-                        formData.append('expected_return_date', '');
-                        formData.append('remarks', 'Partial order fulfillment');
-                        
-                        const response = await fetch(`/orders/${orderId}/fulfill-item`, {
-                            method: 'POST',
-                            credentials: 'include',
-                            body: formData
-                        });
-                        
-                        if (response.ok) {
-                            successCount++;
-                        } else {
-                            errorCount++;
-                        }
-                    }
-                }
-            } catch (error) {
-                errorCount++;
-            }
-        }
+        const jobs = selectedItems.map(itemId => {
+            const orderItem = itemMap.get(itemId);
+            if (!orderItem) return null;
+            
+            const remainingQty = orderItem.requested_quantity - orderItem.fulfilled_quantity;
+            if (remainingQty <= 0) return null;
+            
+            return postJson(`/orders/${orderId}/fulfill-item`, {
+                order_item_id: Number(itemId),
+                fulfill_quantity: remainingQty,
+                remarks: 'Partial order fulfillment'
+            });
+        }).filter(Boolean);
+        
+        const results = await Promise.allSettled(jobs);
+        const successCount = results.filter(r => r.status === 'fulfilled').length;
+        const errorCount = results.length - successCount;
         
         if (successCount > 0) {
             showAlert(`Successfully fulfilled ${successCount} item(s)${errorCount > 0 ? ` (${errorCount} failed)` : ''}`, 'success');
@@ -3687,9 +4630,9 @@ async function processPartialFulfillment(orderId) {
         }
         
         // Close modal and refresh
-        document.querySelector('.modal').remove();
-        await loadOrders();
-        await loadDashboard();
+        invalidateItemsCache();
+        closeFulfillModal();
+        await Promise.all([loadOrders(), loadDashboard()]);
         
     } catch (error) {
         showAlert('Error processing partial fulfillment: ' + error.message, 'error');
@@ -3712,8 +4655,7 @@ async function processPartialFulfillment(orderId) {
                     
                     if (response.ok) {
                         showAlert(`Order ${orderNumber} deleted successfully!`, 'success');
-                        await loadOrders();
-                        loadDashboard();
+                        await Promise.all([loadOrders(), loadDashboard()]);
                     } else {
                         const errorText = await response.text();
                         throw new Error(errorText);
@@ -3726,23 +4668,25 @@ async function processPartialFulfillment(orderId) {
 
             async function viewOrderDetails(orderId) {
                 try {
-                    const order = await apiCall(`/orders/${orderId}`);
+                    const [order] = attachSafe([await apiCall(`/orders/${orderId}`)], ORDER_TEXT_FIELDS);
                     
-                    let html = `
-                        <div style="max-width: 800px;">
-                            <h3>📋 Order Details: ${order.order_number}</h3>
-                            <div style="margin: 20px 0;">
-                                <p><strong>Customer:</strong> ${order.customer_name}</p>
-                                <p><strong>Contact:</strong> ${order.customer_contact}</p>
-                                <p><strong>Order Date:</strong> ${new Date(order.order_date).toLocaleDateString()}</p>
-                                <p><strong>Expected Delivery:</strong> ${order.expected_delivery_date ? new Date(order.expected_delivery_date).toLocaleDateString() : 'Not specified'}</p>
+                    const parts = [];
+                    parts.push(`
+                        <div class="modal-content">
+                        <div class="modal-wide">
+                            <h3>📋 Order Details: ${order._safe.order_number}</h3>
+                            <div class="modal-section">
+                                <p><strong>Customer:</strong> ${order._safe.customer_name}</p>
+                                <p><strong>Contact:</strong> ${order._safe.customer_contact}</p>
+                                <p><strong>Order Date:</strong> ${fmtDate(order.order_date)}</p>
+                                <p><strong>Expected Delivery:</strong> ${order.expected_delivery_date ? fmtDate(order.expected_delivery_date) : 'Not specified'}</p>
                                 <p><strong>Status:</strong> <span class="status-${order.order_status.toLowerCase()}">${order.order_status}</span></p>
                                 <p><strong>Total Amount:</strong> ${order.total_amount}</p>
-                                <p><strong>Notes:</strong> ${order.notes || 'None'}</p>
+                                <p><strong>Notes:</strong> ${order._safe.notes || 'None'}</p>
                             </div>
                             
                             <h4>Order Items:</h4>
-                            <table style="margin-top: 20px;">
+                            <table>
                                 <thead>
                                     <tr>
                                         <th>Item</th>
@@ -3755,12 +4699,12 @@ async function processPartialFulfillment(orderId) {
                                     </tr>
                                 </thead>
                                 <tbody>
-                    `;
+                    `);
                     
-                    order.order_items.forEach(item => {
-                        html += `
+                    for (const item of order.order_items) {
+                        parts.push(`
                             <tr>
-                                <td>${item.item.item_code} - ${item.item.item_name}</td>
+                                <td>${escapeHtml(item.item.item_code)} - ${escapeHtml(item.item.item_name)}</td>
                                 <td>${item.requested_quantity}</td>
                                 <td>${item.fulfilled_quantity}</td>
                                 <td>${item.returnable_quantity}</td>
@@ -3768,21 +4712,22 @@ async function processPartialFulfillment(orderId) {
                                 <td>${item.total_price}</td>
                                 <td><span class="status-${item.status.toLowerCase()}">${item.status}</span></td>
                             </tr>
-                        `;
-                    });
+                        `);
+                    }
                     
-                    html += `
+                    parts.push(`
                                 </tbody>
                             </table>
-                            <div style="text-align: center; margin-top: 20px;">
+                            <div class="modal-actions">
                                 <button class="btn" onclick="this.closest('.modal').remove()">Close</button>
                             </div>
                         </div>
-                    `;
+                        </div>
+                    `);
                     
                     const modal = document.createElement('div');
                     modal.className = 'modal';
-                    modal.innerHTML = `<div class="modal-content">${html}</div>`;
+                    modal.innerHTML = parts.join('');
                     document.body.appendChild(modal);
                     
                 } catch (error) {
@@ -3796,34 +4741,54 @@ async function processPartialFulfillment(orderId) {
 
             async function loadCategories() {
                 try {
-                    allCategories = await apiCall('/categories');
-                    displayCategories();
+                    allCategories = await cachedApiCall('/categories', categories => {
+                        allCategories = categories;
+                        displayCategories();
+                    });
                 } catch (error) {
                     console.error('Error loading categories:', error);
                     showAlert('Error loading categories', 'error');
                 }
             }
 
-            function displayCategories() {
-                const container = document.getElementById('categories-list');
-                
-                function renderCategoryTree(categories, level = 0) {
-                    return categories.map(category => `
-                        <div style="margin-left: ${level * 20}px; border: 1px solid #ddd; border-radius: 8px; padding: 15px; margin-bottom: 10px; background: white;">
-                            <h4>${'📁 '.repeat(level + 1)} ${category.name}</h4>
-                            <p>${category.description || 'No description'}</p>
-                            <p><strong>Created:</strong> ${new Date(category.created_at).toLocaleDateString()}</p>
-                            <div style="margin-top: 10px;">
-                                ${currentUser.is_admin ? `
-                                    <button class="btn btn-danger" onclick="deleteCategory(${category.id})">🗑️ Delete</button>
-                                ` : ''}
-                            </div>
-                            ${category.children && category.children.length > 0 ? renderCategoryTree(category.children, level + 1) : ''}
-                        </div>
-                    `).join('');
+            // Pre-order walk of the category tree with an explicit stack,
+            // yielding each node with its depth
+            function flattenCategories(categories) {
+                const flat = [];
+                const stack = [];
+                for (let i = categories.length - 1; i >= 0; i--) {
+                    stack.push({ category: categories[i], level: 0 });
                 }
                 
-                container.innerHTML = renderCategoryTree(allCategories);
+                while (stack.length > 0) {
+                    const entry = stack.pop();
+                    flat.push(entry);
+                    const children = entry.category.children || [];
+                    for (let i = children.length - 1; i >= 0; i--) {
+                        stack.push({ category: children[i], level: entry.level + 1 });
+                    }
+                }
+                return flat;
+            }
+
+            function renderCategoryRow({ category, level }) {
+                return `
+                    <div class="category-row" style="margin-left: ${level * 20}px;">
+                        <h4>${'📁 '.repeat(level + 1)} ${escapeHtml(category.name)}</h4>
+                        <p>${escapeHtml(category.description) || 'No description'}</p>
+                        <p><strong>Created:</strong> ${fmtDate(category.created_at)}</p>
+                        <div class="card-actions">
+                            ${currentUser.is_admin ? `
+                                <button class="btn btn-danger" data-action="delete" data-id="${category.id}">🗑️ Delete</button>
+                            ` : ''}
+                        </div>
+                    </div>
+                `;
+            }
+
+            function displayCategories() {
+                const container = EL.categoriesList;
+                container.innerHTML = flattenCategories(allCategories).map(renderCategoryRow).join('');
             }
 
             function showAddCategoryModal() {
@@ -3836,26 +4801,27 @@ async function processPartialFulfillment(orderId) {
                 document.getElementById('add-category-form').reset();
             }
 
+            // Flatten the category tree into indented <option>s, detached from
+            // the document so each select receives them in a single append
+            function buildCategoryOptions(categories) {
+                const fragment = document.createDocumentFragment();
+                
+                for (const { category, level } of flattenCategories(categories)) {
+                    const option = document.createElement('option');
+                    option.value = category.id;
+                    option.textContent = '  '.repeat(level) + category.name;
+                    fragment.appendChild(option);
+                }
+                return fragment;
+            }
+
             async function loadCategoriesForParentDropdown() {
                 try {
-                    const categories = await apiCall('/categories');
-                    const select = document.getElementById('parent-category');
-                    select.innerHTML = '<option value="">None (Root Category)</option>';
-                    
-                    function addCategoryOptions(cats, prefix = '') {
-                        cats.forEach(cat => {
-                            const option = document.createElement('option');
-                            option.value = cat.id;
-                            option.textContent = prefix + cat.name;
-                            select.appendChild(option);
-                            
-                            if (cat.children && cat.children.length > 0) {
-                                addCategoryOptions(cat.children, prefix + '  ');
-                            }
-                        });
-                    }
-                    
-                    addCategoryOptions(categories);
+                    await cachedApiCall('/categories', categories => {
+                        const select = document.getElementById('parent-category');
+                        select.innerHTML = '<option value="">None (Root Category)</option>';
+                        select.appendChild(buildCategoryOptions(categories));
+                    });
                 } catch (error) {
                     console.error('Error loading categories for dropdown:', error);
                 }
@@ -3906,84 +4872,155 @@ async function processPartialFulfillment(orderId) {
 
             async function loadItems() {
                 try {
-                    allItems = await apiCall('/items');
-                    displayItems();
+                    // Rebuild the indexes before rendering, so the category
+                    // filter runs against the snapshot being displayed
+                    await cachedApiCall('/items', items => {
+                        refreshItemsCache(items);
+                        displayItems();
+                    });
                 } catch (error) {
                     console.error('Error loading items:', error);
                     showAlert('Error loading items', 'error');
                 }
             }
 
-            function displayItems() {
-                const container = document.getElementById('items-list');
+            // Install an item snapshot: allItems, the indexes and the options
+            // cache always point at the same objects, so patches reach all of them
+            function refreshItemsCache(items) {
+                allItems = items;
+                itemsById = new Map(items.map(item => [item.id, item]));
+                itemsByCategory = new Map();
+                for (const item of items) {
+                    const key = item.category?.id ?? 0;
+                    if (!itemsByCategory.has(key)) itemsByCategory.set(key, []);
+                    itemsByCategory.get(key).push(item);
+                }
                 
-                container.innerHTML = allItems.map(item => {
-                    let cardClass = 'item-card';
-                    if (item.current_stock <= item.min_stock_level && item.min_stock_level > 0) {
-                        cardClass += ' low-stock';
-                    } else if (item.returnable_stock > 0) {
-                        cardClass += ' has-returnable';
-                    } else {
-                        cardClass += ' in-stock';
-                    }
-                    
-                    return `
-                        <div class="${cardClass}">
-                            <h4>📦 ${item.item_code} - ${item.item_name}</h4>
-                            <p><strong>Category:</strong> ${item.category?.name || 'N/A'}</p>
-                            <p><strong>Description:</strong> ${item.description || 'No description'}</p>
-                            <p><strong>UOM:</strong> ${item.unit_of_measure}</p>
-                            <p><strong>Current Stock:</strong> ${item.current_stock} ${item.unit_of_measure}</p>
-                            ${item.returnable_stock > 0 ? `<p><strong>Returnable Stock:</strong> ${item.returnable_stock} ${item.unit_of_measure}</p>` : ''}
-                            <p><strong>Min/Max Level:</strong> ${item.min_stock_level} / ${item.max_stock_level}</p>
-                            <p><strong>Standard Cost:</strong> ${item.standard_cost}</p>
-                            <p><strong>Location:</strong> ${item.location || 'Not specified'}</p>
-                            <p><strong>Manufacturer:</strong> ${item.manufacturer || 'Not specified'}</p>
-                            <p><strong>Returnable:</strong> ${item.is_returnable ? 'Yes' : 'No'}</p>
-                            <div style="margin-top: 10px;">
-                                <button class="btn btn-success" onclick="stockInItem(${item.id})">📈 Stock In</button>
-                                <button class="btn btn-warning" onclick="stockOutItem(${item.id})">📉 Stock Out</button>
-                                <button class="btn btn-info" onclick="viewItemHistory(${item.id})">📜 History</button>
-                            </div>
-                        </div>
-                    `;
-                }).join('');
+                _itemsCache = {
+                    t: Date.now(),
+                    data: items,
+                    optionsHtml: buildItemOptionsHtml(items)
+                };
+            }
+
+            function buildItemOptionsHtml(items) {
+                return items.map(item => `
+                    <option value="${item.id}" 
+                            data-cost="${item.standard_cost}" 
+                            data-uom="${escapeHtml(item.unit_of_measure)}"
+                            data-stock="${item.current_stock}">
+                        ${escapeHtml(item.item_code)} - ${escapeHtml(item.item_name)} (Stock: ${item.current_stock} ${escapeHtml(item.unit_of_measure)})
+                    </option>
+                `).join('');
+            }
+
+            async function getCachedItems() {
+                if (!_itemsCache.data || Date.now() - _itemsCache.t > ITEMS_CACHE_TTL) {
+                    refreshItemsCache(await cachedApiCall('/items'));
+                }
+                return _itemsCache;
+            }
+
+            function invalidateItemsCache() {
+                _itemsCache.t = 0;
+            }
+
+            const ITEM_CARD_TPL = document.getElementById('item-card-tpl').content.firstElementChild;
+
+            // Write plain-text values into the .<name> slots of a cloned card
+            function fillSlots(node, values) {
+                for (const name in values) {
+                    node.querySelector('.' + name).textContent = values[name];
+                }
+            }
+
+            const STOCK_CLASS = Object.freeze({
+                low: 'low-stock',
+                returnable: 'has-returnable',
+                ok: 'in-stock'
+            });
+
+            function stockLevel(item) {
+                if (item.current_stock <= item.min_stock_level && item.min_stock_level > 0) return 'low';
+                return item.returnable_stock > 0 ? 'returnable' : 'ok';
+            }
+
+            function applyStockClass(card, item) {
+                card.classList.add(STOCK_CLASS[stockLevel(item)]);
+            }
+
+            // Clone the item card skeleton and fill its slots as text, so names
+            // and descriptions never go through the HTML parser
+            function renderItemCard(item) {
+                const card = ITEM_CARD_TPL.cloneNode(true);
+                applyStockClass(card, item);
+                card.dataset.itemId = item.id;
+                card.dataset.categoryId = item.category?.id ?? '';
+                
+                fillSlots(card, {
+                    code: item.item_code,
+                    name: item.item_name,
+                    category: item.category?.name || 'N/A',
+                    desc: item.description || 'No description',
+                    uom: item.unit_of_measure,
+                    stock: `${item.current_stock} ${item.unit_of_measure}`,
+                    levels: `${item.min_stock_level} / ${item.max_stock_level}`,
+                    cost: item.standard_cost,
+                    location: item.location || 'Not specified',
+                    manufacturer: item.manufacturer || 'Not specified',
+                    returnable: item.is_returnable ? 'Yes' : 'No'
+                });
+                if (item.returnable_stock > 0) {
+                    fillSlots(card, { 'returnable-stock': `${item.returnable_stock} ${item.unit_of_measure}` });
+                } else {
+                    card.querySelector('.returnable-row').remove();
+                }
+                
+                for (const button of card.querySelectorAll('button[data-action]')) {
+                    button.dataset.id = item.id;
+                }
+                return card;
+            }
+
+            // Item cards from the last full render, keyed by item id; the
+            // category filter only flips .hidden on these
+            let _itemNodes = new Map();
+
+            function displayItems() {
+                const fragment = document.createDocumentFragment();
+                _itemNodes = new Map();
+                for (const item of allItems) {
+                    const card = renderItemCard(item);
+                    _itemNodes.set(item.id, card);
+                    fragment.appendChild(card);
+                }
+                EL.itemsList.replaceChildren(fragment);
+                filterItems();
             }
 
             async function loadCategoriesForDropdown() {
                 try {
-                    const categories = await apiCall('/categories');
-                    const selects = [
-                        document.getElementById('item-category'),
-                        document.getElementById('category-filter')
-                    ];
-                    
-                    function addCategoryOptions(cats, prefix = '') {
-                        cats.forEach(cat => {
-                            selects.forEach(select => {
-                                if (select) {
-                                    const option = document.createElement('option');
-                                    option.value = cat.id;
-                                    option.textContent = prefix + cat.name;
-                                    select.appendChild(option);
-                                }
-                            });
-                            
-                            if (cat.children && cat.children.length > 0) {
-                                addCategoryOptions(cat.children, prefix + '  ');
+                    await cachedApiCall('/categories', categories => {
+                        const selects = [
+                            document.getElementById('item-category'),
+                            document.getElementById('category-filter')
+                        ];
+                        const options = buildCategoryOptions(categories);
+                        
+                        selects.forEach(select => {
+                            if (select) {
+                                // Keep the current choice across the rebuild
+                                const selected = select.value;
+                                select.innerHTML = select.id === 'category-filter' ? 
+                                    '<option value="">All Categories</option>' : 
+                                    '<option value="">Select Category</option>';
+                                select.appendChild(options.cloneNode(true));
+                                select.value = selected;
                             }
                         });
-                    }
-                    
-                    selects.forEach(select => {
-                        if (select) {
-                            select.innerHTML = select.id === 'category-filter' ? 
-                                '<option value="">All Categories</option>' : 
-                                '<option value="">Select Category</option>';
-                        }
+                        // A category that no longer exists falls back to All
+                        filterItems();
                     });
-                    
-                    addCategoryOptions(categories);
                 } catch (error) {
                     console.error('Error loading categories for dropdown:', error);
                 }
@@ -3991,47 +5028,16 @@ async function processPartialFulfillment(orderId) {
 
             function filterItems() {
                 const categoryFilter = document.getElementById('category-filter').value;
+                const visibleIds = categoryFilter ?
+                    new Set((itemsByCategory.get(Number(categoryFilter)) ?? []).map(item => item.id)) :
+                    null;
                 
-                if (!categoryFilter) {
-                    displayItems();
-                    return;
-                }
-                
-                const filteredItems = allItems.filter(item => 
-                    item.category && item.category.id == categoryFilter
-                );
-                
-                const container = document.getElementById('items-list');
-                container.innerHTML = filteredItems.map(item => {
-                    let cardClass = 'item-card';
-                    if (item.current_stock <= item.min_stock_level && item.min_stock_level > 0) {
-                        cardClass += ' low-stock';
-                    } else if (item.returnable_stock > 0) {
-                        cardClass += ' has-returnable';
-                    } else {
-                        cardClass += ' in-stock';
+                for (const [id, card] of _itemNodes) {
+                    const shown = !visibleIds || visibleIds.has(id);
+                    if (card.classList.contains('hidden') === shown) {
+                        card.classList.toggle('hidden', !shown);
                     }
-                    
-                    return `
-                        <div class="${cardClass}">
-                            <h4>📦 ${item.item_code} - ${item.item_name}</h4>
-                            <p><strong>Category:</strong> ${item.category?.name || 'N/A'}</p>
-                            <p><strong>Description:</strong> ${item.description || 'No description'}</p>
-                            <p><strong>UOM:</strong> ${item.unit_of_measure}</p>
-                            <p><strong>Current Stock:</strong> ${item.current_stock} ${item.unit_of_measure}</p>
-                            ${item.returnable_stock > 0 ? `<p><strong>Returnable Stock:</strong> ${item.returnable_stock} ${item.unit_of_measure}</p>` : ''}
-                            <p><strong>Min/Max Level:</strong> ${item.min_stock_level} / ${item.max_stock_level}</p>
-                            <p><strong>Standard Cost:</strong> ${item.standard_cost}</p>
-                            <p><strong>Location:</strong> ${item.location || 'Not specified'}</p>
-                            <p><strong>Returnable:</strong> ${item.is_returnable ? 'Yes' : 'No'}</p>
-                            <div style="margin-top: 10px;">
-                                <button class="btn btn-success" onclick="stockInItem(${item.id})">📈 Stock In</button>
-                                <button class="btn btn-warning" onclick="stockOutItem(${item.id})">📉 Stock Out</button>
-                                <button class="btn btn-info" onclick="viewItemHistory(${item.id})">📜 History</button>
-                            </div>
-                        </div>
-                    `;
-                }).join('');
+                }
             }
 
             function showAddItemModal() {
@@ -4047,31 +5053,29 @@ async function processPartialFulfillment(orderId) {
             document.getElementById('add-item-form').addEventListener('submit', async (e) => {
                 e.preventDefault();
                 
-                const formData = new FormData();
-                formData.append('item_code', document.getElementById('item-code').value);
-                formData.append('item_name', document.getElementById('item-name').value);
-                formData.append('description', document.getElementById('item-description').value);
-                formData.append('category_id', document.getElementById('item-category').value);
-                formData.append('unit_of_measure', document.getElementById('item-uom').value);
-                formData.append('min_stock_level', document.getElementById('item-min-stock').value);
-                formData.append('max_stock_level', document.getElementById('item-max-stock').value);
-                formData.append('standard_cost', document.getElementById('item-cost').value);
-                formData.append('location', document.getElementById('item-location').value);
-                formData.append('manufacturer', document.getElementById('item-manufacturer').value);
-                formData.append('model_number', document.getElementById('item-model').value);
-                formData.append('specifications', document.getElementById('item-specifications').value);
-                formData.append('warranty_months', document.getElementById('item-warranty').value);
-                formData.append('is_returnable', document.getElementById('item-is-returnable').checked);
+                const payload = {
+                    item_code: document.getElementById('item-code').value,
+                    item_name: document.getElementById('item-name').value,
+                    description: document.getElementById('item-description').value,
+                    category_id: Number(document.getElementById('item-category').value),
+                    unit_of_measure: document.getElementById('item-uom').value,
+                    min_stock_level: Number(document.getElementById('item-min-stock').value) || 0,
+                    max_stock_level: Number(document.getElementById('item-max-stock').value) || 0,
+                    standard_cost: Number(document.getElementById('item-cost').value) || 0,
+                    location: document.getElementById('item-location').value,
+                    manufacturer: document.getElementById('item-manufacturer').value,
+                    model_number: document.getElementById('item-model').value,
+                    specifications: document.getElementById('item-specifications').value,
+                    warranty_months: parseInt(document.getElementById('item-warranty').value, 10) || 0,
+                    is_returnable: document.getElementById('item-is-returnable').checked
+                };
 
                 try {
-                    await fetch('/items', {
-                        method: 'POST',
-                        credentials: 'include',
-                        body: formData
-                    });
+                    await postJson('/items', payload);
                     
                     showAlert('Item created successfully!', 'success');
                     closeAddItemModal();
+                    invalidateItemsCache();
                     loadItems();
                 } catch (error) {
                     showAlert('Error creating item: ' + error.message, 'error');
@@ -4084,45 +5088,82 @@ async function processPartialFulfillment(orderId) {
 
             async function loadInventory() {
                 try {
-                    allItems = await apiCall('/items');
-                    displayInventory();
+                    await cachedApiCall('/items', items => {
+                        refreshItemsCache(items);
+                        displayInventory();
+                    });
                 } catch (error) {
                     console.error('Error loading inventory:', error);
                     showAlert('Error loading inventory', 'error');
                 }
             }
 
+            const INVENTORY_CARD_TPL = document.getElementById('inventory-card-tpl').content.firstElementChild;
+
+            function renderInventoryCard(item) {
+                const card = INVENTORY_CARD_TPL.cloneNode(true);
+                applyStockClass(card, item);
+                
+                fillSlots(card, {
+                    code: item.item_code,
+                    name: item.item_name,
+                    category: item.category?.name || 'N/A',
+                    stock: `${item.current_stock} ${item.unit_of_measure}`,
+                    levels: `${item.min_stock_level} / ${item.max_stock_level}`,
+                    location: item.location || 'Not specified',
+                    returnable: item.is_returnable ? 'Yes' : 'No'
+                });
+                if (item.returnable_stock > 0) {
+                    fillSlots(card, { 'returnable-stock': `${item.returnable_stock} ${item.unit_of_measure}` });
+                } else {
+                    card.querySelector('.returnable-row').remove();
+                }
+                
+                for (const button of card.querySelectorAll('button[data-action]')) {
+                    button.dataset.id = item.id;
+                }
+                return card;
+            }
+
+            // Rendered inventory cards keyed by item id, with a digest of the
+            // fields each card shows; unchanged items keep their node as-is
+            let inventoryCardIndex = new Map();
+
+            function inventoryCardKey(item) {
+                return [
+                    item.item_code, item.item_name, item.category?.name, item.unit_of_measure,
+                    item.current_stock, item.returnable_stock, item.min_stock_level, item.max_stock_level,
+                    item.location, item.is_returnable
+                ].join('|');
+            }
+
             function displayInventory() {
-                const container = document.getElementById('inventory-list');
+                const container = EL.inventoryList;
+                const liveIds = new Set(allItems.map(item => item.id));
                 
-                container.innerHTML = allItems.map(item => {
-                    let cardClass = 'item-card';
-                    if (item.current_stock <= item.min_stock_level && item.min_stock_level > 0) {
-                        cardClass += ' low-stock';
-                    } else if (item.returnable_stock > 0) {
-                        cardClass += ' has-returnable';
-                    } else {
-                        cardClass += ' in-stock';
+                for (const [id, entry] of inventoryCardIndex) {
+                    if (!liveIds.has(id)) entry.node.remove();
+                }
+                
+                const nextIndex = new Map();
+                let previous = null;
+                for (const item of allItems) {
+                    const key = inventoryCardKey(item);
+                    let entry = inventoryCardIndex.get(item.id);
+                    
+                    if (!entry || entry.key !== key) {
+                        const node = renderInventoryCard(item);
+                        if (entry) entry.node.replaceWith(node);
+                        entry = { node, key };
                     }
+                    nextIndex.set(item.id, entry);
                     
-                    return `
-                        <div class="${cardClass}">
-                            <h4>📦 ${item.item_code} - ${item.item_name}</h4>
-                            <p><strong>Category:</strong> ${item.category?.name || 'N/A'}</p>
-                            <p><strong>Current Stock:</strong> ${item.current_stock} ${item.unit_of_measure}</p>
-                            ${item.returnable_stock > 0 ? `<p><strong>Returnable Stock:</strong> ${item.returnable_stock} ${item.unit_of_measure}</p>` : ''}
-                            <p><strong>Min/Max Level:</strong> ${item.min_stock_level} / ${item.max_stock_level}</p>
-                            <p><strong>Location:</strong> ${item.location || 'Not specified'}</p>
-                            <p><strong>Returnable:</strong> ${item.is_returnable ? 'Yes' : 'No'}</p>
-                            <div style="margin-top: 10px;">
-                                <button class="btn btn-success" onclick="stockInItem(${item.id})">📈 Stock In</button>
-                                <button class="btn btn-warning" onclick="stockOutItem(${item.id})">📉 Stock Out</button>
-                                <button class="btn btn-info" onclick="stockAdjustItem(${item.id})">⚖️ Adjust</button>
-                                <button class="btn" onclick="viewItemHistory(${item.id})">📜 History</button>
-                            </div>
-                        </div>
-                    `;
-                }).join('');
+                    // Only move nodes that are out of order
+                    const expected = previous ? previous.nextElementSibling : container.firstElementChild;
+                    if (entry.node !== expected) container.insertBefore(entry.node, expected);
+                    previous = entry.node;
+                }
+                inventoryCardIndex = nextIndex;
             }
 
             function stockInItem(itemId) {
@@ -4149,6 +5190,38 @@ async function processPartialFulfillment(orderId) {
                 showStockTransactionModal('ADJUST');
             }
 
+            const STOCK_TRANSACTION_TYPES = Object.freeze({
+                'IN': {
+                    title: '📈 Stock In Transaction',
+                    options: ['PURCHASE', 'RETURN', 'TRANSFER_IN', 'FOUND', 'CUSTOMER_RETURN', 'OTHER']
+                },
+                'OUT': {
+                    title: '📉 Stock Out Transaction', 
+                    options: ['SALE', 'CONSUMPTION', 'TRANSFER_OUT', 'DAMAGE', 'LOSS', 'ORDER_SHIPMENT', 'CORRECTED','OTHER']
+                },
+                'ADJUST': {
+                    title: '⚖️ Stock Adjustment',
+                    options: ['STOCK_TAKE', 'CORRECTION', 'RECOUNT', 'OTHER']
+                }
+            });
+
+            // Subtype options are built once per transaction type; reopening
+            // the modal for the type already shown keeps the existing options
+            const _subtypeOptions = {};
+
+            function setSubtypeOptions(subtypeSelect, type) {
+                if (subtypeSelect.dataset.type === type) {
+                    subtypeSelect.selectedIndex = 0;
+                    return;
+                }
+                _subtypeOptions[type] ??= [
+                    new Option('Select Sub Type', ''),
+                    ...STOCK_TRANSACTION_TYPES[type].options.map(subtype => new Option(subtype.replace('_', ' '), subtype))
+                ];
+                subtypeSelect.replaceChildren(..._subtypeOptions[type].map(option => option.cloneNode(true)));
+                subtypeSelect.dataset.type = type;
+            }
+
             async function showStockTransactionModal(type, itemId = null) {
                 const modal = document.getElementById('stock-transaction-modal');
                 const title = document.getElementById('transaction-modal-title');
@@ -4160,26 +5233,8 @@ async function processPartialFulfillment(orderId) {
                 typeInput.value = type;
                 
                 // Set modal title and subtype options
-                const subtypes = {
-                    'IN': {
-                        title: '📈 Stock In Transaction',
-                        options: ['PURCHASE', 'RETURN', 'TRANSFER_IN', 'FOUND', 'CUSTOMER_RETURN', 'OTHER']
-                    },
-                    'OUT': {
-                        title: '📉 Stock Out Transaction', 
-                        options: ['SALE', 'CONSUMPTION', 'TRANSFER_OUT', 'DAMAGE', 'LOSS', 'ORDER_SHIPMENT', 'CORRECTED','OTHER']
-                    },
-                    'ADJUST': {
-                        title: '⚖️ Stock Adjustment',
-                        options: ['STOCK_TAKE', 'CORRECTION', 'RECOUNT', 'OTHER']
-                    }
-                };
-                
-                title.textContent = subtypes[type].title;
-                subtypeSelect.innerHTML = '<option value="">Select Sub Type</option>';
-                subtypes[type].options.forEach(subtype => {
-                    subtypeSelect.innerHTML += `<option value="${subtype}">${subtype.replace('_', ' ')}</option>`;
-                });
+                title.textContent = STOCK_TRANSACTION_TYPES[type].title;
+                setSubtypeOptions(subtypeSelect, type);
                 
                 // Show/hide returnable fields based on transaction type
                 if (type === 'OUT') {
@@ -4190,21 +5245,22 @@ async function processPartialFulfillment(orderId) {
                     returnDateGroup.style.display = 'none';
                 }
                 
-                // Load items for dropdown
+                // Load items for dropdown from the shared snapshot; it is
+                // refreshed by loadItems/loadInventory and expires after ITEMS_CACHE_TTL
                 try {
-                    const items = await apiCall('/items');
+                    const { data: items } = await getCachedItems();
                     const itemSelect = document.getElementById('transaction-item');
-                    itemSelect.innerHTML = '<option value="">Select Item</option>';
+                    const fragment = document.createDocumentFragment();
+                    fragment.appendChild(new Option('Select Item', ''));
                     items.forEach(item => {
-                        const option = document.createElement('option');
-                        option.value = item.id;
-                        option.textContent = `${item.item_code} - ${item.item_name}`;
+                        const option = new Option(`${item.item_code} - ${item.item_name}`, item.id);
                         option.dataset.isReturnable = item.is_returnable;
                         if (itemId && item.id === itemId) {
                             option.selected = true;
                         }
-                        itemSelect.appendChild(option);
+                        fragment.appendChild(option);
                     });
+                    itemSelect.replaceChildren(fragment);
                 } catch (error) {
                     console.error('Error loading items:', error);
                 }
@@ -4219,12 +5275,12 @@ async function processPartialFulfillment(orderId) {
 
             // Update the item selection to show/hide returnable fields
             document.getElementById('transaction-item').addEventListener('change', function() {
-                const selectedOption = this.options[this.selectedIndex];
+                const selectedOption = this.selectedOptions[0];
                 const returnableGroup = document.getElementById('returnable-quantity-group');
                 const returnDateGroup = document.getElementById('expected-return-date-group');
                 const transactionType = document.getElementById('transaction-type').value;
                 
-                if (transactionType === 'OUT' && selectedOption.dataset.isReturnable === 'true') {
+                if (transactionType === 'OUT' && selectedOption?.dataset.isReturnable === 'true') {
                     returnableGroup.style.display = 'block';
                     returnDateGroup.style.display = 'block';
                 } else if (transactionType === 'OUT') {
@@ -4236,42 +5292,36 @@ async function processPartialFulfillment(orderId) {
             document.getElementById('stock-transaction-form').addEventListener('submit', async (e) => {
                 e.preventDefault();
                 
-                const formData = new FormData();
-                formData.append('item_master_id', document.getElementById('transaction-item').value);
-                formData.append('transaction_type', document.getElementById('transaction-type').value);
-                formData.append('transaction_sub_type', document.getElementById('transaction-subtype').value);
-                formData.append('quantity', document.getElementById('transaction-quantity').value);
-                formData.append('returnable_quantity', document.getElementById('transaction-returnable-quantity').value || '0');
-                formData.append('unit_cost', document.getElementById('transaction-cost').value);
-                formData.append('reference_number', document.getElementById('transaction-reference').value);
-                formData.append('vendor_customer', document.getElementById('transaction-vendor').value);
-                formData.append('expected_return_date', document.getElementById('transaction-expected-return').value);
-                formData.append('remarks', document.getElementById('transaction-remarks').value);
+                const payload = {
+                    item_master_id: Number(document.getElementById('transaction-item').value),
+                    transaction_type: document.getElementById('transaction-type').value,
+                    transaction_sub_type: document.getElementById('transaction-subtype').value,
+                    quantity: Number(document.getElementById('transaction-quantity').value),
+                    returnable_quantity: Number(document.getElementById('transaction-returnable-quantity').value) || 0,
+                    unit_cost: Number(document.getElementById('transaction-cost').value) || 0,
+                    reference_number: document.getElementById('transaction-reference').value,
+                    vendor_customer: document.getElementById('transaction-vendor').value,
+                    expected_return_date: document.getElementById('transaction-expected-return').value,
+                    remarks: document.getElementById('transaction-remarks').value
+                };
 
                 try {
-                    const result = await fetch('/inventory/transactions', {
-                        method: 'POST',
-                        credentials: 'include',
-                        body: formData
-                    });
+                    let result = await postJson('/inventory/transactions', payload);
                     
-                    if (result.ok) {
-                        const data = await result.json();
-                        
-                        if (confirm('Transaction created successfully! Do you want to confirm it now?')) {
-                            await fetch(`/inventory/transactions/${data.transaction_id}/confirm`, {
-                                method: 'POST',
-                                credentials: 'include'
-                            });
-                            showAlert('Transaction confirmed successfully!', 'success');
-                        } else {
-                            showAlert('Transaction created successfully!', 'success');
-                        }
-                        
-                        closeStockTransactionModal();
-                        loadInventory();
-                        loadDashboard();
+                    if (confirm('Transaction created successfully! Do you want to confirm it now?')) {
+                        result = await apiCall(`/inventory/transactions/${result.transaction_id}/confirm`, {
+                            method: 'POST'
+                        });
+                        showAlert('Transaction confirmed successfully!', 'success');
+                        applyStockUpdates([result]);
+                        displayInventory();
+                        displayLowStockItems(result.low_stock);
+                    } else {
+                        showAlert('Transaction created successfully!', 'success');
                     }
+                    
+                    closeStockTransactionModal();
+                    displayDashboardStats(result.dashboard);
                 } catch (error) {
                     showAlert('Error creating transaction: ' + error.message, 'error');
                 }
@@ -4281,168 +5331,255 @@ async function processPartialFulfillment(orderId) {
             // TRANSACTION MANAGEMENT FUNCTIONS
             // ============================
 
+            // Transactions are fetched a page at a time; transactionsCursor is
+            // the id to continue after, or null once the last page is in
+            const TRANSACTIONS_PAGE_SIZE = 200;
+            const TRANSACTIONS_RETRY_DELAY = 2000;
+            let transactionsCursor = null;
+            let transactionsLoading = false;
+            // Bumped whenever the list is reloaded, so a load-more that started
+            // against the previous list does not append onto the new one
+            let transactionsGeneration = 0;
+
+            function updateTransactionsCursor(page) {
+                transactionsCursor = page.length === TRANSACTIONS_PAGE_SIZE ? page[page.length - 1].id : null;
+            }
+
             async function loadTransactions() {
+                // The revalidated copy replaces the cached one in place
+                let rendered = false;
                 try {
-                    allTransactions = await apiCall('/inventory/transactions');
-                    displayTransactions();
+                    await cachedApiCall(`/inventory/transactions?limit=${TRANSACTIONS_PAGE_SIZE}`, transactions => {
+                        transactionsGeneration++;
+                        allTransactions = transactions;
+                        updateTransactionsCursor(transactions);
+                        displayTransactions(rendered);
+                        rendered = true;
+                        // A short cached first page may have stopped paging
+                        if (transactionsCursor !== null) transactionsTable.resume();
+                    });
                 } catch (error) {
                     console.error('Error loading transactions:', error);
                     showAlert('Error loading transactions', 'error');
                 }
             }
 
-            function displayTransactions() {
-                const container = document.getElementById('transactions-list');
-                
-                if (allTransactions.length === 0) {
-                    container.innerHTML = '<p style="text-align: center; color: #666; padding: 40px;">No transactions found.</p>';
-                    return;
+            async function loadMoreTransactions() {
+                if (transactionsCursor === null || transactionsLoading) return false;
+                transactionsLoading = true;
+                const generation = transactionsGeneration;
+                try {
+                    const page = await apiCall(`/inventory/transactions?limit=${TRANSACTIONS_PAGE_SIZE}&after=${transactionsCursor}`);
+                    if (generation === transactionsGeneration) {
+                        allTransactions = allTransactions.concat(page);
+                        updateTransactionsCursor(page);
+                        displayTransactions(true);
+                    }
+                } catch (error) {
+                    console.error('Error loading more transactions:', error);
+                    // Keep paging alive; try again once the sentinel is re-observed
+                    await new Promise(resolve => setTimeout(resolve, TRANSACTIONS_RETRY_DELAY));
+                    return true;
+                } finally {
+                    transactionsLoading = false;
                 }
-                
-                let tableHTML = `
-                    <table>
-                        <thead>
-                            <tr>
-                                <th>Transaction #</th>
-                                <th>Date</th>
-                                <th>Item</th>
-                                <th>Order</th>
-                                <th>Type</th>
-                                <th>Sub Type</th>
-                                <th>Quantity</th>
-                                <th>Returnable</th>
-                                <th>Cost</th>
-                                <th>Status</th>
-                                <th>User</th>
-                                <th>Actions</th>
-                            </tr>
-                        </thead>
-                        <tbody>
+                return transactionsCursor !== null;
+            }
+
+            const TRANSACTION_ROW_HEIGHT = 76;
+            let transactionsTable = null;
+
+            function createTransactionRow() {
+                const tr = document.createElement('tr');
+                tr.innerHTML = `
+                    <td></td><td></td><td></td><td></td><td></td><td></td>
+                    <td></td><td></td><td></td><td><span></span></td><td></td>
+                    <td>
+                        <button class="btn btn-success" data-action="confirm">✅ Confirm</button>
+                        <button class="btn btn-info" data-action="view">👁️ View</button>
+                    </td>
                 `;
-                
-                allTransactions.forEach(txn => {
-                    const statusColor = txn.status === 'CONFIRMED' ? '#27ae60' : 
-                                       txn.status === 'PENDING' ? '#f39c12' : '#e74c3c';
-                    
-                    tableHTML += `
-                        <tr>
-                            <td>${txn.transaction_number}</td>
-                            <td>${new Date(txn.transaction_date).toLocaleDateString()}</td>
-                            <td>${txn.item?.item_code || 'N/A'} - ${txn.item?.item_name || 'N/A'}</td>
-                            <td>${txn.order ? `${txn.order.order_number} - ${txn.order.customer_name}` : 'N/A'}</td>
-                            <td>${txn.transaction_type}</td>
-                            <td>${txn.transaction_sub_type}</td>
-                            <td>${txn.quantity}</td>
-                            <td>${txn.returnable_quantity || 0}</td>
-                            <td>${txn.total_cost}</td>
-                            <td><span style="color: ${statusColor}; font-weight: bold;">${txn.status}</span></td>
-                            <td>${txn.user?.name || 'N/A'}</td>
-                            <td>
-                                ${txn.status === 'PENDING' ? `<button class="btn btn-success" onclick="confirmTransaction(${txn.id})">✅ Confirm</button>` : ''}
-                                <button class="btn btn-info" onclick="viewTransactionDetails(${txn.id})">👁️ View</button>
-                            </td>
-                        </tr>
-                    `;
-                });
-                
-                tableHTML += '</tbody></table>';
-                container.innerHTML = tableHTML;
+                return tr;
+            }
+
+            // Stand-ins for missing nested records, so the row renderers always
+            // read the same properties from objects of the same shape
+            const EMPTY_ITEM = Object.freeze({ item_code: 'N/A', item_name: 'N/A' });
+            const EMPTY_USER = Object.freeze({ name: 'N/A' });
+
+            const TXN_STATUS_CLASS = Object.freeze({
+                CONFIRMED: 'status-confirmed',
+                PENDING: 'status-pending',
+                CANCELLED: 'status-cancelled'
+            });
+
+            function txnStatusClass(status) {
+                return TXN_STATUS_CLASS[status] || 'status-cancelled';
             }
 
-            function filterTransactions() {
-                const typeFilter = document.getElementById('transaction-type-filter').value;
-                const statusFilter = document.getElementById('transaction-status-filter').value;
+            function fillTransactionRow(tr, txn) {
+                const item = txn.item || EMPTY_ITEM;
+                const user = txn.user || EMPTY_USER;
+                const order = txn.order;
+                const cells = tr.cells;
                 
-                let filteredTransactions = allTransactions;
+                cells[0].textContent = txn.transaction_number;
+                cells[1].textContent = fmtDate(txn.transaction_date);
+                cells[2].textContent = `${item.item_code || 'N/A'} - ${item.item_name || 'N/A'}`;
+                cells[3].textContent = order ? `${order.order_number} - ${order.customer_name}` : 'N/A';
+                cells[4].textContent = txn.transaction_type;
+                cells[5].textContent = txn.transaction_sub_type;
+                cells[6].textContent = txn.quantity;
+                cells[7].textContent = txn.returnable_quantity || 0;
+                cells[8].textContent = txn.total_cost;
                 
-                if (typeFilter) {
-                    filteredTransactions = filteredTransactions.filter(txn => txn.transaction_type === typeFilter);
-                }
+                const status = cells[9].firstElementChild;
+                status.textContent = txn.status;
+                status.className = txnStatusClass(txn.status);
                 
-                if (statusFilter) {
-                    filteredTransactions = filteredTransactions.filter(txn => txn.status === statusFilter);
+                cells[10].textContent = user.name || 'N/A';
+                
+                const [confirmButton, viewButton] = cells[11].children;
+                confirmButton.hidden = txn.status !== 'PENDING';
+                confirmButton.dataset.id = txn.id;
+                viewButton.dataset.id = txn.id;
+            }
+
+            // allTransactions bucketed by type and by status (each bucket keeps
+            // list order), rebuilt whenever the list is reloaded
+            let txnByType = new Map();
+            let txnByStatus = new Map();
+
+            function bucketBy(list, keyOf) {
+                const buckets = new Map();
+                for (const entry of list) {
+                    const key = keyOf(entry);
+                    if (!buckets.has(key)) buckets.set(key, []);
+                    buckets.get(key).push(entry);
                 }
+                return buckets;
+            }
+
+            function displayTransactions(keepScroll = false) {
+                txnByType = bucketBy(allTransactions, txn => txn.transaction_type);
+                txnByStatus = bucketBy(allTransactions, txn => txn.status);
+                filterTransactions(keepScroll);
+            }
+
+            function filterTransactions(keepScroll = false) {
+                const typeFilter = EL.transactionTypeFilter.value;
+                const statusFilter = EL.transactionStatusFilter.value;
                 
-                const container = document.getElementById('transactions-list');
+                let filteredTransactions = allTransactions;
                 
-                if (filteredTransactions.length === 0) {
-                    container.innerHTML = '<p style="text-align: center; color: #666; padding: 40px;">No transactions found matching the filters.</p>';
-                    return;
+                if (typeFilter && statusFilter) {
+                    // Scan only the smaller bucket, checking the other field
+                    const byType = txnByType.get(typeFilter) ?? [];
+                    const byStatus = txnByStatus.get(statusFilter) ?? [];
+                    filteredTransactions = byType.length <= byStatus.length ?
+                        byType.filter(txn => txn.status === statusFilter) :
+                        byStatus.filter(txn => txn.transaction_type === typeFilter);
+                } else if (typeFilter) {
+                    filteredTransactions = txnByType.get(typeFilter) ?? [];
+                } else if (statusFilter) {
+                    filteredTransactions = txnByStatus.get(statusFilter) ?? [];
                 }
                 
-                let tableHTML = `
-                    <table>
-                        <thead>
-                            <tr>
-                                <th>Transaction #</th>
-                                <th>Date</th>
-                                <th>Item</th>
-                                <th>Order</th>
-                                <th>Type</th>
-                                <th>Sub Type</th>
-                                <th>Quantity</th>
-                                <th>Returnable</th>
-                                <th>Cost</th>
-                                <th>Status</th>
-                                <th>User</th>
-                                <th>Actions</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-                `;
-                
-                filteredTransactions.forEach(txn => {
-                    const statusColor = txn.status === 'CONFIRMED' ? '#27ae60' : 
-                                       txn.status === 'PENDING' ? '#f39c12' : '#e74c3c';
-                    
-                    tableHTML += `
-                        <tr>
-                            <td>${txn.transaction_number}</td>
-                            <td>${new Date(txn.transaction_date).toLocaleDateString()}</td>
-                            <td>${txn.item?.item_code || 'N/A'} - ${txn.item?.item_name || 'N/A'}</td>
-                            <td>${txn.order ? `${txn.order.order_number} - ${txn.order.customer_name}` : 'N/A'}</td>
-                            <td>${txn.transaction_type}</td>
-                            <td>${txn.transaction_sub_type}</td>
-                            <td>${txn.quantity}</td>
-                            <td>${txn.returnable_quantity || 0}</td>
-                            <td>${txn.total_cost}</td>
-                            <td><span style="color: ${statusColor}; font-weight: bold;">${txn.status}</span></td>
-                            <td>${txn.user?.name || 'N/A'}</td>
-                            <td>
-                                ${txn.status === 'PENDING' ? `<button class="btn btn-success" onclick="confirmTransaction(${txn.id})">✅ Confirm</button>` : ''}
-                                <button class="btn btn-info" onclick="viewTransactionDetails(${txn.id})">👁️ View</button>
-                            </td>
-                        </tr>
-                    `;
+                // The header and row pool are built once; filtering only
+                // re-windows the filtered array
+                transactionsTable ??= createVirtualTable(EL.transactionsList, {
+                    headers: ['Transaction #', 'Date', 'Item', 'Order', 'Type', 'Sub Type', 'Quantity',
+                              'Returnable', 'Cost', 'Status', 'User', 'Actions'],
+                    rowHeight: TRANSACTION_ROW_HEIGHT,
+                    createRow: createTransactionRow,
+                    fillRow: fillTransactionRow,
+                    onEnd: loadMoreTransactions
                 });
-                
-                tableHTML += '</tbody></table>';
-                container.innerHTML = tableHTML;
+                transactionsTable.setRows(filteredTransactions, allTransactions.length === 0 ?
+                    'No transactions found.' : 'No transactions found matching the filters.', keepScroll);
+            }
+
+            const filterTransactionsDebounced = debounce(filterTransactions, 80);
+
+            // Apply {item_id, new_stock, new_returnable_stock} entries from a
+            // mutation response to the loaded items; unknown items drop the cache
+            function applyStockUpdates(updates) {
+                let missing = false;
+                for (const update of updates) {
+                    const item = itemsById.get(update.item_id);
+                    if (item) {
+                        item.current_stock = update.new_stock;
+                        item.returnable_stock = update.new_returnable_stock;
+                    } else {
+                        missing = true;
+                    }
+                }
+                if (missing) {
+                    invalidateItemsCache();
+                } else {
+                    // Patched items are the snapshot's own objects and keep their
+                    // category, so only the option markup shows stale stock
+                    _itemsCache.optionsHtml = buildItemOptionsHtml(_itemsCache.data);
+                }
             }
 
             async function confirmTransaction(transactionId) {
                 if (confirm('Are you sure you want to confirm this transaction? This will update the inventory levels.')) {
                     try {
-                        await fetch(`/inventory/transactions/${transactionId}/confirm`, {
-                            method: 'POST',
-                            credentials: 'include'
+                        const result = await apiCall(`/inventory/transactions/${transactionId}/confirm`, {
+                            method: 'POST'
                         });
                         
                         showAlert('Transaction confirmed successfully!', 'success');
-                        loadTransactions();
-                        loadInventory();
-                        loadDashboard();
+                        
+                        // Patch the affected transaction and item locally instead of
+                        // re-downloading both lists; the next load revalidates anyway
+                        const txn = allTransactions.find(t => t.id === result.transaction_id);
+                        if (txn) txn.status = result.txn_status;
+                        applyStockUpdates([result]);
+                        
+                        displayTransactions(true);
+                        displayInventory();
+                        displayDashboardStats(result.dashboard);
+                        displayLowStockItems(result.low_stock);
                     } catch (error) {
                         showAlert('Error confirming transaction: ' + error.message, 'error');
                     }
                 }
             }
 
+            function renderTxnHistoryRow(txn) {
+                const user = txn.user || EMPTY_USER;
+                return `
+                    <tr>
+                        <td>${fmtDate(txn.transaction_date)}</td>
+                        <td>${txn.transaction_type}</td>
+                        <td>${txn._safe.transaction_sub_type}</td>
+                        <td>${txn.quantity}</td>
+                        <td>${txn.returnable_quantity || 0}</td>
+                        <td>${txn.total_cost}</td>
+                        <td>${txn._safe.reference_number || 'N/A'}</td>
+                        <td>${txn._safe.vendor_customer || 'N/A'}</td>
+                        <td><span class="${txnStatusClass(txn.status)}">${txn.status}</span></td>
+                        <td>${escapeHtml(user.name) || 'N/A'}</td>
+                    </tr>
+                `;
+            }
+
+            let historyRender = null;
+
             async function viewItemHistory(itemId) {
+                // Opening another history cancels the rows still being appended
+                historyRender?.abort();
+                const render = historyRender = new AbortController();
                 try {
-                    const transactions = await apiCall(`/inventory/transactions?item_id=${itemId}`);
+                    const transactions = attachSafe(await apiCall(`/inventory/transactions?item_id=${itemId}`),
+                        ['transaction_sub_type', 'reference_number', 'vendor_customer']);
                     
-                    let html = `
+                    const modal = document.createElement('div');
+                    modal.className = 'modal';
+                    modal.innerHTML = `
+                        <div class="modal-content">
                         <div style="max-width: 900px;">
                             <h3>📜 Item Transaction History</h3>
                             <table style="margin-top: 20px;">
@@ -4460,43 +5597,17 @@ async function processPartialFulfillment(orderId) {
                                         <th>User</th>
                                     </tr>
                                 </thead>
-                                <tbody>
-                    `;
-                    
-                    transactions.forEach(txn => {
-                        const statusColor = txn.status === 'CONFIRMED' ? '#27ae60' : 
-                                           txn.status === 'PENDING' ? '#f39c12' : '#e74c3c';
-                        
-                        html += `
-                            <tr>
-                                <td>${new Date(txn.transaction_date).toLocaleDateString()}</td>
-                                <td>${txn.transaction_type}</td>
-                                <td>${txn.transaction_sub_type}</td>
-                                <td>${txn.quantity}</td>
-                                <td>${txn.returnable_quantity || 0}</td>
-                                <td>${txn.total_cost}</td>
-                                <td>${txn.reference_number || 'N/A'}</td>
-                                <td>${txn.vendor_customer || 'N/A'}</td>
-                                <td><span style="color: ${statusColor}; font-weight: bold;">${txn.status}</span></td>
-                                <td>${txn.user?.name || 'N/A'}</td>
-                            </tr>
-                        `;
-                    });
-                    
-                    html += `
-                                </tbody>
+                                <tbody></tbody>
                             </table>
                             <div style="text-align: center; margin-top: 20px;">
                                 <button class="btn" onclick="this.closest('.modal').remove()">Close</button>
                             </div>
                         </div>
+                        </div>
                     `;
-                    
-                    const modal = document.createElement('div');
-                    modal.className = 'modal';
-                    modal.innerHTML = `<div class="modal-content">${html}</div>`;
                     document.body.appendChild(modal);
                     
+                    await renderInChunks(modal.querySelector('tbody'), transactions, renderTxnHistoryRow, render.signal);
                 } catch (error) {
                     showAlert('Error loading item history: ' + error.message, 'error');
                 }
@@ -4508,115 +5619,227 @@ async function processPartialFulfillment(orderId) {
 
             async function loadReturnableItems() {
                 try {
-                    allReturnableItems = await apiCall('/inventory/returnable-items');
-                    displayReturnableItems();
+                    allReturnableItems = await cachedApiCall('/inventory/returnable-items', items => {
+                        allReturnableItems = items;
+                        displayReturnableItems();
+                    });
                 } catch (error) {
                     console.error('Error loading returnable items:', error);
                     showAlert('Error loading returnable items', 'error');
                 }
             }
 
-            function displayReturnableItems() {
-                const container = document.getElementById('returnable-items-list');
+            const RETURNABLE_CARD_TPL = document.getElementById('returnable-card-tpl').content.firstElementChild;
+
+            function renderReturnableCard(item) {
+                const card = RETURNABLE_CARD_TPL.cloneNode(true);
+                
+                fillSlots(card, {
+                    code: item.item.item_code,
+                    name: item.item.item_name,
+                    transaction: item.transaction_number,
+                    customer: item.customer_name,
+                    total: item.total_returnable,
+                    returned: item.returned_quantity,
+                    outstanding: item.outstanding_quantity,
+                    date: fmtDate(item.transaction_date),
+                    expected: item.expected_return_date ? fmtDate(item.expected_return_date) : 'Not specified'
+                });
+                if (item.is_overdue) {
+                    card.classList.add('overdue-card');
+                } else {
+                    card.querySelector('.overdue-row').remove();
+                }
+                
+                const button = card.querySelector('button[data-action]');
+                button.dataset.id = item.transaction_id;
+                button.dataset.outstanding = item.outstanding_quantity;
+                return card;
+            }
+
+            function displayReturnableItems() {
+                const container = EL.returnableItemsList;
                 
                 if (allReturnableItems.length === 0) {
                     container.innerHTML = '<p style="text-align: center; color: #666; padding: 40px;">No returnable items found.</p>';
                     return;
                 }
                 
-                container.innerHTML = allReturnableItems.map(item => `
-                    <div class="returnable-card ${item.is_overdue ? 'overdue-card' : ''}">
-                        <h4>🔄 ${item.item.item_code} - ${item.item.item_name}</h4>
-                        <p><strong>Transaction:</strong> ${item.transaction_number}</p>
-                        <p><strong>Customer:</strong> ${item.customer_name}</p>
-                        <p><strong>Total Returnable:</strong> ${item.total_returnable}</p>
-                        <p><strong>Returned:</strong> ${item.returned_quantity}</p>
-                        <p><strong>Outstanding:</strong> ${item.outstanding_quantity}</p>
-                        <p><strong>Transaction Date:</strong> ${new Date(item.transaction_date).toLocaleDateString()}</p>
-                        <p><strong>Expected Return:</strong> ${item.expected_return_date ? new Date(item.expected_return_date).toLocaleDateString() : 'Not specified'}</p>
-                        ${item.is_overdue ? '<p style="color: #e74c3c; font-weight: bold;">⚠️ OVERDUE</p>' : ''}
-                        <div style="margin-top: 10px;">
-                            <button class="btn btn-success" onclick="showProcessReturnModal(${item.transaction_id}, ${item.outstanding_quantity})">✅ Process Return</button>
-                        </div>
-                    </div>
-                `).join('');
+                const fragment = document.createDocumentFragment();
+                for (const item of allReturnableItems) {
+                    fragment.appendChild(renderReturnableCard(item));
+                }
+                container.replaceChildren(fragment);
             }
 
+            // The return modal lives in the page; opening it only refills the
+            // form and records which transaction the submit applies to
+            let currentReturnTxnId = null;
+
             function showProcessReturnModal(transactionId, maxQuantity) {
-                const modal = document.createElement('div');
-                modal.className = 'modal';
-                modal.innerHTML = `
-                    <div class="modal-content">
-                        <span class="close" onclick="this.closest('.modal').remove()">&times;</span>
-                        <h3>🔄 Process Return</h3>
-                        <form id="process-return-form">
-                            <div class="form-group">
-                                <label for="return-quantity">Returned Quantity:</label>
-                                <input type="number" id="return-quantity" step="0.001" required max="${maxQuantity}" value="${maxQuantity}">
-                            </div>
-                            <div class="form-group">
-                                <label for="return-condition">Condition:</label>
-                                <select id="return-condition" required>
-                                    <option value="">Select Condition</option>
-                                    <option value="GOOD">Good - Can be restocked</option>
-                                    <option value="DAMAGED">Damaged - Needs repair</option>
-                                    <option value="UNUSABLE">Unusable - Write off</option>
-                                </select>
-                            </div>
-                            <div class="form-group">
-                                <label for="return-remarks">Remarks:</label>
-                                <textarea id="return-remarks"></textarea>
-                            </div>
-                            <button type="submit" class="btn">Process Return</button>
-                        </form>
-                    </div>
-                `;
-                document.body.appendChild(modal);
+                currentReturnTxnId = transactionId;
+                const quantity = document.getElementById('return-quantity');
+                quantity.max = maxQuantity;
+                quantity.value = maxQuantity;
+                document.getElementById('process-return-modal').classList.remove('hidden');
+            }
 
-                document.getElementById('process-return-form').addEventListener('submit', async (e) => {
-                    e.preventDefault();
+            function closeProcessReturnModal() {
+                document.getElementById('process-return-modal').classList.add('hidden');
+                document.getElementById('process-return-form').reset();
+                currentReturnTxnId = null;
+            }
+
+            document.getElementById('process-return-form').addEventListener('submit', async (e) => {
+                e.preventDefault();
+                
+                const fields = e.currentTarget.elements;
+                const payload = {
+                    transaction_id: currentReturnTxnId,
+                    returned_quantity: Number(fields['return-quantity'].value),
+                    condition: fields['return-condition'].value,
+                    remarks: fields['return-remarks'].value
+                };
+
+                try {
+                    const result = await postJson('/inventory/process-return', payload);
                     
-                    const formData = new FormData();
-                    formData.append('transaction_id', transactionId);
-                    formData.append('returned_quantity', document.getElementById('return-quantity').value);
-                    formData.append('condition', document.getElementById('return-condition').value);
-                    formData.append('remarks', document.getElementById('return-remarks').value);
+                    showAlert('Return processed successfully!', 'success');
+                    closeProcessReturnModal();
+                    loadReturnableItems();
+                    displayDashboardStats(result.dashboard);
+                } catch (error) {
+                    showAlert('Error processing return: ' + error.message, 'error');
+                }
+            });
 
-                    try {
-                        await fetch('/inventory/process-return', {
-                            method: 'POST',
-                            credentials: 'include',
-                            body: formData
-                        });
-                        
-                        showAlert('Return processed successfully!', 'success');
-                        modal.remove();
-                        loadReturnableItems();
-                        loadDashboard();
-                    } catch (error) {
-                        showAlert('Error processing return: ' + error.message, 'error');
-                    }
-                });
-            }
+            // ============================
+            // INITIALIZE APPLICATION
+            // ============================
+
+            document.addEventListener('DOMContentLoaded', function() {
+                console.log('🚀 DigiAssets Complete Inventory Management System loaded');
+                console.log('📊 Database validation enabled');
+                console.log('🔍 Real-time monitoring active');
+                console.log('🎯 All functionalities implemented');
+            });
+"""
 
+# Admin and order fulfillment screens, imported as ES modules the first time
+# they open; they share the main script's globals
+ADMIN_JS = """
             // ============================
             // ADMIN FUNCTIONS
             // ============================
 
+            // Users, departments and divisions for the admin tab come from one
+            // /admin/bootstrap request, reused across admin sub-tabs until stale
+            const ADMIN_DATA_TTL = 30 * 1000;
+            let _adminData = null;
+
+            function getAdminData() {
+                if (!_adminData || Date.now() - _adminData.ts > ADMIN_DATA_TTL) {
+                    const promise = apiCall('/admin/bootstrap');
+                    _adminData = { ts: Date.now(), promise };
+                    promise.catch(() => {
+                        if (_adminData?.promise === promise) _adminData = null;
+                    });
+                }
+                return _adminData.promise;
+            }
+
+            function invalidateAdminData() {
+                _adminData = null;
+            }
+
+            // Bulk entry: one comma-separated line per record, posted to the
+            // matching /batch route so the whole list is created in one request
+            // and one transaction. Descriptions come last and may contain commas.
+            function findIdByName(records, name, label) {
+                const record = records.find(r => r.name.toLowerCase() === name.toLowerCase());
+                if (!record) throw new Error(`Unknown ${label} "${name}"`);
+                return record.id;
+            }
+
+            const BULK_ENTRY = {
+                users: {
+                    endpoint: '/admin/users/batch',
+                    toPayload: ([employee_id, name, email, password, department = '', role = ''], { departments }) => ({
+                        employee_id, name, email, password,
+                        department_id: findIdByName(departments, department, 'department'),
+                        is_admin: role.toLowerCase() === 'admin'
+                    }),
+                    done: () => { closeAddUserModal(); loadUsers(); }
+                },
+                departments: {
+                    endpoint: '/admin/departments/batch',
+                    toPayload: ([name, division = '', ...description], { divisions }) => ({
+                        name,
+                        division_id: findIdByName(divisions, division, 'division'),
+                        description: description.join(',').trim()
+                    }),
+                    done: () => { closeAddDepartmentModal(); loadDepartments(); }
+                },
+                divisions: {
+                    endpoint: '/admin/divisions/batch',
+                    toPayload: ([name, ...description]) => ({ name, description: description.join(',').trim() }),
+                    done: () => { closeAddDivisionModal(); loadDivisions(); }
+                }
+            };
+
+            async function onBulkSubmit(e) {
+                e.preventDefault();
+                const form = e.currentTarget;
+                const entry = BULK_ENTRY[form.dataset.bulk];
+                const lines = form.elements[0].value.split('\\n').map(line => line.trim()).filter(Boolean);
+                if (lines.length === 0) return;
+                
+                try {
+                    const adminData = await getAdminData();
+                    const items = lines.map((line, index) => {
+                        try {
+                            return entry.toPayload(line.split(',').map(col => col.trim()), adminData);
+                        } catch (error) {
+                            throw new Error(`Line ${index + 1}: ${error.message}`);
+                        }
+                    });
+                    const result = await postJson(entry.endpoint, { items });
+                    
+                    showAlert(result.message, 'success');
+                    form.reset();
+                    invalidateAdminData();
+                    entry.done();
+                } catch (error) {
+                    showAlert('Error adding records: ' + error.message, 'error');
+                }
+            }
+
+            document.querySelectorAll('form[data-bulk]').forEach(form => form.addEventListener('submit', onBulkSubmit));
+
+            // Only the latest admin sub-tab load renders. The bootstrap request
+            // is shared, so a superseded load just drops its result instead of
+            // aborting the fetch under the other sub-tabs.
+            let _adminAbort = null;
+
+            function beginAdminLoad() {
+                _adminAbort?.abort();
+                _adminAbort = new AbortController();
+                return _adminAbort.signal;
+            }
+
             async function loadUsers() {
                 if (!currentUser?.is_admin) return;
                 
+                const signal = beginAdminLoad();
                 try {
-                    const users = await apiCall('/admin/users');
-                    const departments = await apiCall('/departments');
+                    const { users, departments } = await getAdminData();
+                    if (signal.aborted) return;
                     
                     // Load departments for user form
                     const deptSelect = document.getElementById('user-department');
                     if (deptSelect) {
-                        deptSelect.innerHTML = '<option value="">Select Department</option>';
-                        departments.forEach(dept => {
-                            deptSelect.innerHTML += `<option value="${dept.id}">${dept.name}</option>`;
-                        });
+                        deptSelect.innerHTML = '<option value="">Select Department</option>' +
+                            departments.map(dept => `<option value="${dept.id}">${escapeHtml(dept.name)}</option>`).join('');
                     }
                     
                     displayUsers(users);
@@ -4626,43 +5849,56 @@ async function processPartialFulfillment(orderId) {
                 }
             }
 
-            function displayUsers(users) {
-                const container = document.getElementById('users-list');
-                
-                let html = `
-                    <table>
-                        <thead>
-                            <tr>
-                                <th>Employee ID</th>
-                                <th>Name</th>
-                                <th>Email</th>
-                                <th>Department</th>
-                                <th>Role</th>
-                                <th>Status</th>
-                                <th>Actions</th>
-                            </tr>
-                        </thead>
-                        <tbody>
+            // Admin tables are built once; later renders only re-parse the body rows
+            function renderTableRows(container, headers, rows) {
+                let tbody = container.querySelector(':scope > table > tbody');
+                if (!tbody) {
+                    container.innerHTML = `<table><thead><tr>${headers.map(h => `<th>${h}</th>`).join('')}</tr></thead><tbody></tbody></table>`;
+                    tbody = container.querySelector('tbody');
+                }
+                tbody.innerHTML = rows.join('');
+            }
+
+            // Users and departments are windowed like the transactions table;
+            // rows that carry a button render at this fixed height
+            const ADMIN_ROW_HEIGHT = 76;
+            let usersTable = null;
+            let departmentsTable = null;
+
+            function createUserRow() {
+                const tr = document.createElement('tr');
+                tr.innerHTML = `
+                    <td></td><td></td><td></td><td></td><td></td><td><span></span></td>
+                    <td><button class="btn btn-danger" data-action="delete">🗑️</button></td>
                 `;
+                return tr;
+            }
+
+            function fillUserRow(tr, user) {
+                const cells = tr.cells;
+                cells[0].textContent = user.employee_id;
+                cells[1].textContent = user.name;
+                cells[2].textContent = user.email;
+                cells[3].textContent = user.department?.name || 'N/A';
+                cells[4].textContent = user.is_admin ? 'Admin' : 'User';
                 
-                users.forEach(user => {
-                    html += `
-                        <tr>
-                            <td>${user.employee_id}</td>
-                            <td>${user.name}</td>
-                            <td>${user.email}</td>
-                            <td>${user.department?.name || 'N/A'}</td>
-                            <td>${user.is_admin ? 'Admin' : 'User'}</td>
-                            <td><span style="color: ${user.is_active ? '#27ae60' : '#e74c3c'};">${user.is_active ? 'Active' : 'Inactive'}</span></td>
-                            <td>
-                                ${user.id !== currentUser.id ? `<button class="btn btn-danger" onclick="deleteUser(${user.id})">🗑️</button>` : ''}
-                            </td>
-                        </tr>
-                    `;
-                });
+                const status = cells[5].firstElementChild;
+                status.textContent = user.is_active ? 'Active' : 'Inactive';
+                status.className = user.is_active ? 'user-active' : 'user-inactive';
                 
-                html += '</tbody></table>';
-                container.innerHTML = html;
+                const deleteButton = cells[6].firstElementChild;
+                deleteButton.hidden = user.id === currentUser.id;
+                deleteButton.dataset.id = user.id;
+            }
+
+            function displayUsers(users) {
+                usersTable ??= createVirtualTable(EL.usersList, {
+                    headers: ['Employee ID', 'Name', 'Email', 'Department', 'Role', 'Status', 'Actions'],
+                    rowHeight: ADMIN_ROW_HEIGHT,
+                    createRow: createUserRow,
+                    fillRow: fillUserRow
+                });
+                usersTable.setRows(users, 'No users found.');
             }
 
             function showAddUserModal() {
@@ -4677,23 +5913,22 @@ async function processPartialFulfillment(orderId) {
             document.getElementById('add-user-form').addEventListener('submit', async (e) => {
                 e.preventDefault();
                 
-                const formData = new FormData();
-                formData.append('employee_id', document.getElementById('user-employee-id').value);
-                formData.append('name', document.getElementById('user-name').value);
-                formData.append('email', document.getElementById('user-email').value);
-                formData.append('password', document.getElementById('user-password').value);
-                formData.append('department_id', document.getElementById('user-department').value);
-                formData.append('is_admin', document.getElementById('user-is-admin').checked);
+                const fields = e.currentTarget.elements;
+                const payload = {
+                    employee_id: fields['user-employee-id'].value,
+                    name: fields['user-name'].value,
+                    email: fields['user-email'].value,
+                    password: fields['user-password'].value,
+                    department_id: Number(fields['user-department'].value),
+                    is_admin: fields['user-is-admin'].checked
+                };
 
                 try {
-                    await fetch('/admin/users', {
-                        method: 'POST',
-                        credentials: 'include',
-                        body: formData
-                    });
+                    await postJson('/admin/users', payload);
                     
                     showAlert('User created successfully!', 'success');
                     closeAddUserModal();
+                    invalidateAdminData();
                     loadUsers();
                 } catch (error) {
                     showAlert('Error creating user: ' + error.message, 'error');
@@ -4703,17 +5938,16 @@ async function processPartialFulfillment(orderId) {
             async function loadDepartments() {
                 if (!currentUser?.is_admin) return;
                 
+                const signal = beginAdminLoad();
                 try {
-                    const departments = await apiCall('/admin/departments-with-users');
-                    const divisions = await apiCall('/divisions');
+                    const { departments, divisions } = await getAdminData();
+                    if (signal.aborted) return;
                     
                     // Load divisions for department form
                     const divSelect = document.getElementById('dept-division');
                     if (divSelect) {
-                        divSelect.innerHTML = '<option value="">Select Division</option>';
-                        divisions.forEach(div => {
-                            divSelect.innerHTML += `<option value="${div.id}">${div.name}</option>`;
-                        });
+                        divSelect.innerHTML = '<option value="">Select Division</option>' +
+                            divisions.map(div => `<option value="${div.id}">${escapeHtml(div.name)}</option>`).join('');
                     }
                     
                     displayDepartments(departments);
@@ -4723,39 +5957,32 @@ async function processPartialFulfillment(orderId) {
                 }
             }
 
-            function displayDepartments(departments) {
-                const container = document.getElementById('departments-list');
-                
-                let html = `
-                    <table>
-                        <thead>
-                            <tr>
-                                <th>Name</th>
-                                <th>Description</th>
-                                <th>Division</th>
-                                <th>Users</th>
-                                <th>Actions</th>
-                            </tr>
-                        </thead>
-                        <tbody>
+            function createDepartmentRow() {
+                const tr = document.createElement('tr');
+                tr.innerHTML = `
+                    <td></td><td></td><td></td><td></td>
+                    <td><button class="btn btn-danger" data-action="delete">🗑️</button></td>
                 `;
-                
-                departments.forEach(dept => {
-                    html += `
-                        <tr>
-                            <td>${dept.name}</td>
-                            <td>${dept.description || 'N/A'}</td>
-                            <td>${dept.division?.name || 'N/A'}</td>
-                            <td>${dept.user_count || 0}</td>
-                            <td>
-                                <button class="btn btn-danger" onclick="deleteDepartment(${dept.id})">🗑️</button>
-                            </td>
-                        </tr>
-                    `;
+                return tr;
+            }
+
+            function fillDepartmentRow(tr, dept) {
+                const cells = tr.cells;
+                cells[0].textContent = dept.name;
+                cells[1].textContent = dept.description || 'N/A';
+                cells[2].textContent = dept.division?.name || 'N/A';
+                cells[3].textContent = dept.user_count || 0;
+                cells[4].firstElementChild.dataset.id = dept.id;
+            }
+
+            function displayDepartments(departments) {
+                departmentsTable ??= createVirtualTable(EL.departmentsList, {
+                    headers: ['Name', 'Description', 'Division', 'Users', 'Actions'],
+                    rowHeight: ADMIN_ROW_HEIGHT,
+                    createRow: createDepartmentRow,
+                    fillRow: fillDepartmentRow
                 });
-                
-                html += '</tbody></table>';
-                container.innerHTML = html;
+                departmentsTable.setRows(departments, 'No departments found.');
             }
 
             function showAddDepartmentModal() {
@@ -4770,20 +5997,19 @@ async function processPartialFulfillment(orderId) {
             document.getElementById('add-department-form').addEventListener('submit', async (e) => {
                 e.preventDefault();
                 
-                const formData = new FormData();
-                formData.append('name', document.getElementById('dept-name').value);
-                formData.append('description', document.getElementById('dept-description').value);
-                formData.append('division_id', document.getElementById('dept-division').value);
+                const fields = e.currentTarget.elements;
+                const payload = {
+                    name: fields['dept-name'].value,
+                    description: fields['dept-description'].value,
+                    division_id: Number(fields['dept-division'].value)
+                };
 
                 try {
-                    await fetch('/admin/departments', {
-                        method: 'POST',
-                        credentials: 'include',
-                        body: formData
-                    });
+                    await postJson('/admin/departments', payload);
                     
                     showAlert('Department created successfully!', 'success');
                     closeAddDepartmentModal();
+                    invalidateAdminData();
                     loadDepartments();
                 } catch (error) {
                     showAlert('Error creating department: ' + error.message, 'error');
@@ -4793,8 +6019,10 @@ async function processPartialFulfillment(orderId) {
             async function loadDivisions() {
                 if (!currentUser?.is_admin) return;
                 
+                const signal = beginAdminLoad();
                 try {
-                    const divisions = await apiCall('/admin/divisions-with-departments');
+                    const { divisions } = await getAdminData();
+                    if (signal.aborted) return;
                     displayDivisions(divisions);
                 } catch (error) {
                     console.error('Error loading divisions:', error);
@@ -4802,39 +6030,24 @@ async function processPartialFulfillment(orderId) {
                 }
             }
 
-            function displayDivisions(divisions) {
-                const container = document.getElementById('divisions-list');
-                
-                let html = `
-                    <table>
-                        <thead>
-                            <tr>
-                                <th>Name</th>
-                                <th>Description</th>
-                                <th>Type</th>
-                                <th>Departments</th>
-                                <th>Actions</th>
-                            </tr>
-                        </thead>
-                        <tbody>
+            function renderDivisionRow(div) {
+                return `
+                    <tr>
+                        <td>${escapeHtml(div.name)}</td>
+                        <td>${escapeHtml(div.description) || 'N/A'}</td>
+                        <td>${div.is_default ? 'Default' : 'Custom'}</td>
+                        <td>${div.department_count || 0}</td>
+                        <td>
+                            ${!div.is_default ? `<button class="btn btn-danger" data-action="delete" data-id="${div.id}">🗑️</button>` : '<span style="color: #666;">Protected</span>'}
+                        </td>
+                    </tr>
                 `;
-                
-                divisions.forEach(div => {
-                    html += `
-                        <tr>
-                            <td>${div.name}</td>
-                            <td>${div.description || 'N/A'}</td>
-                            <td>${div.is_default ? 'Default' : 'Custom'}</td>
-                            <td>${div.department_count || 0}</td>
-                            <td>
-                                ${!div.is_default ? `<button class="btn btn-danger" onclick="deleteDivision(${div.id})">🗑️</button>` : '<span style="color: #666;">Protected</span>'}
-                            </td>
-                        </tr>
-                    `;
-                });
-                
-                html += '</tbody></table>';
-                container.innerHTML = html;
+            }
+
+            function displayDivisions(divisions) {
+                renderTableRows(EL.divisionsList,
+                    ['Name', 'Description', 'Type', 'Departments', 'Actions'],
+                    divisions.map(renderDivisionRow));
             }
 
             function showAddDivisionModal() {
@@ -4849,76 +6062,184 @@ async function processPartialFulfillment(orderId) {
             document.getElementById('add-division-form').addEventListener('submit', async (e) => {
                 e.preventDefault();
                 
-                const formData = new FormData();
-                formData.append('name', document.getElementById('div-name').value);
-                formData.append('description', document.getElementById('div-description').value);
+                const fields = e.currentTarget.elements;
+                const payload = {
+                    name: fields['div-name'].value,
+                    description: fields['div-description'].value
+                };
 
                 try {
-                    await fetch('/admin/divisions', {
-                        method: 'POST',
-                        credentials: 'include',
-                        body: formData
-                    });
+                    await postJson('/admin/divisions', payload);
                     
                     showAlert('Division created successfully!', 'success');
                     closeAddDivisionModal();
+                    invalidateAdminData();
                     loadDivisions();
                 } catch (error) {
                     showAlert('Error creating division: ' + error.message, 'error');
                 }
             });
 
+            export { loadUsers, loadDepartments, loadDivisions };
 
+            // Reached from inline handlers in the admin tab and modals
+            Object.assign(window, {
+                showAddUserModal, closeAddUserModal,
+                showAddDepartmentModal, closeAddDepartmentModal,
+                showAddDivisionModal, closeAddDivisionModal
+            });
+"""
+
+FULFILLMENT_JS = """
             // ============================
             // ORDER FULFILLMENT FUNCTIONS
             // ============================
 
+            // Last pending-fulfillment list and its ETag, revalidated on every
+            // open. Fulfilling patches the list in place; the server copy then
+            // hashes differently, so the next open gets a fresh 200.
+            let _pendingOrders = null;
+
+            async function getPendingOrders(signal) {
+                const response = await fetch('/orders/pending-fulfillment', {
+                    credentials: 'include',
+                    headers: _pendingOrders ? { 'If-None-Match': _pendingOrders.etag } : {},
+                    signal
+                });
+                if (response.status === 304) {
+                    return _pendingOrders.body;
+                }
+                if (!response.ok) {
+                    const error = await response.text();
+                    throw new Error(error);
+                }
+                
+                const body = await readJson(response);
+                const etag = response.headers.get('ETag');
+                _pendingOrders = etag ? { etag, body } : null;
+                return body;
+            }
+
+            const ORDER_FULFILL_MODAL_TPL = document.getElementById('order-fulfill-modal-tpl').content.firstElementChild;
+            const ITEM_FULFILL_MODAL_TPL = document.getElementById('item-fulfill-modal-tpl').content.firstElementChild;
+
+            // Opening the fulfillment modal again cancels a request still in
+            // flight from the previous click, so only one modal is built
+            let _fulfillmentAbort = null;
+
             async function showOrderFulfillmentModal() {
+                _fulfillmentAbort?.abort();
+                const controller = _fulfillmentAbort = new AbortController();
                 try {
-                    const orders = await apiCall('/orders/pending-fulfillment');
+                    const orders = await getPendingOrders(controller.signal);
                     
                     if (orders.length === 0) {
                         showAlert('No pending orders found for fulfillment', 'info');
                         return;
                     }
                     
-                    const modal = document.createElement('div');
-                    modal.className = 'modal';
-                    modal.innerHTML = `
-                        <div class="modal-content" style="max-width: 1000px;">
-                            <span class="close" onclick="this.closest('.modal').remove()">&times;</span>
-                            <h3>📋 Order Fulfillment</h3>
-                            <div style="margin: 20px 0;">
-                                <label for="fulfillment-order-select">Select Order:</label>
-                                <select id="fulfillment-order-select" style="width: 100%; padding: 10px; margin-top: 5px;" onchange="loadOrderForFulfillment(this.value)">
-                                    <option value="">Select an order...</option>
-                                    ${orders.map(order => `
-                                        <option value="${order.id}">${order.order_number} - ${order.customer_name} ($${order.total_amount})</option>
-                                    `).join('')}
-                                </select>
-                            </div>
-                            <div id="order-fulfillment-details" style="display: none;">
-                                <div id="order-info"></div>
-                                <div id="fulfillment-items"></div>
-                                <div style="margin-top: 20px; text-align: center;">
-                                    <button class="btn btn-success" onclick="bulkFulfillOrder()">✅ Fulfill Entire Order</button>
-                                    <button class="btn" onclick="this.closest('.modal').remove()">Cancel</button>
-                                </div>
-                            </div>
-                        </div>
-                    `;
+                    const modal = ORDER_FULFILL_MODAL_TPL.cloneNode(true);
+                    modal.querySelector('#fulfillment-order-select').append(...orders.map(order =>
+                        new Option(`${order.order_number} - ${order.customer_name} ($${order.total_amount})`, order.id)));
                     
                     document.body.appendChild(modal);
                     
-                    // Store orders data for later use
+                    // Store orders data and the modal for later use
                     window.fulfillmentOrders = orders;
+                    window._orderFulfillmentModal = modal;
+                    
+                    const itemsContainer = modal.querySelector('#fulfillment-items');
+                    window._fulfillItemsTable = createVirtualTable(itemsContainer, {
+                        headers: ['Item', 'Requested', 'Fulfilled', 'Remaining', 'Available Stock', 'Status', 'Actions'],
+                        rowHeight: FULFILL_ROW_HEIGHT,
+                        createRow: createFulfillRow,
+                        fillRow: fillFulfillRow,
+                        viewportHeight: 400
+                    });
+                    delegateActions(itemsContainer, {
+                        fulfill: id => openItemFulfillment(id)
+                    });
                     
                 } catch (error) {
+                    if (error.name === 'AbortError') return;
                     showAlert('Error loading orders for fulfillment: ' + error.message, 'error');
                 }
             }
 
-            function loadOrderForFulfillment(orderId) {
+            // Fulfillment item rows are windowed too; the item cell stays on one
+            // line so every row renders at FULFILL_ROW_HEIGHT
+            const FULFILL_ROW_HEIGHT = 76;
+
+            function createFulfillRow() {
+                const tr = document.createElement('tr');
+                tr.innerHTML = `
+                    <td><strong></strong> <span></span> <small class="returnable-tag">📦 Returnable</small></td>
+                    <td></td><td></td>
+                    <td class="remaining-cell"></td><td class="remaining-cell"></td>
+                    <td><span></span></td>
+                    <td>
+                        <button class="btn" data-action="fulfill"></button>
+                        <span class="complete-tag"><strong>✅ Complete</strong></span>
+                    </td>
+                `;
+                return tr;
+            }
+
+            // Derived per-item fields, computed once per order load rather than on
+            // every re-window of the rows
+            function attachFulfillState(items) {
+                for (const item of items) {
+                    const remaining = item.requested_quantity - item.fulfilled_quantity;
+                    const enough = item.available_stock >= remaining;
+                    item._fulfill = {
+                        remaining,
+                        enough,
+                        canFulfill: remaining > 0 && enough,
+                        statusCls: `status-${item.status.toLowerCase()}`
+                    };
+                }
+                return items;
+            }
+
+            function fillFulfillRow(tr, item) {
+                const { remaining: remainingQty, enough, canFulfill, statusCls } = item._fulfill;
+                const uom = item.unit_of_measure;
+                const cells = tr.cells;
+                
+                const [code, name, returnable] = cells[0].children;
+                code.textContent = item.item_code;
+                name.textContent = item.item_name;
+                returnable.hidden = !item.is_returnable;
+                
+                cells[1].textContent = `${item.requested_quantity} ${uom}`;
+                cells[2].textContent = `${item.fulfilled_quantity} ${uom}`;
+                cells[3].textContent = `${remainingQty} ${uom}`;
+                cells[3].classList.toggle('ok', remainingQty <= 0);
+                cells[4].textContent = `${item.available_stock} ${uom}`;
+                cells[4].classList.toggle('ok', enough);
+                
+                const status = cells[5].firstElementChild;
+                status.textContent = item.status;
+                status.className = statusCls;
+                
+                const [button, complete] = cells[6].children;
+                button.hidden = remainingQty <= 0;
+                complete.hidden = remainingQty > 0;
+                button.disabled = !canFulfill;
+                button.className = `btn ${canFulfill ? 'btn-success' : 'btn-danger'}`;
+                button.textContent = canFulfill ? '✅ Fulfill' : '⚠️ No Stock';
+                button.dataset.id = item.id;
+            }
+
+            function openItemFulfillment(orderItemId) {
+                const order = window.currentFulfillmentOrder;
+                const item = order?.order_items.find(i => i.id === orderItemId);
+                if (!item) return;
+                showItemFulfillmentModal(order.id, item.id, item.requested_quantity - item.fulfilled_quantity,
+                    item.item_code, item.item_name, item.is_returnable, item.unit_of_measure, item.available_stock);
+            }
+
+            function loadOrderForFulfillment(orderId, keepScroll = false) {
                 if (!orderId) {
                     document.getElementById('order-fulfillment-details').style.display = 'none';
                     return;
@@ -4933,194 +6254,139 @@ async function processPartialFulfillment(orderId) {
                         <h4>Order Details</h4>
                         <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 15px;">
                             <div>
-                                <p><strong>Order Number:</strong> ${order.order_number}</p>
-                                <p><strong>Customer:</strong> ${order.customer_name}</p>
-                                <p><strong>Contact:</strong> ${order.customer_contact}</p>
+                                <p><strong>Order Number:</strong> ${escapeHtml(order.order_number)}</p>
+                                <p><strong>Customer:</strong> ${escapeHtml(order.customer_name)}</p>
+                                <p><strong>Contact:</strong> ${escapeHtml(order.customer_contact)}</p>
                             </div>
                             <div>
-                                <p><strong>Order Date:</strong> ${new Date(order.order_date).toLocaleDateString()}</p>
-                                <p><strong>Expected Delivery:</strong> ${order.expected_delivery_date ? new Date(order.expected_delivery_date).toLocaleDateString() : 'Not specified'}</p>
+                                <p><strong>Order Date:</strong> ${fmtDate(order.order_date)}</p>
+                                <p><strong>Expected Delivery:</strong> ${order.expected_delivery_date ? fmtDate(order.expected_delivery_date) : 'Not specified'}</p>
                                 <p><strong>Total Amount:</strong> $${order.total_amount}</p>
                             </div>
                         </div>
-                        <p><strong>Notes:</strong> ${order.notes || 'None'}</p>
+                        <p><strong>Notes:</strong> ${escapeHtml(order.notes) || 'None'}</p>
                     </div>
                 `;
                 
-                // Display order items
-                let itemsHTML = `
-                    <h4>Order Items</h4>
-                    <div style="overflow-x: auto;">
-                        <table style="width: 100%; margin-top: 10px;">
-                            <thead>
-                                <tr>
-                                    <th style="text-align: left;">Item</th>
-                                    <th>Requested</th>
-                                    <th>Fulfilled</th>
-                                    <th>Remaining</th>
-                                    <th>Available Stock</th>
-                                    <th>Status</th>
-                                    <th>Actions</th>
-                                </tr>
-                            </thead>
-                            <tbody>
-                `;
-                
-                order.order_items.forEach(item => {
-                    const remainingQty = item.requested_quantity - item.fulfilled_quantity;
-                    const canFulfill = remainingQty > 0 && item.available_stock >= remainingQty;
-                    
-                    itemsHTML += `
-                        <tr>
-                            <td>
-                                <strong>${item.item_code}</strong><br>
-                                ${item.item_name}
-                                ${item.is_returnable ? '<br><small style="color: #f39c12;">📦 Returnable</small>' : ''}
-                            </td>
-                            <td>${item.requested_quantity} ${item.unit_of_measure}</td>
-                            <td>${item.fulfilled_quantity} ${item.unit_of_measure}</td>
-                            <td style="font-weight: bold; color: ${remainingQty > 0 ? '#e74c3c' : '#27ae60'};">${remainingQty} ${item.unit_of_measure}</td>
-                            <td style="color: ${item.available_stock >= remainingQty ? '#27ae60' : '#e74c3c'}; font-weight: bold;">
-                                ${item.available_stock} ${item.unit_of_measure}
-                            </td>
-                            <td><span class="status-${item.status.toLowerCase()}">${item.status}</span></td>
-                            <td>
-                                ${remainingQty > 0 ? `
-                                    <button class="btn ${canFulfill ? 'btn-success' : 'btn-danger'}" ${canFulfill ? '' : 'disabled'} 
-                                            onclick="showItemFulfillmentModal(${order.id}, ${item.id}, ${remainingQty}, '${item.item_code}', '${item.item_name}', ${item.is_returnable}, '${item.unit_of_measure}', ${item.available_stock})">
-                                        ${canFulfill ? '✅ Fulfill' : '⚠️ No Stock'}
-                                    </button>
-                                ` : '<span style="color: #27ae60; font-weight: bold;">✅ Complete</span>'}
-                            </td>
-                        </tr>
-                    `;
-                });
-                
-                itemsHTML += '</tbody></table></div>';
+                // Store current order for bulk fulfillment and the row actions
+                window.currentFulfillmentOrder = order;
                 
-                document.getElementById('fulfillment-items').innerHTML = itemsHTML;
+                // Display order items
                 document.getElementById('order-fulfillment-details').style.display = 'block';
-                
-                // Store current order for bulk fulfillment
-                window.currentFulfillmentOrder = order;
+                window._fulfillItemsTable.setRows(attachFulfillState(order.order_items), 'This order has no items.', keepScroll);
             }
 
             function showItemFulfillmentModal(orderId, orderItemId, maxQuantity, itemCode, itemName, isReturnable, unitOfMeasure, availableStock) {
-                const modal = document.createElement('div');
-                modal.className = 'modal';
-                modal.innerHTML = `
-                    <div class="modal-content">
-                        <span class="close" onclick="this.closest('.modal').remove()">&times;</span>
-                        <h3>📦 Fulfill Item: ${itemCode}</h3>
-                        <div style="background: #f8f9fa; padding: 15px; border-radius: 8px; margin: 15px 0;">
-                            <p><strong>Item:</strong> ${itemName}</p>
-                            <p><strong>Remaining to Fulfill:</strong> ${maxQuantity} ${unitOfMeasure}</p>
-                            <p><strong>Available Stock:</strong> ${availableStock} ${unitOfMeasure}</p>
-                            ${isReturnable ? '<p><strong>Type:</strong> <span style="color: #f39c12;">📦 Returnable Item</span></p>' : ''}
-                        </div>
-                        
-                        <form id="item-fulfillment-form">
-                            <div class="form-group">
-                                <label for="fulfill-quantity">Fulfill Quantity (${unitOfMeasure}):</label>
-                                <input type="number" id="fulfill-quantity" step="0.001" 
-                                       min="0.001" max="${maxQuantity}" value="${maxQuantity}" required>
-                                <small>Maximum: ${maxQuantity} ${unitOfMeasure}</small>
-                            </div>
-                            
-                            ${isReturnable ? `
-                                <div class="form-group">
-                                    <label for="extra-quantity">Extra Quantity - Returnable (${unitOfMeasure}):</label>
-                                    <input type="number" id="extra-quantity" step="0.001" 
-                                           min="0" max="${availableStock - maxQuantity}" value="0">
-                                    <small>Additional quantity that customer can return later (Max: ${availableStock - maxQuantity})</small>
-                                </div>
-                                
-                                <div class="form-group">
-                                    <label for="expected-return-date">Expected Return Date:</label>
-                                    <input type="date" id="expected-return-date" min="${new Date().toISOString().split('T')[0]}">
-                                </div>
-                            ` : ''}
-                            
-                            <div class="form-group">
-                                <label for="fulfillment-remarks">Remarks:</label>
-                                <textarea id="fulfillment-remarks" placeholder="Optional remarks for this fulfillment"></textarea>
-                            </div>
-                            
-                            <div style="text-align: center;">
-                                <button type="submit" class="btn btn-success">✅ Fulfill Item</button>
-                                <button type="button" class="btn" onclick="this.closest('.modal').remove()">Cancel</button>
-                            </div>
-                        </form>
-                    </div>
-                `;
-                
-                document.body.appendChild(modal);
+                const modal = ITEM_FULFILL_MODAL_TPL.cloneNode(true);
+                const extraMax = availableStock - maxQuantity;
+                fillSlots(modal, {
+                    code: itemCode,
+                    name: itemName,
+                    available: `${availableStock} ${unitOfMeasure}`
+                });
+                // Slots that appear more than once
+                for (const el of modal.querySelectorAll('.remaining')) el.textContent = `${maxQuantity} ${unitOfMeasure}`;
+                for (const el of modal.querySelectorAll('.uom')) el.textContent = unitOfMeasure;
                 
-                // Add real-time calculation
-                const fulfillQty = document.getElementById('fulfill-quantity');
-                const extraQty = document.getElementById('extra-quantity');
+                const form = modal.querySelector('#item-fulfillment-form');
+                Object.assign(form.dataset, { orderId, orderItemId, availableStock });
+                const fulfillQty = form.elements['fulfill-quantity'];
+                fulfillQty.max = maxQuantity;
+                fulfillQty.value = maxQuantity;
                 
-                function updateTotalQty() {
-                    const fulfill = parseFloat(fulfillQty.value) || 0;
-                    const extra = parseFloat(extraQty?.value) || 0;
-                    const total = fulfill + extra;
-                    
-                    if (total > availableStock) {
-                        if (extraQty) {
-                            extraQty.value = Math.max(0, availableStock - fulfill);
-                        }
-                    }
+                if (isReturnable) {
+                    form.elements['extra-quantity'].max = extraMax;
+                    form.elements['expected-return-date'].min = new Date().toISOString().split('T')[0];
+                    fillSlots(modal, { 'extra-max': extraMax });
+                } else {
+                    // Drop the returnable fields so they are not submitted
+                    for (const el of modal.querySelectorAll('.returnable-only')) el.remove();
                 }
                 
-                fulfillQty.addEventListener('input', updateTotalQty);
-                if (extraQty) {
-                    extraQty.addEventListener('input', updateTotalQty);
+                document.body.appendChild(modal);
+            }
+
+            // Read both fields first, then write at most once
+            function updateFulfillTotal(form) {
+                const fulfillQty = form.elements['fulfill-quantity'];
+                const extraQty = form.elements['extra-quantity'];
+                const availableStock = Number(form.dataset.availableStock);
+                const fulfill = parseFloat(fulfillQty.value) || 0;
+                const extra = parseFloat(extraQty?.value) || 0;
+                
+                if (extraQty && fulfill + extra > availableStock) {
+                    extraQty.value = Math.max(0, availableStock - fulfill);
                 }
+            }
+
+            // Coalesce bursts of input events into one update per frame
+            let fulfillTotalFrame = 0;
+            function scheduleFulfillTotal(form) {
+                if (fulfillTotalFrame) return;
+                fulfillTotalFrame = requestAnimationFrame(() => {
+                    fulfillTotalFrame = 0;
+                    updateFulfillTotal(form);
+                });
+            }
+
+            async function onItemFulfillSubmit(e) {
+                e.preventDefault();
+                const form = e.target;
+                const fields = form.elements;
+                const orderId = Number(form.dataset.orderId);
                 
-                document.getElementById('item-fulfillment-form').addEventListener('submit', async (e) => {
-                    e.preventDefault();
-                    
-                    const formData = new FormData();
-                    formData.append('order_item_id', orderItemId);
-                    formData.append('fulfill_quantity', document.getElementById('fulfill-quantity').value);
-                    formData.append('extra_quantity', document.getElementById('extra-quantity')?.value || '0');
-                    formData.append('expected_return_date', document.getElementById('expected-return-date')?.value || '');
-                    formData.append('remarks', document.getElementById('fulfillment-remarks').value);
+                const payload = {
+                    order_item_id: Number(form.dataset.orderItemId),
+                    fulfill_quantity: Number(fields['fulfill-quantity'].value),
+                    extra_quantity: Number(fields['extra-quantity']?.value) || 0,
+                    expected_return_date: fields['expected-return-date']?.value || '',
+                    remarks: fields['fulfillment-remarks'].value
+                };
+                
+                try {
+                    const result = await postJson(`/orders/${orderId}/fulfill-item`, payload);
+                    showAlert(result.message, 'success');
+                    form.closest('.modal').remove();
                     
-                    try {
-                        const response = await fetch(`/orders/${orderId}/fulfill-item`, {
-                            method: 'POST',
-                            credentials: 'include',
-                            body: formData
-                        });
-                        
-                        if (response.ok) {
-                            const result = await response.json();
-                            showAlert(result.message, 'success');
-                            modal.remove();
-                            
-                            // Refresh the fulfillment modal
-                            const orderSelect = document.getElementById('fulfillment-order-select');
-                            if (orderSelect) {
-                                // Reload orders data
-                                const orders = await apiCall('/orders/pending-fulfillment');
-                                window.fulfillmentOrders = orders;
-                                loadOrderForFulfillment(orderSelect.value);
+                    // Refresh the fulfillment modal from the updated order in the
+                    // response; it leaves the pending list once no longer PENDING
+                    const orderSelect = document.getElementById('fulfillment-order-select');
+                    if (orderSelect && window.fulfillmentOrders) {
+                        const updated = result.updated_order;
+                        const index = window.fulfillmentOrders.findIndex(o => o.id === updated.id);
+                        if (index !== -1) {
+                            if (updated.order_status === 'PENDING') {
+                                window.fulfillmentOrders[index] = updated;
+                            } else {
+                                window.fulfillmentOrders.splice(index, 1);
                             }
-                            
-                            // Refresh inventory and dashboard
-                            loadInventory();
-                            loadDashboard();
-                        } else {
-                            const errorText = await response.text();
-                            throw new Error(errorText);
                         }
-                    } catch (error) {
-                        showAlert('Error fulfilling item: ' + error.message, 'error');
+                        loadOrderForFulfillment(orderSelect.value, true);
                     }
-                });
+                    
+                    // Patch inventory and dashboard from the same response
+                    applyStockUpdates(result.stock_updates);
+                    displayInventory();
+                    displayDashboardStats(result.dashboard);
+                    displayLowStockItems(result.low_stock);
+                } catch (error) {
+                    showAlert('Error fulfilling item: ' + error.message, 'error');
+                }
             }
 
+            // Item fulfillment forms are served by listeners bound once on the
+            // body; each form carries its order ids and stock as data-* fields
+            document.body.addEventListener('submit', e => {
+                if (e.target.matches('form[data-role="item-fulfill"]')) onItemFulfillSubmit(e);
+            });
+            document.body.addEventListener('input', e => {
+                const form = e.target.form;
+                if (form?.dataset.role === 'item-fulfill' &&
+                    (e.target.id === 'fulfill-quantity' || e.target.id === 'extra-quantity')) {
+                    scheduleFulfillTotal(form);
+                }
+            });
+
             async function bulkFulfillOrder() {
                 if (!window.currentFulfillmentOrder) return;
                 
@@ -5134,15 +6400,11 @@ async function processPartialFulfillment(orderId) {
                     return;
                 }
                 
-                let confirmMessage = `Are you sure you want to fulfill the entire order ${order.order_number}?\\n\\n`;
-                confirmMessage += `This will fulfill the following items:\\n`;
-                
-                remainingItems.forEach(item => {
-                    const remainingQty = item.requested_quantity - item.fulfilled_quantity;
-                    confirmMessage += `- ${item.item_code}: ${remainingQty} ${item.unit_of_measure}\\n`;
-                });
-                
-                const confirmed = confirm(confirmMessage);
+                const confirmed = await showConfirmModal(
+                    `Fulfill entire order ${order.order_number}?`,
+                    'This will fulfill the following items:',
+                    remainingItems.map(item => `${item.item_code}: ${item._fulfill.remaining} ${item.unit_of_measure}`)
+                );
                 if (!confirmed) return;
                 
                 try {
@@ -5156,13 +6418,19 @@ async function processPartialFulfillment(orderId) {
                         showAlert(result.message, 'success');
                         
                         // Close the fulfillment modal
-                        const modal = document.querySelector('.modal');
-                        if (modal) modal.remove();
+                        window._orderFulfillmentModal?.remove();
+                        window._orderFulfillmentModal = null;
                         
-                        // Refresh data
-                        loadOrders();
-                        loadInventory();
-                        loadDashboard();
+                        // Patch local state from the response instead of refetching
+                        const fulfilled = allOrders.find(o => o.id === order.id);
+                        if (fulfilled) {
+                            fulfilled.order_status = result.order_status;
+                            displayOrders();
+                        }
+                        applyStockUpdates(result.stock_updates);
+                        displayInventory();
+                        displayDashboardStats(result.dashboard);
+                        displayLowStockItems(result.low_stock);
                     } else {
                         const errorText = await response.text();
                         throw new Error(errorText);
@@ -5172,22 +6440,40 @@ async function processPartialFulfillment(orderId) {
                 }
             }
 
+            export { showOrderFulfillmentModal };
 
-            // ============================
-            // INITIALIZE APPLICATION
-            // ============================
+            // Reached from inline handlers in the cloned fulfillment modal
+            Object.assign(window, { loadOrderForFulfillment, bulkFulfillOrder });
+"""
 
-            document.addEventListener('DOMContentLoaded', function() {
-                console.log('🚀 DigiAssets Complete Inventory Management System loaded');
-                console.log('📊 Database validation enabled');
-                console.log('🔍 Real-time monitoring active');
-                console.log('🎯 All functionalities implemented');
-            });
-        </script>
-    </body>
-    </html>
-    """
-    return HTMLResponse(content=html_content)
+def script_digest(script: str) -> str:
+    """Short content hash that versions a script's URL"""
+    return hashlib.sha256(script.encode()).hexdigest()[:12]
+
+# name -> (digest, body). Modules are hashed first so the main script can
+# embed their URLs before its own hash is taken.
+FRONTEND_SCRIPTS = {
+    "admin": (script_digest(ADMIN_JS), ADMIN_JS),
+    "fulfillment": (script_digest(FULFILLMENT_JS), FULFILLMENT_JS)
+}
+
+def script_url(name: str) -> str:
+    return f"/assets/{name}.{FRONTEND_SCRIPTS[name][0]}.js"
+
+APP_JS = APP_JS.replace("{admin_js_url}", script_url("admin")).replace(
+    "{fulfillment_js_url}", script_url("fulfillment"))
+FRONTEND_SCRIPTS["app"] = (script_digest(APP_JS), APP_JS)
+
+@app.get("/assets/{name}.{digest}.js")
+async def get_frontend_script(name: str, digest: str):
+    # Only the current build is served, so an immutable URL never changes content
+    if name not in FRONTEND_SCRIPTS or digest != FRONTEND_SCRIPTS[name][0]:
+        raise HTTPException(status_code=404, detail="Script not found")
+    return Response(
+        content=FRONTEND_SCRIPTS[name][1],
+        media_type="application/javascript",
+        headers={"Cache-Control": "public, max-age=31536000, immutable"}
+    )
 
 if __name__ == "__main__":
     import uvicorn